@@ -0,0 +1,65 @@
+"""Compare the search document ID hashing against the original byte-by-byte FNV-1 loop.
+
+Hashes generated IRIs in a few namespaces, like a reindex does, and checks that the IDs are the
+same. Then hashes a batch of them again, which is served from the cache of document IDs. For
+example:
+
+    python scripts/benchmark_hash.py --count 100000
+"""
+
+import argparse
+import base64
+import struct
+import time
+
+from py_semantic_taxonomy.domain.hash_utils import hash_fnv64, hash_fnv64_many
+
+
+def original_hash_fnv64(dn: str, salt: str = "abc123") -> str:
+    hash_ = 0xCBF29CE484222325
+    for b in salt.encode("ascii") + dn.encode("ascii"):
+        hash_ *= 0x100000001B3
+        hash_ &= 0xFFFFFFFFFFFFFFFF
+        hash_ ^= b
+    return base64.urlsafe_b64encode(struct.pack("<Q", hash_))[:-1].decode("ascii")
+
+
+def timed(name: str, func, iris: list[str], baseline: float | None = None) -> tuple[float, list]:
+    start = time.perf_counter()
+    result = func(iris)
+    elapsed = time.perf_counter() - start
+    speedup = f"  {baseline / elapsed:5.1f}x" if baseline else ""
+    print(f"{name:<20} {elapsed * 1000:9.1f} ms  {elapsed / len(iris) * 1e6:6.2f} µs/IRI{speedup}")
+    return elapsed, result
+
+
+def main(count: int) -> None:
+    namespaces = [
+        "http://data.europa.eu/xsp/cn2024/",
+        "https://vocab.sentier.dev/products/",
+        "http://example.com/taxonomy#",
+    ]
+    iris = [f"{namespaces[i % len(namespaces)]}{i:012d}" for i in range(count)]
+    print(f"{count} IRIs")
+
+    baseline, expected = timed(
+        "original", lambda lst: [original_hash_fnv64(iri) for iri in lst], iris
+    )
+    hash_fnv64.cache_clear()
+    _, hashed = timed("hash_fnv64_many", hash_fnv64_many, iris, baseline)
+    if hashed != expected:
+        raise ValueError("Hashes differ from the original implementation")
+
+    # Like indexing a batch in a second language
+    batch = iris[-1000:]
+    baseline, _ = timed(
+        "original (batch)", lambda lst: [original_hash_fnv64(i) for i in lst], batch
+    )
+    timed("cached (batch)", hash_fnv64_many, batch, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.count)
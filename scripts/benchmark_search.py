@@ -0,0 +1,95 @@
+"""Compare search latency of the Postgres full text search and Typesense backends.
+
+Indexes the concepts in the configured database (`PyST_db_*` environment variables) into a
+temporary collection in both backends (`PyST_typesense_*` for Typesense), and times searches and
+suggestions for words from the concepts' labels. For example:
+
+    python scripts/benchmark_search.py --language en --queries 500
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from py_semantic_taxonomy.adapters.persistence.graph import PostgresKOSGraphDatabase
+from py_semantic_taxonomy.adapters.persistence.postgres_search import PostgresSearchEngine
+from py_semantic_taxonomy.adapters.persistence.search_engine import TypesenseSearchEngine
+from py_semantic_taxonomy.cfg import get_settings
+
+
+async def load_documents(language: str) -> list[dict]:
+    graph = PostgresKOSGraphDatabase()
+    documents = [
+        concept.to_search_dict(language)
+        async for concept in graph.concept_stream_all(
+            concept_scheme_iri=None, top_concepts_only=False
+        )
+    ]
+    await graph.engine.dispose()
+    return [document for document in documents if document["pref_label"]]
+
+
+async def time_searches(engine, collection: str, queries: list[str], prefix: bool) -> list[float]:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        await engine.search(query, collection, semantic=False, prefix=prefix)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(name: str, timings: list[float]) -> None:
+    quantiles = statistics.quantiles(timings, n=100)
+    print(
+        f"{name:<24} mean {statistics.mean(timings):7.2f} ms"
+        f"  p50 {quantiles[49]:7.2f} ms  p95 {quantiles[94]:7.2f} ms"
+    )
+
+
+async def main(language: str, count: int, seed: int) -> None:
+    settings = get_settings()
+    documents = await load_documents(language)
+    if not documents:
+        raise ValueError(f"No concepts with `{language}` labels in the database")
+    words = sorted(
+        {word for doc in documents for word in doc["pref_label"].split() if len(word) > 3}
+    )
+    rng = random.Random(seed)
+    queries = [" ".join(rng.sample(words, k=min(2, len(words)))) for _ in range(count)]
+    prefixes = [rng.choice(words)[:3] for _ in range(count)]
+    print(f"{len(documents)} documents, {count} queries per test")
+
+    engines = {
+        "postgres": PostgresSearchEngine(),
+        "typesense": TypesenseSearchEngine(
+            url=settings.typesense_url,
+            api_key=settings.typesense_api_key,
+            embedding_model=settings.typesense_embedding_model,
+        ),
+    }
+    collection = f"pyst-benchmark-pyst-concepts-{language}"
+    for name, engine in engines.items():
+        await engine.initialize([])
+        await engine.create_collection(collection)
+        try:
+            start = time.perf_counter()
+            for index in range(0, len(documents), 1000):
+                await engine.create_concepts(documents[index : index + 1000], collection)
+            print(f"{name}: indexed in {time.perf_counter() - start:.1f} seconds")
+            # Warm up connections and caches
+            await time_searches(engine, collection, queries[:10], False)
+            report(f"{name} search", await time_searches(engine, collection, queries, False))
+            report(f"{name} suggest", await time_searches(engine, collection, prefixes, True))
+        finally:
+            await engine.delete_collection(collection)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(main(args.language, args.queries, args.seed))
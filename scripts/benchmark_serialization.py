@@ -0,0 +1,83 @@
+"""Compare serializing a concept listing through response models and with `PyST_fast_json`.
+
+Builds generated concepts and times both ways of turning them into the JSON body of
+`GET /concepts/`: validating each concept into `response_dto.Concept` and letting FastAPI
+serialize the list, and writing the JSON-LD directly with `orjson`. For example:
+
+    python scripts/benchmark_serialization.py --count 50000
+"""
+
+import argparse
+import asyncio
+import time
+
+import orjson
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+import py_semantic_taxonomy.adapters.routers.response_dto as response
+from py_semantic_taxonomy.adapters.routers.fast_json import json_response, to_response_dict
+from py_semantic_taxonomy.domain.constants import SKOS
+from py_semantic_taxonomy.domain.entities import Concept
+
+
+def make_concept(index: int) -> Concept:
+    iri = f"http://example.com/concepts/{index:08d}"
+    return Concept.from_json_ld(
+        {
+            "@id": iri,
+            "@type": [f"{SKOS}Concept"],
+            f"{SKOS}prefLabel": [
+                {"@value": f"Concept {index}", "@language": "en"},
+                {"@value": f"Begriff {index}", "@language": "de"},
+            ],
+            f"{SKOS}altLabel": [{"@value": f"C{index}", "@language": "en"}],
+            f"{SKOS}notation": [{"@value": f"{index:08d}"}],
+            f"{SKOS}definition": [{"@value": f"Definition of concept {index}", "@language": "en"}],
+            f"{SKOS}inScheme": [{"@id": "http://example.com/scheme"}],
+            "http://purl.org/ontology/bibo/status": [
+                {"@id": "http://purl.org/ontology/bibo/status/accepted"}
+            ],
+        }
+    )
+
+
+async def models(concepts: list[Concept]) -> bytes:
+    field = create_model_field(
+        name="Response_concept_all_get", type_=list[response.Concept], mode="serialization"
+    )
+    content = await serialize_response(
+        field=field,
+        response_content=[response.Concept(**obj.to_json_ld()) for obj in concepts],
+        is_coroutine=True,
+    )
+    return orjson.dumps(content)
+
+
+async def fast(concepts: list[Concept]) -> bytes:
+    return json_response([to_response_dict(obj, response.Concept) for obj in concepts]).body
+
+
+async def main(count: int, repeat: int) -> None:
+    concepts = [make_concept(index) for index in range(count)]
+    print(f"{count} concepts, best of {repeat}")
+    timings, bodies = {}, {}
+    for name, func in (("response models", models), ("fast_json", fast)):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            bodies[name] = await func(concepts)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+        print(f"{name:<16} {best * 1000:9.1f} ms  {len(bodies[name]) / 1e6:6.1f} MB")
+    if orjson.loads(bodies["response models"]) != orjson.loads(bodies["fast_json"]):
+        raise ValueError("The two serializations differ")
+    print(f"Speedup: {timings['response models'] / timings['fast_json']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.count, args.repeat))
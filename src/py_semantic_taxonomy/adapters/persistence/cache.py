@@ -0,0 +1,336 @@
+import inspect
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from copy import deepcopy
+from functools import wraps
+from typing import Any, AsyncIterator, Callable, Hashable
+
+from py_semantic_taxonomy.domain.constants import SEARCH_PER_PAGE
+from py_semantic_taxonomy.domain.entities import CacheStats, Concept, SearchFilter, SearchResult
+from py_semantic_taxonomy.domain.ports import KOSGraphDatabase, SearchEngine
+
+MISSING = object()
+
+# Reads whose results are cached, keyed by method name and arguments
+CACHED_READS = {
+    "get_object_type",
+    "concept_get",
+    "concept_broader_in_ascending_order",
+    "concept_descendants",
+    "concept_tree",
+    "relationships_subtree",
+    "concept_scheme_get",
+    "concept_scheme_get_all_iris",
+    "relationships_get",
+    "known_concept_schemes_for_concept_hierarchical_relationships",
+    "correspondence_get",
+    "association_get",
+}
+# Writes clear the whole cache; the taxonomy changes rarely, so finer invalidation isn't worth it
+WRITES = {
+    "concept_create",
+    "concept_create_many",
+    "concept_update",
+    "concept_delete",
+    "closure_rebuild",
+    "concept_scheme_create",
+    "concept_scheme_update",
+    "concept_scheme_delete",
+    "relationships_create",
+    "relationships_delete",
+    "relationships_delete_for_concept_scheme",
+    "correspondence_create",
+    "correspondence_update",
+    "correspondence_delete",
+    "association_create",
+    "association_delete",
+    "made_of_add",
+    "made_of_remove",
+}
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire `ttl` seconds after being stored.
+
+    Values are copied in and out so callers can't change cached objects."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        item = self._data.get(key)
+        if item is None or item[0] < time.monotonic():
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return MISSING
+        self._data.move_to_end(key)
+        self.hits += 1
+        return deepcopy(item[1])
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, deepcopy(value))
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class CachedKOSGraphDatabase:
+    """Read-through cache in front of another `KOSGraphDatabase`.
+
+    Reads in `CACHED_READS` are served from an in-process `TTLCache`; any method in `WRITES`
+    clears it. Once a unit of work has written, its reads bypass the cache, as they can see
+    uncommitted data, and the cache is cleared again when that unit of work ends. Other processes
+    don't see this process' invalidations, so `ttl` bounds how stale reads can be across workers."""
+
+    def __init__(self, graph: KOSGraphDatabase, maxsize: int = 10_000, ttl: float = 300):
+        self.graph = graph
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        # Incremented on every invalidation so reads started before a write aren't stored
+        self._generation = 0
+        # Mutable state of the current unit of work, shared with tasks started inside it
+        self._unit_of_work: ContextVar[dict | None] = ContextVar(
+            f"pyst_cache_unit_of_work_{id(self)}", default=None
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self.graph, name)
+        if name in CACHED_READS:
+            attr = self._cached_read(name, attr)
+        elif name in WRITES:
+            attr = self._write(attr)
+        # Store on the instance so `__getattr__` is only called once per method
+        setattr(self, name, attr)
+        return attr
+
+    def invalidate_cache(self) -> None:
+        """Clear the cache, e.g. when another process changed the graph"""
+        self._generation += 1
+        self.cache.clear()
+
+    def _invalidate(self) -> None:
+        self.invalidate_cache()
+        if (state := self._unit_of_work.get()) is not None:
+            state["dirty"] = True
+
+    def _bypass(self) -> bool:
+        """Whether reads must skip the cache because this unit of work has uncommitted writes"""
+        return (state := self._unit_of_work.get()) is not None and state["dirty"]
+
+    def _cached_read(self, name: str, method: Callable) -> Callable:
+        signature = inspect.signature(method)
+
+        @wraps(method)
+        async def read(*args, **kwargs):
+            if self._bypass():
+                return await method(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, *bound.arguments.values())
+            if (value := self.cache.get(key)) is not MISSING:
+                return value
+            generation = self._generation
+            value = await method(*args, **kwargs)
+            if generation == self._generation:
+                self.cache.set(key, value)
+            return value
+
+        return read
+
+    def _write(self, method: Callable) -> Callable:
+        @wraps(method)
+        async def write(*args, **kwargs):
+            try:
+                return await method(*args, **kwargs)
+            finally:
+                self._invalidate()
+
+        return write
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        if self._unit_of_work.get() is not None:
+            async with self.graph.unit_of_work():
+                yield
+            return
+        state = {"dirty": False}
+        token = self._unit_of_work.set(state)
+        try:
+            async with self.graph.unit_of_work():
+                yield
+        finally:
+            self._unit_of_work.reset(token)
+            if state["dirty"]:
+                self._invalidate()
+
+    async def concept_get_many(self, iris: list[str]) -> dict[str, Concept]:
+        """Serve known concepts from the cache (shared with `concept_get`) and fetch the rest"""
+        if self._bypass():
+            return await self.graph.concept_get_many(iris=iris)
+        found, missing = {}, []
+        for iri in set(iris):
+            if (value := self.cache.get(("concept_get", iri))) is MISSING:
+                missing.append(iri)
+            else:
+                found[iri] = value
+        if missing:
+            generation = self._generation
+            fetched = await self.graph.concept_get_many(iris=missing)
+            if generation == self._generation:
+                for iri, concept in fetched.items():
+                    self.cache.set(("concept_get", iri), concept)
+            found.update(fetched)
+        return found
+
+    def cache_stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.cache.hits,
+            misses=self.cache.misses,
+            size=len(self.cache),
+            maxsize=self.cache.maxsize,
+        )
+
+
+class CachedSearchEngine:
+    """Result cache in front of another `SearchEngine`.
+
+    Search results are cached per collection (i.e. language). Writes to a collection make its
+    cached results unreachable by bumping the collection's generation, which is part of the
+    key; changes to the collections themselves clear everything. Like
+    `CachedKOSGraphDatabase`, other processes' writes are only seen after `ttl` seconds."""
+
+    def __init__(self, engine: SearchEngine, maxsize: int = 10_000, ttl: float = 60):
+        self.engine = engine
+        self.cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._generations: dict[str, int] = {}
+
+    def _invalidate(self, collection: str | None = None) -> None:
+        if collection is None:
+            self._generations.clear()
+            self.cache.clear()
+        else:
+            self._generations[collection] = self._generations.get(collection, 0) + 1
+
+    def cache_stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.cache.hits,
+            misses=self.cache.misses,
+            size=len(self.cache),
+            maxsize=self.cache.maxsize,
+        )
+
+    def _key(
+        self,
+        query: str,
+        collection: str,
+        semantic: bool,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> tuple:
+        generation = self._generations.get(collection, 0)
+        return (collection, generation, query, semantic, prefix, filters, page, per_page)
+
+    async def search(
+        self,
+        query: str,
+        collection: str,
+        semantic: bool,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[SearchResult]:
+        key = self._key(query, collection, semantic, prefix, filters, page, per_page)
+        if (value := self.cache.get(key)) is not MISSING:
+            return value
+        value = await self.engine.search(
+            query=query,
+            collection=collection,
+            semantic=semantic,
+            prefix=prefix,
+            filters=filters,
+            page=page,
+            per_page=per_page,
+        )
+        self.cache.set(key, value)
+        return value
+
+    async def search_many(self, queries: list[dict]) -> list[list[SearchResult]]:
+        """Serve cached results (shared with `search`) and fetch the rest in one call"""
+        keys = [self._key(**query) for query in queries]
+        results = [self.cache.get(key) for key in keys]
+        if missing := [index for index, value in enumerate(results) if value is MISSING]:
+            fetched = await self.engine.search_many([queries[index] for index in missing])
+            for index, value in zip(missing, fetched):
+                self.cache.set(keys[index], value)
+                results[index] = value
+        return results
+
+    async def initialize(self, collections: list[str]) -> None:
+        await self.engine.initialize(collections)
+        self._invalidate()
+
+    async def reset(self) -> None:
+        try:
+            await self.engine.reset()
+        finally:
+            self._invalidate()
+
+    async def create_collection(self, name: str) -> None:
+        await self.engine.create_collection(name)
+
+    async def delete_collection(self, name: str) -> None:
+        try:
+            await self.engine.delete_collection(name)
+        finally:
+            self._invalidate()
+
+    async def swap_alias(self, alias: str, collection: str) -> str | None:
+        try:
+            return await self.engine.swap_alias(alias, collection)
+        finally:
+            self._invalidate()
+
+    async def create_concept(self, concept: dict, collection: str) -> None:
+        try:
+            await self.engine.create_concept(concept, collection)
+        finally:
+            self._invalidate(collection)
+
+    async def create_concepts(self, concepts: list[dict], collection: str) -> None:
+        try:
+            await self.engine.create_concepts(concepts, collection)
+        finally:
+            self._invalidate(collection)
+
+    async def update_concept(self, concept: dict, collection: str) -> None:
+        try:
+            await self.engine.update_concept(concept, collection)
+        finally:
+            self._invalidate(collection)
+
+    async def delete_concept(self, id_: str, collection: str) -> None:
+        try:
+            await self.engine.delete_concept(id_, collection)
+        finally:
+            self._invalidate(collection)
+
+    async def delete_concepts(self, ids: list[str], collection: str) -> None:
+        try:
+            await self.engine.delete_concepts(ids, collection)
+        finally:
+            self._invalidate(collection)
@@ -12,13 +12,21 @@ def create_engine(
     echo: bool = False,
 ) -> AsyncEngine:
     s = get_settings()
+    pool_kwargs = {}
     if s.db_backend == "postgres":
         connection_str = (
             f"postgresql+asyncpg://{s.db_user}:{s.db_pass}@{s.db_host}:{s.db_port}/{s.db_name}"
         )
         logger.info("Using Postgres backend at %s:%s", s.db_host, s.db_port)
+        pool_kwargs = {
+            "pool_size": s.db_pool_size,
+            "max_overflow": s.db_max_overflow,
+            "pool_timeout": s.db_pool_timeout,
+            "pool_recycle": s.db_pool_recycle,
+            "pool_pre_ping": s.db_pool_pre_ping,
+        }
     elif s.db_backend == "sqlite":
-        # Only for testing
+        # Only for testing. In-memory SQLite uses a single static connection, so no pool settings
         connection_str = "sqlite+aiosqlite:///:memory:"
         logger.info("Using in-memory SQLite backend")
     else:
@@ -28,11 +36,8 @@ def create_engine(
         json_serializer=lambda obj: orjson.dumps(obj).decode(),
         json_deserializer=lambda obj: orjson.loads(obj),
         echo=echo,
+        **pool_kwargs,
     )
-    # Magic?
-    # pool_pre_ping=True,
-    # pool_size=global_settings.db_pool_size,
-    # max_overflow=global_settings.db_max_overflow,
     return engine
 
 
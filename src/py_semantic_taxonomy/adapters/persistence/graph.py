@@ -1,7 +1,28 @@
 import json
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from itertools import batched
 from pathlib import Path
+from typing import AsyncIterator
 
-from sqlalchemy import Table, delete, func, insert, join, select, update
+import orjson
+from sqlalchemy import (
+    Integer,
+    Row,
+    Select,
+    Table,
+    delete,
+    func,
+    insert,
+    join,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 from sqlalchemy.sql import text
@@ -9,11 +30,15 @@ from sqlalchemy.sql import text
 from py_semantic_taxonomy.adapters.persistence.database import create_engine
 from py_semantic_taxonomy.adapters.persistence.tables import (
     association_table,
+    change_log_table,
+    concept_closure_table,
     concept_scheme_table,
     concept_table,
     correspondence_table,
     relationship_table,
+    search_outbox_table,
 )
+from py_semantic_taxonomy.cfg import get_settings
 from py_semantic_taxonomy.domain.constants import (
     SKOS_HIERARCHICAL_RELATIONSHIP_PREDICATES,
     AssociationKind,
@@ -22,6 +47,9 @@ from py_semantic_taxonomy.domain.constants import (
 from py_semantic_taxonomy.domain.entities import (
     Association,
     AssociationNotFoundError,
+    CacheStats,
+    Change,
+    ChangeEvent,
     Concept,
     ConceptNotFoundError,
     ConceptScheme,
@@ -31,29 +59,294 @@ from py_semantic_taxonomy.domain.entities import (
     DuplicateIRI,
     DuplicateRelationship,
     GraphObject,
+    HierarchyNode,
     MadeOf,
     NotFoundError,
     Relationship,
+    SearchHierarchy,
+    SearchOutboxItem,
+    select_string_for_language,
 )
 
+# Postgres `LISTEN`/`NOTIFY` channel for changes to the graph
+CHANGES_CHANNEL = "pyst_changes"
 SQL_TEMPLATES = Path(__file__).parent / "sql"
+# Rows fetched per round trip when streaming from a server-side cursor
+STREAM_BATCH_SIZE = 1000
+# Values per `IN` clause or multi-row statement; each row can bind three parameters, and drivers
+# limit the total
+IN_CLAUSE_BATCH_SIZE = 5000
+# On Postgres, change log sequence numbers are the transaction ID shifted by this many bits plus
+# a counter within the transaction, so they sort by transaction
+CHANGE_SEQUENCE_BITS = 24
+NEXT_CHANGE_SEQUENCE = f"""
+WITH tx AS (SELECT pg_current_xact_id()::text::bigint << {CHANGE_SEQUENCE_BITS} AS base)
+SELECT coalesce(
+    (
+        SELECT max(sequence) + 1 FROM change_log
+        WHERE sequence >= tx.base AND sequence < tx.base + (1::bigint << {CHANGE_SEQUENCE_BITS})
+    ),
+    tx.base
+) FROM tx
+"""
+# Lowest sequence number a transaction which is still running (or not started) can have
+CHANGE_SEQUENCE_HORIZON = (
+    f"pg_snapshot_xmin(pg_current_snapshot())::text::bigint << {CHANGE_SEQUENCE_BITS}"
+)
+# Guard against cycles in `broader` relationships when walking the hierarchy
+HIERARCHY_MAX_DEPTH = 100
+
+# Order gives precedence if the same IRI is (incorrectly) present in more than one table
+OBJECT_TYPE_TABLES: tuple[tuple[type[GraphObject], Table], ...] = (
+    (Concept, concept_table),
+    (ConceptScheme, concept_scheme_table),
+    (Correspondence, correspondence_table),
+    (Association, association_table),
+)
+# IRIs per object type probe; each one is bound once per table, which keeps the parameters per
+# statement within the `IN_CLAUSE_BATCH_SIZE` limit
+OBJECT_TYPE_BATCH_SIZE = IN_CLAUSE_BATCH_SIZE * 3 // len(OBJECT_TYPE_TABLES)
+
+
+def from_row(cls: type, row: Row):
+    """Build `cls` from a row with columns named like its fields"""
+    return cls(**row._mapping)
 
 
 class PostgresKOSGraphDatabase:
-    def __init__(self, engine: AsyncEngine | None = None):
+    def __init__(self, engine: AsyncEngine | None = None, closure: bool | None = None):
         self.engine = create_engine() if engine is None else engine
+        # Maintain and read from `concept_closure` for hierarchy queries
+        self.closure = get_settings().hierarchy_closure if closure is None else closure
+        # Connection shared by all calls inside `unit_of_work`
+        self._connection: ContextVar[AsyncConnection | None] = ContextVar(
+            f"pyst_connection_{id(self)}", default=None
+        )
 
-    async def get_object_type(self, iri: str) -> GraphObject:
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[None]:
+        """Use one pooled connection and one transaction for all calls inside this context.
+
+        Commits on exit and rolls back if an exception is raised. Nested calls join the outer
+        unit of work."""
+        if self._connection.get() is not None:
+            yield
+            return
         async with self.engine.connect() as conn:
-            if await self._get_count_from_iri(conn, iri, concept_table):
-                return Concept
-            if await self._get_count_from_iri(conn, iri, concept_scheme_table):
-                return ConceptScheme
-            if await self._get_count_from_iri(conn, iri, correspondence_table):
-                return Correspondence
-            if await self._get_count_from_iri(conn, iri, association_table):
-                return Association
-        raise NotFoundError(f"Given IRI `{iri}` is not a known object")
+            token = self._connection.set(conn)
+            try:
+                yield
+                await conn.commit()
+            except BaseException:
+                await conn.rollback()
+                raise
+            finally:
+                self._connection.reset(token)
+
+    def cache_stats(self) -> CacheStats | None:
+        return None
+
+    def invalidate_cache(self) -> None:
+        pass
+
+    async def _notify(
+        self, conn: AsyncConnection, kind: str, iri: str | None, operation: str
+    ) -> None:
+        """Tell other processes about a change with Postgres `NOTIFY`.
+
+        Notifications are sent when the transaction commits and dropped on rollback. `iri` is
+        `None` for changes to many objects at once."""
+        if conn.dialect.name != "postgresql":
+            return
+        payload = ChangeEvent(kind=kind, iri=iri, operation=operation).to_json()
+        await conn.execute(select(func.pg_notify(CHANGES_CHANNEL, orjson.dumps(payload).decode())))
+
+    async def _record_changes(
+        self,
+        conn: AsyncConnection,
+        kind: str,
+        operation: str,
+        iris: list[str],
+        data: list[dict] | None = None,
+    ) -> None:
+        """Append one row per IRI to the change log, and `NOTIFY` other processes.
+
+        Both are part of the caller's transaction. On Postgres, sequence numbers start with the
+        transaction ID, and `_changes_stmt` only returns changes of transactions older than any
+        which is still running. So readers of the change feed can't skip a change which commits
+        late, without writers having to wait for each other. Writes which changed nothing record
+        nothing, as a notification without an IRI would clear every cache."""
+        if not iris:
+            return
+        rows = [
+            {"kind": kind, "iri": iri, "operation": operation, "data": extra}
+            for iri, extra in zip(iris, data or [{}] * len(iris))
+        ]
+        if conn.dialect.name == "postgresql":
+            first = (await conn.execute(text(NEXT_CHANGE_SEQUENCE))).scalar_one()
+            if (first + len(rows) - 1) >> CHANGE_SEQUENCE_BITS != first >> CHANGE_SEQUENCE_BITS:
+                raise ValueError("Too many changes in one transaction for the change log")
+            for offset, row in enumerate(rows):
+                row["sequence"] = first + offset
+        await conn.execute(insert(change_log_table), rows)
+        await self._notify(conn, kind, iris[0] if len(iris) == 1 else None, operation)
+
+    @asynccontextmanager
+    async def _connect(self) -> AsyncIterator[AsyncConnection]:
+        if (conn := self._connection.get()) is not None:
+            yield conn
+        else:
+            async with self.engine.connect() as conn:
+                yield conn
+
+    async def _commit(self, conn: AsyncConnection) -> None:
+        # Inside a unit of work the commit happens when the context exits
+        if self._connection.get() is None:
+            await conn.commit()
+
+    async def _end_read(self, conn: AsyncConnection) -> None:
+        if self._connection.get() is None:
+            await conn.rollback()
+
+    def _keyset(self, stmt: Select, table: Table, limit: int | None, after: str | None) -> Select:
+        """Keyset pagination on the primary key; `after` is the last IRI of the previous page"""
+        if after is not None:
+            stmt = stmt.where(table.c.id_ > after)
+        stmt = stmt.order_by(table.c.id_)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    async def _stream(self, stmt: Select, cls: type) -> AsyncIterator:
+        """Yield objects from a server-side cursor instead of loading all rows into memory"""
+        async with self._connect() as conn:
+            result = await conn.stream(stmt.execution_options(yield_per=STREAM_BATCH_SIZE))
+            async for row in result:
+                yield from_row(cls, row)
+            await self._end_read(conn)
+
+    def _object_type_stmt(self, iris: list[str]):
+        """Single `UNION ALL` probe across all object tables; `kind` indexes `OBJECT_TYPE_TABLES`"""
+        stmt = union_all(
+            *[
+                select(literal(index).label("kind"), table.c.id_).where(table.c.id_.in_(iris))
+                for index, (_, table) in enumerate(OBJECT_TYPE_TABLES)
+            ]
+        )
+        return stmt.order_by(stmt.selected_columns.kind)
+
+    async def get_object_type(self, iri: str) -> GraphObject:
+        async with self._connect() as conn:
+            result = (await conn.execute(self._object_type_stmt([iri]).limit(1))).first()
+            await self._end_read(conn)
+        if not result:
+            raise NotFoundError(f"Given IRI `{iri}` is not a known object")
+        return OBJECT_TYPE_TABLES[result.kind][0]
+
+    async def get_object_types(self, iris: list[str]) -> dict[str, GraphObject]:
+        """Resolve object types for many IRIs in one query. Unknown IRIs are not returned."""
+        if not iris:
+            return {}
+        found = {}
+        async with self._connect() as conn:
+            # Each IRI is bound once per table, so batch to stay under the driver limit
+            for batch in batched(set(iris), OBJECT_TYPE_BATCH_SIZE):
+                results = await conn.execute(self._object_type_stmt(list(batch)))
+                for kind, iri in results:
+                    found.setdefault(iri, OBJECT_TYPE_TABLES[kind][0])
+            await self._end_read(conn)
+        return found
+
+    # Hierarchy
+
+    def _broader_paths(
+        self, iris: list[str] | None, ascending: bool = True, max_depth: int | None = None
+    ) -> Select:
+        """Select `(descendant, ancestor, depth)` for transitive `broader` paths.
+
+        Walks up from the concepts in `iris` (or down if not `ascending`), or covers the whole
+        graph if `iris` is `None`. Like `sql/broader_concept_hierarchy.sql`, only relationships
+        between existing concepts are followed. Recursion stops after `max_depth` levels."""
+        rel = relationship_table
+        source, target = concept_table.alias("source"), concept_table.alias("target")
+        edges = (
+            select(rel.c.source, rel.c.target)
+            .join(source, source.c.id_ == rel.c.source)
+            .join(target, target.c.id_ == rel.c.target)
+            .where(rel.c.predicate == RelationshipVerbs.broader)
+            .cte("edges")
+        )
+        seed = select(
+            edges.c.source.label("descendant"),
+            edges.c.target.label("ancestor"),
+            literal_column("1", Integer).label("depth"),
+        )
+        if iris is not None:
+            seed = seed.where((edges.c.source if ascending else edges.c.target).in_(iris))
+        paths = seed.cte("paths", recursive=True)
+        if ascending:
+            step = select(paths.c.descendant, edges.c.target, paths.c.depth + 1).where(
+                edges.c.source == paths.c.ancestor
+            )
+        else:
+            step = select(edges.c.source, paths.c.ancestor, paths.c.depth + 1).where(
+                edges.c.target == paths.c.descendant
+            )
+        limit = HIERARCHY_MAX_DEPTH if max_depth is None else min(max_depth, HIERARCHY_MAX_DEPTH)
+        paths = paths.union(step.where(paths.c.depth < limit))
+        return select(
+            paths.c.descendant, paths.c.ancestor, func.min(paths.c.depth).label("depth")
+        ).group_by(paths.c.descendant, paths.c.ancestor)
+
+    def _hierarchy_paths(self, iri: str, ascending: bool, max_depth: int | None = None) -> Select:
+        """Ancestors (or descendants) of `iri` with depth, from the closure table if enabled"""
+        if self.closure:
+            closure = concept_closure_table
+            column = closure.c.descendant if ascending else closure.c.ancestor
+            stmt = select(closure).where(column == iri)
+            if max_depth is not None:
+                stmt = stmt.where(closure.c.depth <= max_depth)
+            return stmt
+        return self._broader_paths([iri], ascending=ascending, max_depth=max_depth)
+
+    async def _closure_refresh(self, conn: AsyncConnection, iris: set[str]) -> None:
+        """Recompute the closure rows of `iris`, their direct children, and all their descendants.
+
+        Called after any change to concepts or `broader` relationships involving `iris`."""
+        if not self.closure or not iris:
+            return
+        closure, rel = concept_closure_table, relationship_table
+        affected = set(iris)
+        for batch in batched(iris, IN_CLAUSE_BATCH_SIZE):
+            stmt = select(rel.c.source).where(
+                rel.c.target.in_(batch), rel.c.predicate == RelationshipVerbs.broader
+            )
+            affected.update((await conn.execute(stmt)).scalars())
+        for batch in batched(list(affected), IN_CLAUSE_BATCH_SIZE):
+            stmt = select(closure.c.descendant).where(closure.c.ancestor.in_(batch))
+            affected.update((await conn.execute(stmt)).scalars())
+        for batch in batched(affected, IN_CLAUSE_BATCH_SIZE):
+            await conn.execute(delete(closure).where(closure.c.descendant.in_(batch)))
+            await conn.execute(
+                insert(closure).from_select(
+                    ["descendant", "ancestor", "depth"], self._broader_paths(list(batch))
+                )
+            )
+
+    async def closure_rebuild(self) -> int:
+        """Rebuild the whole closure table, e.g. after enabling `PyST_hierarchy_closure`"""
+        closure = concept_closure_table
+        async with self._connect() as conn:
+            await conn.execute(delete(closure))
+            await conn.execute(
+                insert(closure).from_select(
+                    ["descendant", "ancestor", "depth"], self._broader_paths(None)
+                )
+            )
+            count = (await conn.execute(select(func.count("*")).select_from(closure))).scalar()
+            await self._notify(conn, "concept", None, "update")
+            await self._commit(conn)
+        return count
 
     # Concepts
 
@@ -63,23 +356,34 @@ class PostgresKOSGraphDatabase:
         return (await connection.execute(stmt)).first()[0]
 
     async def concept_get(self, iri: str) -> Concept:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             stmt = select(concept_table).where(concept_table.c.id_ == iri)
             result = (await conn.execute(stmt)).first()
             if not result:
                 raise ConceptNotFoundError
-            await conn.rollback()
-        return Concept(**result._mapping)
+            await self._end_read(conn)
+        return from_row(Concept, result)
+
+    async def concept_get_many(self, iris: list[str]) -> dict[str, Concept]:
+        """Get many concepts in one query per batch. Unknown IRIs are not returned."""
+        concepts = {}
+        async with self._connect() as conn:
+            for batch in batched(set(iris), IN_CLAUSE_BATCH_SIZE):
+                stmt = select(concept_table).where(concept_table.c.id_.in_(batch))
+                for row in await conn.execute(stmt):
+                    concepts[row.id_] = from_row(Concept, row)
+            await self._end_read(conn)
+        return concepts
 
     async def concept_get_all_iris(self) -> list[str]:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             stmt = select(concept_table.c.id_)
             result = (await conn.execute(stmt)).scalars()
-            await conn.rollback()
+            await self._end_read(conn)
         return list(result)
 
     async def concept_create(self, concept: Concept) -> Concept:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             count = await self._get_count_from_iri(conn, concept.id_, concept_table)
             if count:
                 raise DuplicateIRI
@@ -88,11 +392,36 @@ class PostgresKOSGraphDatabase:
                 insert(concept_table),
                 [concept.to_db_dict()],
             )
-            await conn.commit()
+            await self._closure_refresh(conn, {concept.id_})
+            await self._record_changes(conn, "concept", "create", [concept.id_])
+            await self._commit(conn)
         return concept
 
+    async def concept_create_many(self, concepts: list[Concept]) -> list[Concept]:
+        """Insert many concepts with one duplicate check per batch and one multi-row `INSERT`"""
+        if not concepts:
+            return concepts
+        async with self._connect() as conn:
+            existing = []
+            for batch in batched([concept.id_ for concept in concepts], IN_CLAUSE_BATCH_SIZE):
+                stmt = select(concept_table.c.id_).where(concept_table.c.id_.in_(batch))
+                existing.extend((await conn.execute(stmt)).scalars())
+            if existing:
+                raise DuplicateIRI(f"Concepts with these IRIs already exist: {sorted(existing)}")
+
+            await conn.execute(
+                insert(concept_table),
+                [concept.to_db_dict() for concept in concepts],
+            )
+            await self._closure_refresh(conn, {concept.id_ for concept in concepts})
+            await self._record_changes(
+                conn, "concept", "create", [concept.id_ for concept in concepts]
+            )
+            await self._commit(conn)
+        return concepts
+
     async def concept_update(self, concept: Concept) -> Concept:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             count = await self._get_count_from_iri(conn, concept.id_, concept_table)
             if not count:
                 raise ConceptNotFoundError
@@ -102,31 +431,58 @@ class PostgresKOSGraphDatabase:
                 .where(concept_table.c.id_ == concept.id_)
                 .values(**concept.to_db_dict())
             )
-            await conn.commit()
+            await self._record_changes(conn, "concept", "update", [concept.id_])
+            await self._commit(conn)
         return concept
 
     async def concept_delete(self, iri: str) -> int:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             result = await conn.execute(delete(concept_table).where(concept_table.c.id_ == iri))
-            await conn.commit()
+            await self._closure_refresh(conn, {iri})
+            await self._record_changes(conn, "concept", "delete", [iri] if result.rowcount else [])
+            await self._commit(conn)
         return result.rowcount
 
+    def _concept_get_all_stmt(
+        self,
+        concept_scheme_iri: str | None,
+        top_concepts_only: bool,
+        limit: int | None,
+        after: str | None,
+    ) -> Select:
+        stmt = select(concept_table)
+        if concept_scheme_iri is not None:
+            # See discussion here:
+            # https://github.com/cauldron/py-semantic-taxonomy/issues/51
+            stmt = stmt.where(concept_table.c.schemes.op("@>")([{"@id": concept_scheme_iri}]))
+            if top_concepts_only:
+                stmt = stmt.where(
+                    concept_table.c.top_concept_of.op("@>")([{"@id": concept_scheme_iri}])
+                )
+        return self._keyset(stmt, concept_table, limit, after)
+
     async def concept_get_all(
-        self, concept_scheme_iri: str | None, top_concepts_only: bool
+        self,
+        concept_scheme_iri: str | None,
+        top_concepts_only: bool,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Concept]:
-        async with self.engine.connect() as conn:
-            stmt = select(concept_table)
-            if concept_scheme_iri is not None:
-                # See discussion here:
-                # https://github.com/cauldron/py-semantic-taxonomy/issues/51
-                stmt = stmt.where(concept_table.c.schemes.op("@>")([{"@id": concept_scheme_iri}]))
-                if top_concepts_only:
-                    stmt = stmt.where(
-                        concept_table.c.top_concept_of.op("@>")([{"@id": concept_scheme_iri}])
-                    )
-            result = (await conn.execute(stmt.order_by(concept_table.c.id_))).fetchall()
-            await conn.rollback()
-        return [Concept(**row._mapping) for row in result]
+        stmt = self._concept_get_all_stmt(concept_scheme_iri, top_concepts_only, limit, after)
+        async with self._connect() as conn:
+            result = (await conn.execute(stmt)).fetchall()
+            await self._end_read(conn)
+        return [from_row(Concept, row) for row in result]
+
+    def concept_stream_all(
+        self,
+        concept_scheme_iri: str | None,
+        top_concepts_only: bool,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Concept]:
+        stmt = self._concept_get_all_stmt(concept_scheme_iri, top_concepts_only, limit, after)
+        return self._stream(stmt, Concept)
 
     async def concept_broader_in_ascending_order(
         self, concept_iri: str, concept_scheme_iri: str
@@ -147,7 +503,20 @@ class PostgresKOSGraphDatabase:
             "top_concept_of",
             "extra",
         ]
-        async with self.engine.connect() as conn:
+        if self.closure:
+            paths = self._hierarchy_paths(concept_iri, ascending=True).subquery()
+            stmt = (
+                select(concept_table)
+                .join(paths, paths.c.ancestor == concept_table.c.id_)
+                .where(concept_table.c.schemes.op("@>")([{"@id": concept_scheme_iri}]))
+                .order_by(paths.c.depth, concept_table.c.id_)
+            )
+            async with self._connect() as conn:
+                results = (await conn.execute(stmt)).fetchall()
+                await self._end_read(conn)
+            return [from_row(Concept, row) for row in results]
+
+        async with self._connect() as conn:
             results = (
                 await conn.execute(
                     text(open(SQL_TEMPLATES / "broader_concept_hierarchy.sql").read()),
@@ -161,33 +530,177 @@ class PostgresKOSGraphDatabase:
         results.sort(key=lambda x: (x[-1], x[0]))
         return [Concept(**{key: value for key, value in zip(columns, row)}) for row in results]
 
+    async def concept_descendants(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+    ) -> list[Concept]:
+        """All narrower concepts, transitively, sorted by depth and IRI"""
+        paths = self._hierarchy_paths(concept_iri, ascending=False, max_depth=max_depth).subquery()
+        stmt = (
+            select(concept_table)
+            .join(paths, paths.c.descendant == concept_table.c.id_)
+            .order_by(paths.c.depth, concept_table.c.id_)
+        )
+        if concept_scheme_iri is not None:
+            stmt = stmt.where(concept_table.c.schemes.op("@>")([{"@id": concept_scheme_iri}]))
+        async with self._connect() as conn:
+            results = (await conn.execute(stmt)).fetchall()
+            await self._end_read(conn)
+        return [from_row(Concept, row) for row in results]
+
+    async def concept_descendant_iris(self, iris: list[str]) -> list[str]:
+        """IRIs of all narrower concepts of any concept in `iris`, transitively, sorted"""
+        descendants = set()
+        async with self._connect() as conn:
+            for batch in batched(set(iris), IN_CLAUSE_BATCH_SIZE):
+                if self.closure:
+                    closure = concept_closure_table
+                    stmt = select(closure.c.descendant).where(closure.c.ancestor.in_(batch))
+                else:
+                    paths = self._broader_paths(list(batch), ascending=False).subquery()
+                    stmt = select(paths.c.descendant)
+                descendants.update((await conn.execute(stmt.distinct())).scalars())
+            await self._end_read(conn)
+        return sorted(descendants)
+
+    async def concept_tree(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+        language: str | None = None,
+    ) -> list[HierarchyNode]:
+        """Compact tree of all narrower concepts, sorted by depth and IRI.
+
+        Each node has the parent on one of its shortest paths to `concept_iri`; in a
+        polyhierarchy the parent with the lowest IRI is used."""
+        paths = self._hierarchy_paths(concept_iri, ascending=False, max_depth=max_depth).subquery()
+        rel = relationship_table
+        members = select(paths.c.descendant).union(select(literal(concept_iri)))
+        stmt = (
+            select(
+                paths.c.descendant,
+                paths.c.depth,
+                rel.c.target.label("parent"),
+                concept_table.c.pref_labels,
+            )
+            .join(concept_table, concept_table.c.id_ == paths.c.descendant)
+            .join(rel, rel.c.source == paths.c.descendant)
+            .where(rel.c.predicate == RelationshipVerbs.broader, rel.c.target.in_(members))
+        )
+        if concept_scheme_iri is not None:
+            stmt = stmt.where(concept_table.c.schemes.op("@>")([{"@id": concept_scheme_iri}]))
+        async with self._connect() as conn:
+            rows = (await conn.execute(stmt)).fetchall()
+            await self._end_read(conn)
+
+        depths = {concept_iri: 0} | {row.descendant: row.depth for row in rows}
+        nodes = {}
+        for row in sorted(rows, key=lambda x: x.parent):
+            if row.descendant in nodes or depths.get(row.parent) != row.depth - 1:
+                continue
+            label = None
+            if language is not None:
+                label = next(iter(select_string_for_language(row.pref_labels, language)), None)
+            nodes[row.descendant] = HierarchyNode(
+                id_=row.descendant, depth=row.depth, parent=row.parent, pref_label=label
+            )
+        return sorted(nodes.values(), key=lambda x: (x.depth, x.id_))
+
+    async def relationships_subtree(self, concept_iri: str) -> list[Relationship]:
+        """`broader` relationships among the given concept and all its descendants"""
+        paths = self._hierarchy_paths(concept_iri, ascending=False).subquery()
+        rel = relationship_table
+        members = select(paths.c.descendant).union(select(literal(concept_iri)))
+        stmt = (
+            select(rel.c.source, rel.c.target, rel.c.predicate)
+            .where(
+                rel.c.predicate == RelationshipVerbs.broader,
+                rel.c.source.in_(select(paths.c.descendant)),
+                rel.c.target.in_(members),
+            )
+            .order_by(rel.c.source, rel.c.target)
+        )
+        async with self._connect() as conn:
+            results = (await conn.execute(stmt)).fetchall()
+            await self._end_read(conn)
+        return [from_row(Relationship, row) for row in results]
+
+    async def concept_search_hierarchy(self, iris: list[str]) -> dict[str, SearchHierarchy]:
+        """Depth and top ancestors of each concept in `iris`, for its search documents"""
+        rel = relationship_table
+        hierarchies = {}
+        async with self._connect() as conn:
+            for batch in batched(iris, IN_CLAUSE_BATCH_SIZE):
+                if self.closure:
+                    closure = concept_closure_table
+                    stmt = select(closure).where(closure.c.descendant.in_(batch))
+                else:
+                    stmt = self._broader_paths(list(batch))
+                paths = (await conn.execute(stmt)).fetchall()
+                ancestors = {row.ancestor for row in paths}
+                # Ancestors with a broader concept aren't at the top of the hierarchy
+                with_broader = set()
+                for chunk in batched(ancestors, IN_CLAUSE_BATCH_SIZE):
+                    stmt = (
+                        select(rel.c.source)
+                        .join(concept_table, concept_table.c.id_ == rel.c.target)
+                        .where(
+                            rel.c.source.in_(chunk), rel.c.predicate == RelationshipVerbs.broader
+                        )
+                        .distinct()
+                    )
+                    with_broader.update((await conn.execute(stmt)).scalars())
+                tops = {iri: {} for iri in batch}
+                for row in paths:
+                    if row.ancestor not in with_broader:
+                        tops[row.descendant][row.ancestor] = row.depth
+                for iri, depths in tops.items():
+                    hierarchies[iri] = (
+                        SearchHierarchy(depth=max(depths.values()), top_concepts=sorted(depths))
+                        if depths
+                        else SearchHierarchy(depth=0, top_concepts=[iri])
+                    )
+            await self._end_read(conn)
+        return hierarchies
+
     # ConceptScheme
 
     async def concept_scheme_get(self, iri: str) -> ConceptScheme:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             stmt = select(concept_scheme_table).where(concept_scheme_table.c.id_ == iri)
             result = (await conn.execute(stmt)).first()
             if not result:
                 raise ConceptSchemeNotFoundError
-            await conn.rollback()
-        return ConceptScheme(**result._mapping)
+            await self._end_read(conn)
+        return from_row(ConceptScheme, result)
 
-    async def concept_scheme_get_all(self) -> list[ConceptScheme]:
-        async with self.engine.connect() as conn:
-            stmt = select(concept_scheme_table).order_by(concept_scheme_table.c.id_)
+    async def concept_scheme_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[ConceptScheme]:
+        stmt = self._keyset(select(concept_scheme_table), concept_scheme_table, limit, after)
+        async with self._connect() as conn:
             result = (await conn.execute(stmt)).fetchall()
-            await conn.rollback()
-        return [ConceptScheme(**obj._mapping) for obj in result]
+            await self._end_read(conn)
+        return [from_row(ConceptScheme, obj) for obj in result]
+
+    def concept_scheme_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[ConceptScheme]:
+        stmt = self._keyset(select(concept_scheme_table), concept_scheme_table, limit, after)
+        return self._stream(stmt, ConceptScheme)
 
     async def concept_scheme_get_all_iris(self) -> list[str]:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             stmt = select(concept_scheme_table.c.id_)
             result = (await conn.execute(stmt)).scalars()
-            await conn.rollback()
+            await self._end_read(conn)
         return list(result)
 
     async def concept_scheme_create(self, concept_scheme: ConceptScheme) -> ConceptScheme:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             count = await self._get_count_from_iri(conn, concept_scheme.id_, concept_scheme_table)
             if count:
                 raise DuplicateIRI
@@ -196,11 +709,12 @@ class PostgresKOSGraphDatabase:
                 insert(concept_scheme_table),
                 [concept_scheme.to_db_dict()],
             )
-            await conn.commit()
+            await self._record_changes(conn, "concept_scheme", "create", [concept_scheme.id_])
+            await self._commit(conn)
         return concept_scheme
 
     async def concept_scheme_update(self, concept_scheme: ConceptScheme) -> ConceptScheme:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             count = await self._get_count_from_iri(conn, concept_scheme.id_, concept_scheme_table)
             if not count:
                 raise ConceptSchemeNotFoundError
@@ -210,15 +724,19 @@ class PostgresKOSGraphDatabase:
                 .where(concept_scheme_table.c.id_ == concept_scheme.id_)
                 .values(**concept_scheme.to_db_dict())
             )
-            await conn.commit()
+            await self._record_changes(conn, "concept_scheme", "update", [concept_scheme.id_])
+            await self._commit(conn)
         return concept_scheme
 
     async def concept_scheme_delete(self, iri: str) -> int:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             result = await conn.execute(
                 delete(concept_scheme_table).where(concept_scheme_table.c.id_ == iri)
             )
-            await conn.commit()
+            await self._record_changes(
+                conn, "concept_scheme", "delete", [iri] if result.rowcount else []
+            )
+            await self._commit(conn)
         return result.rowcount
 
     async def known_concept_schemes_for_concept_hierarchical_relationships(
@@ -227,7 +745,7 @@ class PostgresKOSGraphDatabase:
         """Get list of all concept schemes for all known concepts with relationships to input iri"""
         h_verbs = [v for v in SKOS_HIERARCHICAL_RELATIONSHIP_PREDICATES if v in RelationshipVerbs]
 
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             join_source = join(
                 relationship_table,
                 concept_table,
@@ -256,7 +774,7 @@ class PostgresKOSGraphDatabase:
             )
             cursor = (await conn.execute(stmt)).scalars()
             results = {obj["@id"] for result in cursor for obj in result}
-            await conn.rollback()
+            await self._end_read(conn)
         return sorted(results)
 
     # Relationship
@@ -270,7 +788,7 @@ class PostgresKOSGraphDatabase:
     ) -> list[Relationship]:
         if not source and not target:
             raise ValueError("Must choose at least one of source or target")
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             rels = []
             if source:
                 stmt = select(
@@ -282,7 +800,7 @@ class PostgresKOSGraphDatabase:
                 if verb is not None:
                     stmt = stmt.where(relationship_table.c.predicate == verb)
                 result = await conn.execute(stmt)
-                rels.extend([Relationship(**line._mapping) for line in result])
+                rels.extend([from_row(Relationship, line) for line in result])
             if target:
                 stmt = select(
                     relationship_table.c.source,
@@ -292,18 +810,34 @@ class PostgresKOSGraphDatabase:
                 if verb is not None:
                     stmt = stmt.where(relationship_table.c.predicate == verb)
                 result = await conn.execute(stmt)
-                rels.extend([Relationship(**line._mapping) for line in result])
-            await conn.rollback()
+                rels.extend([from_row(Relationship, line) for line in result])
+            await self._end_read(conn)
         return sorted(rels, key=lambda x: (x.source, x.target))
 
+    @staticmethod
+    def _broader_sources(relationships: list[Relationship]) -> set[str]:
+        return {rel.source for rel in relationships if rel.predicate == RelationshipVerbs.broader}
+
+    async def _record_relationship_changes(
+        self, conn: AsyncConnection, operation: str, relationships: list[Relationship]
+    ) -> None:
+        await self._record_changes(
+            conn,
+            "relationship",
+            operation,
+            [rel.source for rel in relationships],
+            [{"target": rel.target, "predicate": str(rel.predicate)} for rel in relationships],
+        )
+
     async def relationships_create(self, relationships: list[Relationship]) -> list[Relationship]:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             try:
-                await conn.execute(
-                    insert(relationship_table), [obj.to_db_dict() for obj in relationships]
-                )
+                # Savepoint so a unit of work can continue after the constraint violation
+                async with conn.begin_nested():
+                    await conn.execute(
+                        insert(relationship_table), [obj.to_db_dict() for obj in relationships]
+                    )
             except IntegrityError as exc:
-                await conn.rollback()
                 err = exc._message()
                 if (
                     # SQLite: Unit tests
@@ -327,56 +861,116 @@ class PostgresKOSGraphDatabase:
                             )
                 # Fallback - should never happen, but no one is perfect
                 raise exc
-            await conn.commit()
+            await self._closure_refresh(conn, self._broader_sources(relationships))
+            await self._record_relationship_changes(conn, "create", relationships)
+            await self._commit(conn)
         return relationships
 
     async def relationships_delete(self, relationships: list[Relationship]) -> int:
-        async with self.engine.connect() as conn:
-            count = 0
-            for rel in relationships:
+        columns = tuple_(
+            relationship_table.c.source,
+            relationship_table.c.target,
+            relationship_table.c.predicate,
+        )
+        async with self._connect() as conn:
+            # Only relationships which existed are recorded as deleted
+            deleted = []
+            for batch in batched(relationships, IN_CLAUSE_BATCH_SIZE):
                 result = await conn.execute(
-                    delete(relationship_table).where(
-                        relationship_table.c.source == rel.source,
-                        relationship_table.c.target == rel.target,
-                        relationship_table.c.predicate == rel.predicate,
-                    )
+                    delete(relationship_table)
+                    .where(columns.in_([(rel.source, rel.target, rel.predicate) for rel in batch]))
+                    .returning(*columns.clauses)
                 )
-                count += result.rowcount
-            await conn.commit()
-        return count
+                deleted.extend(from_row(Relationship, row) for row in result)
+            await self._closure_refresh(conn, self._broader_sources(deleted))
+            await self._record_relationship_changes(conn, "delete", deleted)
+            await self._commit(conn)
+        return len(deleted)
+
+    async def relationships_delete_for_concept_scheme(
+        self, concept_scheme_iri: str, predicate: RelationshipVerbs | None = None
+    ) -> list[Relationship]:
+        """Delete and return all relationships whose source is a concept in the given scheme"""
+        concepts = select(concept_table.c.id_).where(
+            concept_table.c.schemes.op("@>")([{"@id": concept_scheme_iri}])
+        )
+        stmt = (
+            delete(relationship_table)
+            .where(relationship_table.c.source.in_(concepts))
+            .returning(
+                relationship_table.c.source,
+                relationship_table.c.target,
+                relationship_table.c.predicate,
+            )
+        )
+        if predicate is not None:
+            stmt = stmt.where(relationship_table.c.predicate == predicate)
+        async with self._connect() as conn:
+            deleted = [from_row(Relationship, row) for row in await conn.execute(stmt)]
+            await self._closure_refresh(conn, self._broader_sources(deleted))
+            await self._record_relationship_changes(conn, "delete", deleted)
+            await self._commit(conn)
+        return deleted
 
     async def relationship_source_target_share_known_concept_scheme(
         self, relationship: Relationship
     ) -> bool:
-        async with self.engine.connect() as conn:
-            stmt = select(concept_table.c.schemes).where(
-                concept_table.c.id_.in_([relationship.source, relationship.target])
-            )
-            cursor = (await conn.execute(stmt)).scalars()
-            results = [{obj["@id"] for obj in result} for result in cursor]
-            await conn.rollback()
-        return bool((len(results) < 2) or results[0].intersection(results[1]))
+        return not await self.relationships_crossing_concept_schemes([relationship])
+
+    async def relationships_crossing_concept_schemes(
+        self, relationships: list[Relationship]
+    ) -> list[Relationship]:
+        """Relationships whose source and target are both known concepts without a shared scheme.
+
+        Loads the schemes of all referenced concepts in one query per batch."""
+        if not relationships:
+            return []
+        iris = {rel.source for rel in relationships} | {rel.target for rel in relationships}
+        schemes = {}
+        async with self._connect() as conn:
+            for batch in batched(iris, IN_CLAUSE_BATCH_SIZE):
+                stmt = select(concept_table.c.id_, concept_table.c.schemes).where(
+                    concept_table.c.id_.in_(batch)
+                )
+                for row in await conn.execute(stmt):
+                    schemes[row.id_] = {obj["@id"] for obj in row.schemes}
+            await self._end_read(conn)
+        return [
+            rel
+            for rel in relationships
+            if rel.source in schemes
+            and rel.target in schemes
+            and not schemes[rel.source].intersection(schemes[rel.target])
+        ]
 
     # Correspondence
 
     async def correspondence_get(self, iri: str) -> Correspondence:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             stmt = select(correspondence_table).where(correspondence_table.c.id_ == iri)
             result = (await conn.execute(stmt)).first()
             if not result:
                 raise CorrespondenceNotFoundError
-            await conn.rollback()
-        return Correspondence(**result._mapping)
+            await self._end_read(conn)
+        return from_row(Correspondence, result)
 
-    async def correspondence_get_all(self) -> list[Correspondence]:
-        async with self.engine.connect() as conn:
-            stmt = select(correspondence_table).order_by(correspondence_table.c.id_)
+    async def correspondence_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[Correspondence]:
+        stmt = self._keyset(select(correspondence_table), correspondence_table, limit, after)
+        async with self._connect() as conn:
             results = (await conn.execute(stmt)).fetchall()
-            await conn.rollback()
-        return [Correspondence(**obj._mapping) for obj in results]
+            await self._end_read(conn)
+        return [from_row(Correspondence, obj) for obj in results]
+
+    def correspondence_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[Correspondence]:
+        stmt = self._keyset(select(correspondence_table), correspondence_table, limit, after)
+        return self._stream(stmt, Correspondence)
 
     async def correspondence_create(self, correspondence: Correspondence) -> Correspondence:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             count = await self._get_count_from_iri(conn, correspondence.id_, correspondence_table)
             if count:
                 raise DuplicateIRI
@@ -385,11 +979,12 @@ class PostgresKOSGraphDatabase:
                 insert(correspondence_table),
                 [correspondence.to_db_dict()],
             )
-            await conn.commit()
+            await self._record_changes(conn, "correspondence", "create", [correspondence.id_])
+            await self._commit(conn)
         return correspondence
 
     async def correspondence_update(self, correspondence: Correspondence) -> Correspondence:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             count = await self._get_count_from_iri(conn, correspondence.id_, correspondence_table)
             if not count:
                 raise CorrespondenceNotFoundError
@@ -404,56 +999,102 @@ class PostgresKOSGraphDatabase:
                 .where(correspondence_table.c.id_ == correspondence.id_)
                 .values(**values)
             )
-            await conn.commit()
+            await self._record_changes(conn, "correspondence", "update", [correspondence.id_])
+            await self._commit(conn)
         return correspondence
 
     async def correspondence_delete(self, iri: str) -> int:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             result = await conn.execute(
                 delete(correspondence_table).where(correspondence_table.c.id_ == iri)
             )
-            await conn.commit()
+            await self._record_changes(
+                conn, "correspondence", "delete", [iri] if result.rowcount else []
+            )
+            await self._commit(conn)
         return result.rowcount
 
     async def made_of_add(self, made_of: MadeOf) -> Correspondence:
-        corr = await self.correspondence_get(iri=made_of.id_)
-        existing = {assoc["@id"] for assoc in corr.made_ofs}
-        new = [assoc for assoc in made_of.made_ofs if assoc["@id"] not in existing]
-        async with self.engine.connect() as conn:
-            await conn.execute(
-                update(correspondence_table)
-                .where(correspondence_table.c.id_ == made_of.id_)
-                .values(made_ofs=sorted(corr.made_ofs + new, key=lambda x: x["@id"]))
-            )
-            await conn.commit()
-        return await self.correspondence_get(iri=made_of.id_)
+        async with self.unit_of_work():
+            corr = await self.correspondence_get(iri=made_of.id_)
+            existing = {assoc["@id"] for assoc in corr.made_ofs}
+            new = [assoc for assoc in made_of.made_ofs if assoc["@id"] not in existing]
+            async with self._connect() as conn:
+                await conn.execute(
+                    update(correspondence_table)
+                    .where(correspondence_table.c.id_ == made_of.id_)
+                    .values(made_ofs=sorted(corr.made_ofs + new, key=lambda x: x["@id"]))
+                )
+                await self._record_changes(
+                    conn, "made_of", "create", [made_of.id_] if new else [], [{"made_ofs": new}]
+                )
+                await self._commit(conn)
+            return await self.correspondence_get(iri=made_of.id_)
 
     async def made_of_remove(self, made_of: MadeOf) -> Correspondence:
-        corr = await self.correspondence_get(iri=made_of.id_)
-        to_remove = {assoc["@id"] for assoc in made_of.made_ofs}
-        remaining = sorted(
-            [assoc for assoc in corr.made_ofs if assoc["@id"] not in to_remove],
-            key=lambda x: x["@id"],
-        )
-        async with self.engine.connect() as conn:
-            await conn.execute(
-                update(correspondence_table)
-                .where(correspondence_table.c.id_ == made_of.id_)
-                .values(made_ofs=remaining)
+        async with self.unit_of_work():
+            corr = await self.correspondence_get(iri=made_of.id_)
+            to_remove = {assoc["@id"] for assoc in made_of.made_ofs}
+            remaining = sorted(
+                [assoc for assoc in corr.made_ofs if assoc["@id"] not in to_remove],
+                key=lambda x: x["@id"],
             )
-            await conn.commit()
-        return await self.correspondence_get(iri=made_of.id_)
+            removed = [assoc for assoc in corr.made_ofs if assoc["@id"] in to_remove]
+            async with self._connect() as conn:
+                await conn.execute(
+                    update(correspondence_table)
+                    .where(correspondence_table.c.id_ == made_of.id_)
+                    .values(made_ofs=remaining)
+                )
+                await self._record_changes(
+                    conn,
+                    "made_of",
+                    "delete",
+                    [made_of.id_] if removed else [],
+                    [{"made_ofs": removed}],
+                )
+                await self._commit(conn)
+            return await self.correspondence_get(iri=made_of.id_)
 
     # Association
 
     async def association_get(self, iri: str) -> Association:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             stmt = select(association_table).where(association_table.c.id_ == iri)
             result = (await conn.execute(stmt)).first()
             if not result:
                 raise AssociationNotFoundError
-            await conn.rollback()
-        return Association(**result._mapping)
+            await self._end_read(conn)
+        return from_row(Association, result)
+
+    def _association_get_all_stmt(
+        self,
+        correspondence_iri: str | None,
+        source_concept_iri: str | None,
+        target_concept_iri: str | None,
+        kind: AssociationKind | None,
+        limit: int | None,
+        after: str | None,
+    ) -> Select:
+        stmt = select(association_table)
+        if correspondence_iri is not None:
+            subquery = (
+                select(func.jsonb_array_elements(correspondence_table.c.made_ofs).op("->>")("@id"))
+                .where(correspondence_table.c.id_ == correspondence_iri)
+                .subquery()
+            )
+            stmt = stmt.where(association_table.c.id_.in_(subquery))
+        if source_concept_iri:
+            stmt = stmt.where(
+                association_table.c.source_concepts.op("@>")([{"@id": source_concept_iri}])
+            )
+        if target_concept_iri:
+            stmt = stmt.where(
+                association_table.c.target_concepts.op("@>")([{"@id": target_concept_iri}])
+            )
+        if kind:
+            stmt = stmt.where(association_table.c.kind == kind)
+        return self._keyset(stmt, association_table, limit, after)
 
     async def association_get_all(
         self,
@@ -461,34 +1102,33 @@ class PostgresKOSGraphDatabase:
         source_concept_iri: str | None,
         target_concept_iri: str | None,
         kind: AssociationKind | None,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Association]:
-        async with self.engine.connect() as conn:
-            stmt = select(association_table)
-            if correspondence_iri is not None:
-                subquery = (
-                    select(
-                        func.jsonb_array_elements(correspondence_table.c.made_ofs).op("->>")("@id")
-                    )
-                    .where(correspondence_table.c.id_ == correspondence_iri)
-                    .subquery()
-                )
-                stmt = stmt.where(association_table.c.id_.in_(subquery))
-            if source_concept_iri:
-                stmt = stmt.where(
-                    association_table.c.source_concepts.op("@>")([{"@id": source_concept_iri}])
-                )
-            if target_concept_iri:
-                stmt = stmt.where(
-                    association_table.c.target_concepts.op("@>")([{"@id": target_concept_iri}])
-                )
-            if kind:
-                stmt = stmt.where(association_table.c.kind == kind)
-            result = (await conn.execute(stmt.order_by(association_table.c.id_))).fetchall()
-            await conn.rollback()
-        return [Association(**row._mapping) for row in result]
+        stmt = self._association_get_all_stmt(
+            correspondence_iri, source_concept_iri, target_concept_iri, kind, limit, after
+        )
+        async with self._connect() as conn:
+            result = (await conn.execute(stmt)).fetchall()
+            await self._end_read(conn)
+        return [from_row(Association, row) for row in result]
+
+    def association_stream_all(
+        self,
+        correspondence_iri: str | None,
+        source_concept_iri: str | None,
+        target_concept_iri: str | None,
+        kind: AssociationKind | None,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Association]:
+        stmt = self._association_get_all_stmt(
+            correspondence_iri, source_concept_iri, target_concept_iri, kind, limit, after
+        )
+        return self._stream(stmt, Association)
 
     async def association_create(self, association: Association) -> Association:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             count = await self._get_count_from_iri(conn, association.id_, association_table)
             if count:
                 raise DuplicateIRI
@@ -497,13 +1137,122 @@ class PostgresKOSGraphDatabase:
                 insert(association_table),
                 [association.to_db_dict()],
             )
-            await conn.commit()
+            await self._record_changes(conn, "association", "create", [association.id_])
+            await self._commit(conn)
         return association
 
     async def association_delete(self, iri: str) -> int:
-        async with self.engine.connect() as conn:
+        async with self._connect() as conn:
             result = await conn.execute(
                 delete(association_table).where(association_table.c.id_ == iri)
             )
-            await conn.commit()
+            await self._record_changes(
+                conn, "association", "delete", [iri] if result.rowcount else []
+            )
+            await self._commit(conn)
         return result.rowcount
+
+    # Change log
+
+    def _changes_stmt(self, since: int, limit: int | None) -> Select:
+        stmt = (
+            select(change_log_table)
+            .where(change_log_table.c.sequence > since)
+            .order_by(change_log_table.c.sequence)
+        )
+        if self.engine.dialect.name == "postgresql":
+            # Changes of transactions at or after the horizon could still be followed by changes
+            # with lower sequence numbers
+            stmt = stmt.where(change_log_table.c.sequence < literal_column(CHANGE_SEQUENCE_HORIZON))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return stmt
+
+    async def changes_get(self, since: int = 0, limit: int | None = None) -> list[Change]:
+        """Changes with a sequence number greater than `since`, oldest first"""
+        async with self._connect() as conn:
+            result = (await conn.execute(self._changes_stmt(since, limit))).fetchall()
+            await self._end_read(conn)
+        return [from_row(Change, row) for row in result]
+
+    def changes_stream(self, since: int = 0, limit: int | None = None) -> AsyncIterator[Change]:
+        return self._stream(self._changes_stmt(since, limit), Change)
+
+    async def changes_last_sequence(self) -> int:
+        """Sequence number of the last change `changes_get` would return, or 0"""
+        stmt = self._changes_stmt(0, None).with_only_columns(
+            func.max(change_log_table.c.sequence)
+        ).order_by(None)
+        async with self._connect() as conn:
+            sequence = (await conn.execute(stmt)).scalar_one()
+            await self._end_read(conn)
+        return sequence or 0
+
+    # Search outbox
+
+    async def search_outbox_add(self, iris: list[str]) -> None:
+        if not iris:
+            return
+        now = datetime.now(timezone.utc)
+        async with self._connect() as conn:
+            await conn.execute(
+                insert(search_outbox_table),
+                [{"iri": iri, "attempts": 0, "available_at": now} for iri in iris],
+            )
+            await self._commit(conn)
+
+    async def search_outbox_claim(
+        self, limit: int, lease: float, max_attempts: int
+    ) -> list[SearchOutboxItem]:
+        """Claim the oldest items whose next attempt is due, and count that attempt.
+
+        Claimed items are hidden from other workers for `lease` seconds, so no locks are held
+        while they are indexed; items which are neither completed nor retried, e.g. because the
+        worker died, are due again afterwards. Items with `max_attempts` attempts are left in the
+        outbox but not claimed again. On Postgres, rows being claimed by other workers are
+        skipped."""
+        now = datetime.now(timezone.utc)
+        table = search_outbox_table
+        stmt = (
+            select(table.c.id_)
+            .where(table.c.available_at <= now, table.c.attempts < max_attempts)
+            .order_by(table.c.id_)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        async with self._connect() as conn:
+            ids = (await conn.execute(stmt)).scalars().all()
+            result = []
+            if ids:
+                result = await conn.execute(
+                    update(table)
+                    .where(table.c.id_.in_(ids))
+                    .values(
+                        attempts=table.c.attempts + 1,
+                        available_at=now + timedelta(seconds=lease),
+                    )
+                    .returning(*table.c)
+                )
+            items = sorted((from_row(SearchOutboxItem, row) for row in result), key=lambda x: x.id_)
+            await self._commit(conn)
+        return items
+
+    async def search_outbox_complete(self, ids: list[int]) -> None:
+        async with self._connect() as conn:
+            for batch in batched(ids, IN_CLAUSE_BATCH_SIZE):
+                await conn.execute(
+                    delete(search_outbox_table).where(search_outbox_table.c.id_.in_(batch))
+                )
+            await self._commit(conn)
+
+    async def search_outbox_retry(self, ids: list[int], delay: float) -> None:
+        """Make the items available again `delay` seconds from now"""
+        available_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        async with self._connect() as conn:
+            for batch in batched(ids, IN_CLAUSE_BATCH_SIZE):
+                await conn.execute(
+                    update(search_outbox_table)
+                    .where(search_outbox_table.c.id_.in_(batch))
+                    .values(available_at=available_at)
+                )
+            await self._commit(conn)
@@ -0,0 +1,303 @@
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Iterable
+from urllib.parse import unquote
+
+import structlog
+
+from py_semantic_taxonomy.domain.constants import SEARCH_PER_PAGE
+from py_semantic_taxonomy.domain.entities import CacheStats, SearchFilter, SearchResult
+
+logger = structlog.get_logger("py-semantic-taxonomy")
+
+# Relative weight of a term in each field of the documents from `Concept.to_search_dict`
+FIELD_WEIGHTS = {
+    "pref_label": 3.0,
+    "alt_labels": 2.0,
+    "hidden_labels": 1.5,
+    "notation": 2.0,
+    "definition": 1.0,
+    "all_languages_pref_labels": 0.5,
+}
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+# Most frequent terms used for the last (incomplete) word of a prefix search
+PREFIX_EXPANSIONS = 100
+
+WORD = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and remove accents, so `Böden` matches `boden`"""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str) -> list[str]:
+    return WORD.findall(normalize(text))
+
+
+def matches(document: dict, filters: SearchFilter) -> bool:
+    if filters.concept_scheme_iri is not None and filters.concept_scheme_iri not in document.get(
+        "concept_schemes", []
+    ):
+        return False
+    if filters.top_concept_iri is not None and filters.top_concept_iri not in document.get(
+        "top_concepts", []
+    ):
+        return False
+    if filters.max_depth is not None and document.get("depth", math.inf) > filters.max_depth:
+        return False
+    return True
+
+
+class PrefixTrie:
+    """Set of terms which can be listed by prefix"""
+
+    def __init__(self):
+        self.root: dict = {}
+
+    def add(self, term: str) -> None:
+        node = self.root
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def remove(self, term: str) -> None:
+        path, node = [], self.root
+        for char in term:
+            if char not in node:
+                return
+            path.append((node, char))
+            node = node[char]
+        node.pop("", None)
+        # Prune branches which no longer lead to any term
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+
+    def startswith(self, prefix: str) -> list[str]:
+        node = self.root
+        for char in prefix:
+            if char not in node:
+                return []
+            node = node[char]
+        terms, stack = [], [(prefix, node)]
+        while stack:
+            term, node = stack.pop()
+            for char, child in node.items():
+                if char:
+                    stack.append((term + char, child))
+                else:
+                    terms.append(term)
+        return terms
+
+
+class InvertedIndex:
+    """Search documents of one collection, ranked with BM25 over weighted fields"""
+
+    def __init__(self):
+        self.documents: dict[str, dict] = {}
+        # Term -> document id -> weighted term frequency
+        self.postings: dict[str, dict[str, float]] = defaultdict(dict)
+        self.lengths: dict[str, float] = {}
+        self.total_length = 0.0
+        self.trie = PrefixTrie()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def add(self, document: dict) -> None:
+        id_ = document["id"]
+        self.remove(id_)
+        frequencies = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            values = document.get(field) or []
+            for value in [values] if isinstance(values, str) else values:
+                for term in tokenize(value):
+                    frequencies[term] += weight
+        for term, frequency in frequencies.items():
+            if term not in self.postings:
+                self.trie.add(term)
+            self.postings[term][id_] = frequency
+        self.documents[id_] = document
+        self.lengths[id_] = sum(frequencies.values())
+        self.total_length += self.lengths[id_]
+
+    def remove(self, id_: str) -> None:
+        if (document := self.documents.pop(id_, None)) is None:
+            return
+        for field in FIELD_WEIGHTS:
+            values = document.get(field) or []
+            for value in [values] if isinstance(values, str) else values:
+                for term in tokenize(value):
+                    postings = self.postings.get(term)
+                    if postings is not None and postings.pop(id_, None) is not None:
+                        if not postings:
+                            del self.postings[term]
+                            self.trie.remove(term)
+        self.total_length -= self.lengths.pop(id_)
+
+    def _scores(self, term: str) -> dict[str, float]:
+        postings = self.postings.get(term, {})
+        count = len(self.documents)
+        idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+        average = self.total_length / count
+        return {
+            id_: idf
+            * frequency
+            * (K1 + 1)
+            / (frequency + K1 * (1 - B + B * self.lengths[id_] / average))
+            for id_, frequency in postings.items()
+        }
+
+    def search(
+        self,
+        query: str,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[tuple[dict, set[str]]]:
+        """One page of the best matching documents, with the query terms each of them matched.
+
+        Among equal scores, documents higher up in the hierarchy come first."""
+        terms = tokenize(query)
+        if not terms or not self.documents:
+            return []
+        groups = [[term] for term in terms]
+        if prefix:
+            expanded = self.trie.startswith(terms[-1])
+            expanded.sort(key=lambda term: (-len(self.postings[term]), term))
+            groups[-1] = expanded[:PREFIX_EXPANSIONS]
+
+        scores, matched = defaultdict(float), defaultdict(set)
+        for group in groups:
+            # A document matching several expansions of a prefix counts the best one
+            best = {}
+            for term in group:
+                for id_, score in self._scores(term).items():
+                    if score > best.get(id_, (0, None))[0]:
+                        best[id_] = (score, term)
+            for id_, (score, term) in best.items():
+                scores[id_] += score
+                matched[id_].add(term)
+        if filters is not None:
+            scores = {id_: s for id_, s in scores.items() if matches(self.documents[id_], filters)}
+        ranked = sorted(
+            scores,
+            key=lambda id_: (-scores[id_], self.documents[id_].get("depth", math.inf), id_),
+        )
+        start = (page - 1) * per_page
+        return [(self.documents[id_], matched[id_]) for id_ in ranked[start : start + per_page]]
+
+
+def highlight(label: str, terms: set[str]) -> str | None:
+    """`label` with matched words in `<mark>` tags like Typesense snippets, if any matched"""
+    found = False
+
+    def mark(match: re.Match) -> str:
+        nonlocal found
+        if normalize(match.group()) not in terms:
+            return match.group()
+        found = True
+        return f"<mark>{match.group()}</mark>"
+
+    marked = WORD.sub(mark, label)
+    return marked if found else None
+
+
+class LocalSearchEngine:
+    """In-process `SearchEngine` with an inverted index per collection.
+
+    Needs no external service, but the index lives in memory: it is empty after a restart, and
+    each worker has its own. Concepts are matched by words, with accents and case ignored, and
+    ranked with BM25; there are no embeddings, so `semantic` is ignored. Prefix searches match
+    the last word of the query as a prefix."""
+
+    def __init__(self):
+        self.collections: dict[str, InvertedIndex] = {}
+        self.aliases: dict[str, str] = {}
+
+    def cache_stats(self) -> CacheStats | None:
+        return None
+
+    def _collection(self, name: str) -> InvertedIndex:
+        try:
+            return self.collections[self.aliases.get(name, name)]
+        except KeyError:
+            raise ValueError(f"Search collection `{name}` doesn't exist")
+
+    async def initialize(self, collections: Iterable[str]) -> None:
+        for name in collections:
+            if name not in self.collections and name not in self.aliases:
+                await self.create_collection(name)
+
+    async def reset(self) -> None:
+        logger.warning("Resetting all local search collections")
+        self.aliases.clear()
+        self.collections.clear()
+
+    async def create_collection(self, name: str) -> None:
+        logger.info("Creating local search collection %s", name)
+        self.collections[name] = InvertedIndex()
+
+    async def delete_collection(self, name: str) -> None:
+        logger.info("Deleting local search collection %s", name)
+        self.collections.pop(name, None)
+
+    async def swap_alias(self, alias: str, collection: str) -> str | None:
+        """Point `alias` at `collection`, and return the collection it pointed at before"""
+        previous = self.aliases.get(alias)
+        if previous is None and alias in self.collections:
+            await self.delete_collection(alias)
+        logger.info("Pointing local search alias %s to collection %s", alias, collection)
+        self.aliases[alias] = collection
+        return previous
+
+    async def create_concept(self, concept: dict, collection: str) -> None:
+        self._collection(collection).add(concept)
+
+    async def create_concepts(self, concepts: list[dict], collection: str) -> None:
+        index = self._collection(collection)
+        for concept in concepts:
+            index.add(concept)
+
+    async def update_concept(self, concept: dict, collection: str) -> None:
+        index = self._collection(collection)
+        index.add(index.documents.get(concept["id"], {}) | concept)
+
+    async def delete_concept(self, id_: str, collection: str) -> None:
+        self._collection(collection).remove(id_)
+
+    async def delete_concepts(self, ids: list[str], collection: str) -> None:
+        index = self._collection(collection)
+        for id_ in ids:
+            index.remove(id_)
+
+    async def search(
+        self,
+        query: str,
+        collection: str,
+        semantic: bool,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[SearchResult]:
+        index = self._collection(collection)
+        return [
+            SearchResult(
+                id_=unquote(document["url"]),
+                label=document["pref_label"],
+                highlight=highlight(document["pref_label"], terms),
+            )
+            for document, terms in index.search(query, prefix, filters, page, per_page)
+        ]
+
+    async def search_many(self, queries: list[dict]) -> list[list[SearchResult]]:
+        return [await self.search(**query) for query in queries]
@@ -0,0 +1,58 @@
+import asyncio
+from typing import Callable
+
+import asyncpg
+import orjson
+import structlog
+
+from py_semantic_taxonomy.adapters.persistence.graph import CHANGES_CHANNEL
+from py_semantic_taxonomy.cfg import get_settings
+from py_semantic_taxonomy.domain.entities import ChangeEvent
+
+logger = structlog.get_logger("py-semantic-taxonomy")
+
+# Seconds between checks that the listening connection is still alive
+HEALTH_CHECK_INTERVAL = 30
+# Longest wait between reconnection attempts; the wait doubles after every failed attempt
+MAX_RETRY_INTERVAL = 60
+
+
+async def listen_for_changes(
+    callback: Callable[[ChangeEvent | None], None], retry_interval: float = 5
+) -> None:
+    """Call `callback` for every change `NOTIFY`-ed by any PyST process, until cancelled.
+
+    Uses a dedicated connection outside the pool and reconnects after any error, waiting
+    longer after every failed attempt. `callback` gets `None` after every (re)connection, as
+    changes could have been missed while disconnected."""
+    s = get_settings()
+    delay = retry_interval
+
+    def handler(connection, pid, channel, payload) -> None:
+        callback(ChangeEvent(**orjson.loads(payload)))
+
+    while True:
+        try:
+            conn = await asyncpg.connect(
+                user=s.db_user,
+                password=s.db_pass,
+                host=s.db_host,
+                port=s.db_port,
+                database=s.db_name,
+            )
+            try:
+                await conn.add_listener(CHANGES_CHANNEL, handler)
+                logger.info("Listening for changes on channel %s", CHANGES_CHANNEL)
+                delay = retry_interval
+                callback(None)
+                while True:
+                    await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+                    await conn.execute("SELECT 1")
+            finally:
+                await conn.close(timeout=retry_interval)
+        except Exception:
+            # Anything but cancellation, e.g. `asyncpg.InterfaceError` for a closed connection,
+            # would otherwise end the listener and leave this worker's caches stale
+            logger.exception("Change listener disconnected; retrying in %s seconds", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_INTERVAL)
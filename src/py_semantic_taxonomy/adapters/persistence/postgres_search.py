@@ -0,0 +1,382 @@
+import re
+from typing import Iterable
+from urllib.parse import unquote
+
+import structlog
+from sqlalchemy import (
+    Column,
+    Computed,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, TSVECTOR, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from py_semantic_taxonomy.adapters.persistence.database import create_engine
+from py_semantic_taxonomy.domain.constants import SEARCH_PER_PAGE
+from py_semantic_taxonomy.domain.entities import CacheStats, SearchFilter, SearchResult
+
+logger = structlog.get_logger("py-semantic-taxonomy")
+
+# Postgres text search configurations for stemming and stop words; other languages only split
+# words (`simple`)
+TEXT_SEARCH_CONFIGS = {
+    "da": "danish",
+    "de": "german",
+    "en": "english",
+    "es": "spanish",
+    "fi": "finnish",
+    "fr": "french",
+    "hu": "hungarian",
+    "it": "italian",
+    "nl": "dutch",
+    "no": "norwegian",
+    "pt": "portuguese",
+    "ro": "romanian",
+    "ru": "russian",
+    "sv": "swedish",
+    "tr": "turkish",
+}
+COLLECTION_LANGUAGE = re.compile(r"pyst-concepts-([a-z]+)")
+WORD = re.compile(r"\w+")
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+# Fields of `Concept.to_search_dict`; lists are stored one value per line
+FIELDS = (
+    "url",
+    "pref_label",
+    "alt_labels",
+    "hidden_labels",
+    "notation",
+    "definition",
+    "all_languages_pref_labels",
+)
+# Position in the concept hierarchy, for filtering and ranking; stored as they are
+HIERARCHY_FIELDS = ("concept_schemes", "top_concepts", "depth")
+NO_HIERARCHY = {"concept_schemes": [], "top_concepts": [], "depth": None}
+
+# Tables with Postgres-only types, so not in `tables.metadata_obj`; created by `initialize`
+search_metadata = MetaData()
+
+search_collection_table = Table(
+    "search_collection",
+    search_metadata,
+    Column("name", String, primary_key=True),
+    Column("config", String, nullable=False),
+)
+
+search_alias_table = Table(
+    "search_alias",
+    search_metadata,
+    Column("alias", String, primary_key=True),
+    Column("collection", String, nullable=False),
+)
+
+search_document_table = Table(
+    "search_document",
+    search_metadata,
+    Column("collection", String, primary_key=True),
+    Column("id", String, primary_key=True),
+    *[Column(field, Text, nullable=False, server_default="") for field in FIELDS],
+    Column("concept_schemes", ARRAY(Text), nullable=False, server_default="{}"),
+    Column("top_concepts", ARRAY(Text), nullable=False, server_default="{}"),
+    Column("depth", Integer),
+    Column("config", REGCONFIG, nullable=False),
+    Column(
+        "search_vector",
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector(config, pref_label), 'A')"
+            " || setweight(to_tsvector(config, alt_labels || ' ' || hidden_labels"
+            " || ' ' || notation), 'B')"
+            " || setweight(to_tsvector(config, definition), 'C')"
+            " || setweight(to_tsvector('simple', all_languages_pref_labels), 'D')",
+            persisted=True,
+        ),
+    ),
+)
+Index(
+    "search_document_vector_idx",
+    search_document_table.c.search_vector,
+    postgresql_using="GIN",
+)
+# For typo tolerant matching of labels
+Index(
+    "search_document_pref_label_trgm_idx",
+    search_document_table.c.pref_label,
+    postgresql_using="GIN",
+    postgresql_ops={"pref_label": "gin_trgm_ops"},
+)
+Index(
+    "search_document_concept_schemes_idx",
+    search_document_table.c.concept_schemes,
+    postgresql_using="GIN",
+)
+
+
+def text_search_config(collection: str) -> str:
+    """Text search configuration for the language in a collection name from `SearchService`"""
+    match = COLLECTION_LANGUAGE.search(collection)
+    return TEXT_SEARCH_CONFIGS.get(match.group(1) if match else "", "simple")
+
+
+def tsquery_text(query: str, prefix: bool) -> str:
+    """Input for `to_tsquery` matching any word of `query`, and the last one as a prefix.
+
+    Only word characters are kept, so user input can't contain `to_tsquery` operators."""
+    words = [f"'{word}'" for word in WORD.findall(query)]
+    if prefix and words:
+        words[-1] += ":*"
+    return " | ".join(words)
+
+
+def to_row(concept: dict) -> dict:
+    row = {
+        key: "\n".join(value) if isinstance(value, list) else value
+        for key, value in concept.items()
+        if key in FIELDS
+    }
+    return row | {key: value for key, value in concept.items() if key in HIERARCHY_FIELDS}
+
+
+class PostgresSearchEngine:
+    """`SearchEngine` using Postgres full text search, in the same database as the graph.
+
+    Each document has a weighted `tsvector` of its labels, notation, and definition, using the
+    text search configuration of the collection's language, with a GIN index. Searches match any
+    word of the query and are ranked with `ts_rank_cd`; labels which are similar to the query
+    (`pg_trgm` word similarity) also match, for typos and partial words. There are no
+    embeddings, so `semantic` is ignored. Among equal ranks, concepts higher up in the hierarchy
+    come first. Collections and aliases are rows, not tables."""
+
+    def __init__(self, engine: AsyncEngine | None = None):
+        self.engine = create_engine() if engine is None else engine
+
+    def cache_stats(self) -> CacheStats | None:
+        return None
+
+    async def _resolve(self, conn: AsyncConnection, name: str) -> tuple[str, str]:
+        """Collection `name`, or the one aliased by `name`, and its text search config"""
+        alias = (
+            select(search_alias_table.c.collection)
+            .where(search_alias_table.c.alias == name)
+            .scalar_subquery()
+        )
+        row = (
+            await conn.execute(
+                select(search_collection_table.c.name, search_collection_table.c.config).where(
+                    search_collection_table.c.name == func.coalesce(alias, name)
+                )
+            )
+        ).first()
+        if row is None:
+            raise ValueError(f"Search collection `{name}` doesn't exist")
+        return row.name, row.config
+
+    async def initialize(self, collections: Iterable[str]) -> None:
+        async with self.engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            await conn.run_sync(search_metadata.create_all)
+            existing = set(await conn.scalars(select(search_collection_table.c.name)))
+            existing.update(await conn.scalars(select(search_alias_table.c.alias)))
+        for name in collections:
+            if name not in existing:
+                await self.create_collection(name)
+
+    async def reset(self) -> None:
+        logger.warning("Resetting all Postgres search collections")
+        async with self.engine.begin() as conn:
+            for table in (search_document_table, search_alias_table, search_collection_table):
+                await conn.execute(delete(table))
+
+    async def create_collection(self, name: str) -> None:
+        logger.info("Creating Postgres search collection %s", name)
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                insert(search_collection_table)
+                .values(name=name, config=text_search_config(name))
+                .on_conflict_do_nothing()
+            )
+
+    async def _delete_collection(self, conn: AsyncConnection, name: str) -> None:
+        await conn.execute(
+            delete(search_document_table).where(search_document_table.c.collection == name)
+        )
+        await conn.execute(
+            delete(search_collection_table).where(search_collection_table.c.name == name)
+        )
+
+    async def delete_collection(self, name: str) -> None:
+        logger.info("Deleting Postgres search collection %s", name)
+        async with self.engine.begin() as conn:
+            await self._delete_collection(conn, name)
+
+    async def swap_alias(self, alias: str, collection: str) -> str | None:
+        """Point `alias` at `collection`, and return the collection it pointed at before.
+
+        A collection named `alias`, from before aliases were used, is deleted in the same
+        transaction."""
+        async with self.engine.begin() as conn:
+            previous = await conn.scalar(
+                select(search_alias_table.c.collection)
+                .where(search_alias_table.c.alias == alias)
+                .with_for_update()
+            )
+            if previous is None:
+                await self._delete_collection(conn, alias)
+            logger.info("Pointing Postgres search alias %s to collection %s", alias, collection)
+            stmt = insert(search_alias_table).values(alias=alias, collection=collection)
+            await conn.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[search_alias_table.c.alias],
+                    set_={"collection": stmt.excluded.collection},
+                )
+            )
+        return previous
+
+    async def create_concept(self, concept: dict, collection: str) -> None:
+        await self.create_concepts([concept], collection)
+
+    async def create_concepts(self, concepts: list[dict], collection: str) -> None:
+        logger.debug("Importing %s concepts in %s", len(concepts), collection)
+        async with self.engine.begin() as conn:
+            name, config = await self._resolve(conn, collection)
+            stmt = insert(search_document_table)
+            # Replace existing documents, so retried imports don't fail
+            await conn.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        search_document_table.c.collection,
+                        search_document_table.c.id,
+                    ],
+                    set_={field: stmt.excluded[field] for field in FIELDS + HIERARCHY_FIELDS},
+                ),
+                [
+                    {"collection": name, "id": concept["id"], "config": config}
+                    | NO_HIERARCHY
+                    | to_row(concept)
+                    for concept in concepts
+                ],
+            )
+
+    async def update_concept(self, concept: dict, collection: str) -> None:
+        logger.debug("Updating concept %s in %s", concept["id"], collection)
+        async with self.engine.begin() as conn:
+            name, _ = await self._resolve(conn, collection)
+            await conn.execute(
+                update(search_document_table)
+                .where(
+                    search_document_table.c.collection == name,
+                    search_document_table.c.id == concept["id"],
+                )
+                .values(**to_row(concept))
+            )
+
+    async def delete_concept(self, id_: str, collection: str) -> None:
+        await self.delete_concepts([id_], collection)
+
+    async def delete_concepts(self, ids: list[str], collection: str) -> None:
+        logger.debug("Deleting %s concepts in %s", len(ids), collection)
+        async with self.engine.begin() as conn:
+            name, _ = await self._resolve(conn, collection)
+            await conn.execute(
+                delete(search_document_table).where(
+                    search_document_table.c.collection == name,
+                    search_document_table.c.id.in_(ids),
+                )
+            )
+
+    async def _search(
+        self,
+        conn: AsyncConnection,
+        query: str,
+        collection: str,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[SearchResult]:
+        name, config = await self._resolve(conn, collection)
+        table = search_document_table
+        regconfig = cast(literal(config), REGCONFIG)
+        tsquery = func.to_tsquery(regconfig, tsquery_text(query, prefix))
+        similar = literal(query).op("<%")(table.c.pref_label)
+        rank = func.ts_rank_cd(table.c.search_vector, tsquery) + func.word_similarity(
+            query, table.c.pref_label
+        )
+        where = [table.c.collection == name, or_(table.c.search_vector.op("@@")(tsquery), similar)]
+        if filters is not None:
+            if filters.concept_scheme_iri is not None:
+                where.append(table.c.concept_schemes.contains([filters.concept_scheme_iri]))
+            if filters.top_concept_iri is not None:
+                where.append(table.c.top_concepts.contains([filters.top_concept_iri]))
+            if filters.max_depth is not None:
+                where.append(table.c.depth <= filters.max_depth)
+        rows = await conn.execute(
+            select(
+                table.c.url,
+                table.c.pref_label,
+                func.ts_headline(regconfig, table.c.pref_label, tsquery, HEADLINE_OPTIONS).label(
+                    "highlight"
+                ),
+            )
+            .where(*where)
+            .order_by(rank.desc(), table.c.depth.asc().nulls_last(), table.c.id)
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+        )
+        return [
+            SearchResult(
+                id_=unquote(row.url),
+                label=row.pref_label,
+                # Like Typesense, only highlight labels with matches
+                highlight=row.highlight if "<mark>" in row.highlight else None,
+            )
+            for row in rows
+        ]
+
+    async def search(
+        self,
+        query: str,
+        collection: str,
+        semantic: bool,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[SearchResult]:
+        if not WORD.search(query):
+            return []
+        async with self.engine.connect() as conn:
+            return await self._search(conn, query, collection, prefix, filters, page, per_page)
+
+    async def search_many(self, queries: list[dict]) -> list[list[SearchResult]]:
+        """Run the searches one after the other on one connection"""
+        async with self.engine.connect() as conn:
+            return [
+                (
+                    await self._search(
+                        conn,
+                        q["query"],
+                        q["collection"],
+                        q["prefix"],
+                        q.get("filters"),
+                        q.get("page", 1),
+                        q.get("per_page", SEARCH_PER_PAGE),
+                    )
+                    if WORD.search(q["query"])
+                    else []
+                )
+                for q in queries
+            ]
@@ -1,13 +1,59 @@
+import asyncio
+from itertools import batched
 from typing import Iterable
 from urllib.parse import urlparse
 
 import structlog
 import typesense
 
-from py_semantic_taxonomy.domain.entities import SearchResult
+from py_semantic_taxonomy.domain.constants import SEARCH_PER_PAGE
+from py_semantic_taxonomy.domain.entities import CacheStats, SearchFilter, SearchResult
 
 logger = structlog.get_logger("py-semantic-taxonomy")
 
+# Default `limit_multi_searches` of the Typesense server
+MULTI_SEARCH_LIMIT = 50
+# IDs per delete request; they go in the query string, which has a length limit
+DELETE_BATCH_SIZE = 100
+# Fields for filtering and ranking by position in the hierarchy. Optional, as documents indexed
+# before they were added don't have them.
+HIERARCHY_FIELDS = [
+    {"name": "concept_schemes", "type": "string[]", "facet": True, "optional": True},
+    {"name": "top_concepts", "type": "string[]", "facet": True, "optional": True},
+    {"name": "depth", "type": "int32", "facet": True, "optional": True},
+]
+
+
+def escape_iri(iri: str) -> str:
+    """Percent-encode backticks, which aren't allowed in IRIs, but end a `filter_by` value"""
+    return iri.replace("`", "%60")
+
+
+def quote(value: str) -> str:
+    """`filter_by` value; backticks allow IRIs with other special characters"""
+    return f"`{escape_iri(value)}`"
+
+
+def filter_by(filters: SearchFilter) -> str:
+    """Typesense `filter_by` expression"""
+    clauses = []
+    if filters.concept_scheme_iri is not None:
+        clauses.append(f"concept_schemes:={quote(filters.concept_scheme_iri)}")
+    if filters.top_concept_iri is not None:
+        clauses.append(f"top_concepts:={quote(filters.top_concept_iri)}")
+    if filters.max_depth is not None:
+        clauses.append(f"depth:<={filters.max_depth}")
+    return " && ".join(clauses)
+
+
+def to_document(concept: dict) -> dict:
+    """Typesense document for a search dict, with IRIs stored like `filter_by` matches them"""
+    return concept | {
+        field: [escape_iri(iri) for iri in concept[field]]
+        for field in ("concept_schemes", "top_concepts")
+        if field in concept
+    }
+
 
 class TypesenseSearchEngine:
     def __init__(self, url: str, api_key: str, embedding_model: str):
@@ -21,83 +67,190 @@ class TypesenseSearchEngine:
         )
         self.embedding_model = embedding_model
 
+    def cache_stats(self) -> CacheStats | None:
+        return None
+
     async def _collection_labels(self) -> list[str]:
         collections = await self.client.collections.retrieve()
         return sorted([obj["name"] for obj in collections])
 
+    async def _alias_labels(self) -> list[str]:
+        aliases = await self.client.aliases.retrieve()
+        return sorted([obj["name"] for obj in aliases["aliases"]])
+
     async def initialize(self, collections: Iterable[str]) -> None:
         collection_labels = await self._collection_labels()
         logger.info("Existing typesense collections: %s", collection_labels)
+        # Collections built by a reindex are reached through an alias with the usual name
+        existing = set(collection_labels).union(await self._alias_labels())
 
         for name in collections:
-            if name not in collection_labels:
-                logger.info("Creating typesense collection %s", name)
-                await self.client.collections.create(
+            if name not in existing:
+                await self.create_collection(name)
+            else:
+                await self._add_hierarchy_fields(name)
+
+    async def _add_hierarchy_fields(self, name: str) -> None:
+        """Add `HIERARCHY_FIELDS` to collections created before them; needs a reindex to fill"""
+        schema = await self.client.collections[name].retrieve()
+        fields = {field["name"] for field in schema["fields"]}
+        if missing := [field for field in HIERARCHY_FIELDS if field["name"] not in fields]:
+            logger.info("Adding hierarchy fields to typesense collection %s", name)
+            await self.client.collections[name].update({"fields": missing})
+
+    async def create_collection(self, name: str) -> None:
+        logger.info("Creating typesense collection %s", name)
+        await self.client.collections.create(
+            {
+                "name": name,
+                "fields": [
+                    {"name": "pref_label", "type": "string"},
                     {
-                        "name": name,
-                        "fields": [
-                            {"name": "pref_label", "type": "string"},
-                            {
-                                "name": "pref_label_embedding",
-                                "type": "float[]",
-                                "embed": {
-                                    "from": ["pref_label"],
-                                    "model_config": {"model_name": self.embedding_model},
-                                },
-                            },
-                            {"name": "alt_labels", "type": "string[]"},
-                            {
-                                "name": "alt_label_embedding",
-                                "type": "float[]",
-                                "embed": {
-                                    "from": ["alt_labels"],
-                                    "model_config": {"model_name": self.embedding_model},
-                                },
-                            },
-                            {"name": "hidden_labels", "type": "string[]"},
-                            {"name": "definition", "type": "string"},
-                            {"name": "notation", "type": "string"},
-                            {"name": "all_languages_pref_labels", "type": "string[]"},
-                            {"name": "url", "type": "string"},
-                        ],
-                    }
-                )
+                        "name": "pref_label_embedding",
+                        "type": "float[]",
+                        "embed": {
+                            "from": ["pref_label"],
+                            "model_config": {"model_name": self.embedding_model},
+                        },
+                    },
+                    {"name": "alt_labels", "type": "string[]"},
+                    {
+                        "name": "alt_label_embedding",
+                        "type": "float[]",
+                        "embed": {
+                            "from": ["alt_labels"],
+                            "model_config": {"model_name": self.embedding_model},
+                        },
+                    },
+                    {"name": "hidden_labels", "type": "string[]"},
+                    {"name": "definition", "type": "string"},
+                    {"name": "notation", "type": "string"},
+                    {"name": "all_languages_pref_labels", "type": "string[]"},
+                    {"name": "url", "type": "string"},
+                    *HIERARCHY_FIELDS,
+                ],
+            }
+        )
 
     async def reset(self) -> None:
         logger.warning("Resetting all Typesense collections")
+        for alias in await self._alias_labels():
+            await self.client.aliases[alias].delete()
         collection_labels = await self._collection_labels()
         for collection in collection_labels:
             await self.client.collections[collection].delete()
 
+    async def delete_collection(self, name: str) -> None:
+        logger.info("Deleting typesense collection %s", name)
+        await self.client.collections[name].delete()
+
+    async def swap_alias(self, alias: str, collection: str) -> str | None:
+        """Point `alias` at `collection`, and return the collection it pointed at before.
+
+        A collection named `alias`, from before aliases were used, is deleted first; searches
+        fail until the alias is created right after."""
+        previous = None
+        if alias in await self._alias_labels():
+            previous = (await self.client.aliases[alias].retrieve())["collection_name"]
+        elif alias in await self._collection_labels():
+            await self.delete_collection(alias)
+        logger.info("Pointing typesense alias %s to collection %s", alias, collection)
+        await self.client.aliases.upsert(alias, {"collection_name": collection})
+        return previous
+
     # Can't use upsert because we have nested arrays:
     # https://github.com/typesense/typesense/issues/1043
     async def create_concept(self, concept: dict, collection: str) -> None:
         logger.debug("Creating concept %s in %s", concept["id"], collection)
-        await self.client.collections[collection].documents.create(concept)
+        await self.client.collections[collection].documents.create(to_document(concept))
+
+    async def create_concepts(self, concepts: list[dict], collection: str) -> None:
+        logger.debug("Importing %s concepts in %s", len(concepts), collection)
+        results = await self.client.collections[collection].documents.import_(
+            [to_document(concept) for concept in concepts], {"action": "create"}
+        )
+        if failed := [result for result in results if not result.get("success")]:
+            logger.error("Failed to import %s concepts in %s", len(failed), collection)
+            raise ValueError(f"Typesense import failed for {len(failed)} concepts: {failed[0]}")
 
     async def update_concept(self, concept: dict, collection: str) -> None:
         logger.debug("Updating concept %s in %s", concept["id"], collection)
-        await self.client.collections[collection].documents[concept.pop("id")].update(concept)
+        await self.client.collections[collection].documents[concept.pop("id")].update(
+            to_document(concept)
+        )
 
     async def delete_concept(self, id_: str, collection: str) -> None:
         logger.debug("Deleting concept %s in %s", id_, collection)
         await self.client.collections[collection].documents[id_].delete({"ignore_not_found": True})
 
-    async def search(
-        self, query: str, collection: str, semantic: bool, prefix: bool
-    ) -> list[SearchResult]:
+    async def delete_concepts(self, ids: list[str], collection: str) -> None:
+        logger.debug("Deleting %s concepts in %s", len(ids), collection)
+        for batch in batched(ids, DELETE_BATCH_SIZE):
+            await self.client.collections[collection].documents.delete(
+                {"filter_by": f"id:[{','.join(quote(id_) for id_ in batch)}]"}
+            )
+
+    def _search_params(
+        self,
+        query: str,
+        semantic: bool,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> dict:
         without_semantic = (
             "pref_label,alt_labels,hidden_labels,notation,definition,all_languages_pref_labels"
         )
         with_semantic = "pref_label,pref_label_embedding,alt_labels,hidden_labels,notation,definition,all_languages_pref_labels"
+        params = {
+            "q": query,
+            "query_by": with_semantic if semantic else without_semantic,
+            "page": page,
+            "per_page": per_page,
+            "prefix": prefix,
+            "exclude_fields": "pref_label_embedding",
+            # Prefer broader concepts among equally good matches
+            "sort_by": "_text_match:desc,depth:asc",
+        }
+        if filters is not None and (expression := filter_by(filters)):
+            params["filter_by"] = expression
+        return params
 
+    async def search(
+        self,
+        query: str,
+        collection: str,
+        semantic: bool,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[SearchResult]:
         results = await self.client.collections[collection].documents.search(
-            {
-                "q": query,
-                "query_by": with_semantic if semantic else without_semantic,
-                "per_page": 50,
-                "prefix": prefix,
-                "exclude_fields": "pref_label_embedding",
-            }
+            self._search_params(query, semantic, prefix, filters, page, per_page)
         )
         return SearchResult.from_typesense_results(results)
+
+    async def search_many(self, queries: list[dict]) -> list[list[SearchResult]]:
+        """Run many searches with `multi_search`; `queries` have the arguments of `search`.
+
+        Typesense limits the number of searches per request, so larger lists are split into
+        chunks which are sent concurrently. Results are in the same order as `queries`."""
+
+        async def perform(chunk: tuple[dict, ...]) -> list[dict]:
+            searches = [
+                {"collection": q["collection"]}
+                | self._search_params(**{k: v for k, v in q.items() if k != "collection"})
+                for q in chunk
+            ]
+            response = await self.client.multi_search.perform({"searches": searches}, {})
+            return response["results"]
+
+        chunks = await asyncio.gather(
+            *[perform(chunk) for chunk in batched(queries, MULTI_SEARCH_LIMIT)]
+        )
+        results = [result for chunk in chunks for result in chunk]
+        if errors := [result for result in results if "error" in result]:
+            raise ValueError(f"Typesense search failed for {len(errors)} queries: {errors[0]}")
+        return [SearchResult.from_typesense_results(result) for result in results]
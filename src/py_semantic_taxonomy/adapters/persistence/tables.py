@@ -1,4 +1,17 @@
-from sqlalchemy import JSON, Column, Enum, Index, Integer, MetaData, String, Table, UniqueConstraint
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB
 
 from py_semantic_taxonomy.domain.constants import AssociationKind, RelationshipVerbs
@@ -67,6 +80,17 @@ relationship_table = Table(
 )
 
 
+# Transitive closure of `skos:broader` between existing concepts; only maintained if
+# `PyST_hierarchy_closure` is set. `depth` is the length of the shortest path.
+concept_closure_table = Table(
+    "concept_closure",
+    metadata_obj,
+    Column("ancestor", String, primary_key=True),
+    Column("descendant", String, primary_key=True, index=True),
+    Column("depth", Integer, nullable=False),
+)
+
+
 correspondence_table = Table(
     "correspondence",
     metadata_obj,
@@ -114,3 +138,27 @@ Index(
         "target_concepts": "jsonb_path_ops",
     },
 )
+
+# Append-only log of all changes, for incremental replication. SQLite only autoincrements
+# `INTEGER PRIMARY KEY` columns.
+change_log_table = Table(
+    "change_log",
+    metadata_obj,
+    Column("sequence", BigInteger().with_variant(Integer, "sqlite"), primary_key=True),
+    Column("kind", String, nullable=False),
+    Column("iri", String, nullable=False),
+    Column("operation", String, nullable=False),
+    Column("data", BetterJSON, default={}),
+    Column("created", DateTime(timezone=True), server_default=func.now(), nullable=False),
+)
+
+# Concepts waiting to be (re)indexed in the search engine, written in the same transaction as
+# the concept change
+search_outbox_table = Table(
+    "search_outbox",
+    metadata_obj,
+    Column("id_", BigInteger().with_variant(Integer, "sqlite"), primary_key=True),
+    Column("iri", String, nullable=False),
+    Column("attempts", Integer, nullable=False, default=0),
+    Column("available_at", DateTime(timezone=True), nullable=False, index=True),
+)
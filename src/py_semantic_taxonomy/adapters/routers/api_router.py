@@ -1,18 +1,43 @@
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from typing import Annotated, Any, AsyncIterator, Callable
+
+import orjson
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
+import py_semantic_taxonomy.adapters.routers.fast_json as fast_json
 import py_semantic_taxonomy.adapters.routers.request_dto as req
 import py_semantic_taxonomy.adapters.routers.response_dto as response
+from py_semantic_taxonomy.adapters.routers.bulk_import import (
+    ImportValidationError,
+    load_objects,
+    parse_objects,
+)
+from py_semantic_taxonomy.adapters.routers.conditional import ConditionalGetRoute
 from py_semantic_taxonomy.cfg import get_settings
 from py_semantic_taxonomy.dependencies import get_graph_service, get_search_service
 from py_semantic_taxonomy.domain import entities as de
-from py_semantic_taxonomy.domain.constants import API_VERSION_PREFIX, APIPaths
+from py_semantic_taxonomy.domain.constants import (
+    API_VERSION_PREFIX,
+    SEARCH_MAX_PER_PAGE,
+    SEARCH_PER_PAGE,
+    APIPaths,
+    RelationshipVerbs,
+)
 from py_semantic_taxonomy import __version__
 
-api_router = APIRouter(prefix=API_VERSION_PREFIX)
+api_router = APIRouter(prefix=API_VERSION_PREFIX, route_class=ConditionalGetRoute)
 
 
 """
@@ -45,6 +70,73 @@ async def verify_auth_token(
     if x_pyst_auth_token != settings.auth_token:
         raise HTTPException(status_code=400, detail="X-PyST-Auth-Token header missing or invalid")
 
+
+# Listings
+
+NDJSON = "application/x-ndjson"
+LISTING_RESPONSES = {
+    200: {
+        "description": (
+            "JSON list, or one JSON-LD object per line with `Accept: application/x-ndjson`"
+        ),
+        "content": {NDJSON: {}},
+    }
+}
+Limit = Annotated[int | None, Query(ge=1, description="Maximum number of objects to return")]
+After = Annotated[
+    str | None, Query(description="Return objects with IRIs after this one (keyset pagination)")
+]
+
+
+def wants_ndjson(request: Request) -> bool:
+    return NDJSON in request.headers.get("accept", "")
+
+
+def ndjson_response(
+    objects: AsyncIterator[de.Serializable], serialize: Callable[[Any], dict] | None = None
+) -> StreamingResponse:
+    """Stream objects as newline-delimited JSON-LD instead of building one large list.
+
+    `serialize` converts each object to a dict instead of `to_json_ld`."""
+
+    async def lines():
+        async for obj in objects:
+            yield orjson.dumps(serialize(obj) if serialize else obj.to_json_ld()) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON)
+
+
+def json_ld_list(
+    objects: list[de.Serializable],
+    model: type[BaseModel],
+    http_response: Response | None = None,
+    exclude_unset: bool = False,
+) -> list[BaseModel] | Response:
+    """`model` instances for `objects`, or with `PyST_fast_json` their JSON directly.
+
+    The fast path skips validating each object into `model`; the OpenAPI schema is the same."""
+    if get_settings().fast_json:
+        return fast_json.json_response(
+            [fast_json.to_response_dict(obj, model, exclude_unset) for obj in objects],
+            http_response,
+        )
+    return [model(**obj.to_json_ld()) for obj in objects]
+
+
+def json_ld_object(obj: de.Serializable, model: type[BaseModel]) -> BaseModel | Response:
+    if get_settings().fast_json:
+        return fast_json.json_response(fast_json.to_response_dict(obj, model))
+    return model(**obj.to_json_ld())
+
+
+def add_next_page_link(
+    request: Request, http_response: Response, results: list, limit: int | None
+) -> None:
+    """Add `Link: <...>; rel="next"` header if there could be more results"""
+    if limit is not None and len(results) == limit:
+        url = request.url.include_query_params(after=results[-1].id_)
+        http_response.headers["Link"] = f'<{url}>; rel="next"'
+
 # Status
 
 
@@ -52,20 +144,51 @@ async def verify_auth_token(
     APIPaths.status,
     summary="Get a status report for PyST server",
     response_model=response.ServerStatus,
+    response_model_exclude_none=True,
     tags=["Status"],
 )
 async def server_status(
     search=Depends(get_search_service),
+    service=Depends(get_graph_service),
 ) -> response.ServerStatus:
+    stats, search_stats = service.cache_stats(), search.cache_stats()
     return response.ServerStatus(
         version=__version__,
-        search=bool(search.is_configured)
+        search=bool(search.is_configured),
+        cache=response.CacheStatus(**stats.to_json()) if stats else None,
+        search_cache=response.CacheStatus(**search_stats.to_json()) if search_stats else None,
     )
 
 
 # Search
 
 
+Page = Annotated[int, Query(ge=1, description="Page of results to return, starting at 1")]
+PerPage = Annotated[
+    int, Query(ge=1, le=SEARCH_MAX_PER_PAGE, description="Number of results per page")
+]
+
+
+def search_filter(
+    concept_scheme_iri: Annotated[
+        str | None, Query(description="Only return concepts in this concept scheme")
+    ] = None,
+    top_concept_iri: Annotated[
+        str | None, Query(description="Only return this top concept and its descendants")
+    ] = None,
+    max_depth: Annotated[
+        int | None, Query(ge=0, description="Only return concepts at most this deep")
+    ] = None,
+) -> de.SearchFilter | None:
+    if concept_scheme_iri is None and top_concept_iri is None and max_depth is None:
+        return None
+    return de.SearchFilter(
+        concept_scheme_iri=concept_scheme_iri,
+        top_concept_iri=top_concept_iri,
+        max_depth=max_depth,
+    )
+
+
 @api_router.get(
     APIPaths.search,
     summary="Search for `Concept` objects",
@@ -77,10 +200,25 @@ async def concept_search(
     query: str,
     language: str,
     semantic: bool = True,
+    filters: de.SearchFilter | None = Depends(search_filter),
+    page: Page = 1,
+    per_page: PerPage = SEARCH_PER_PAGE,
     service=Depends(get_search_service),
 ) -> list[de.SearchResult]:
+    """
+    Search concepts by label, notation, and definition. Results can be limited to one concept
+    scheme, to the descendants of one top concept, or to the upper levels of the hierarchy (top
+    concepts have depth 0). Among equally good matches, concepts higher up come first.
+    """
     try:
-        results = await service.search(query=query, language=language, semantic=semantic)
+        results = await service.search(
+            query=query,
+            language=language,
+            semantic=semantic,
+            filters=filters,
+            page=page,
+            per_page=per_page,
+        )
         return results
     except de.SearchNotConfigured:
         raise HTTPException(status_code=503, detail="Search engine not available")
@@ -100,10 +238,15 @@ async def concept_search(
 async def concept_suggest(
     query: str,
     language: str,
+    filters: de.SearchFilter | None = Depends(search_filter),
+    page: Page = 1,
+    per_page: PerPage = SEARCH_PER_PAGE,
     service=Depends(get_search_service),
 ) -> list[de.SearchResult]:
     try:
-        results = await service.suggest(query=query, language=language)
+        results = await service.suggest(
+            query=query, language=language, filters=filters, page=page, per_page=per_page
+        )
         return results
     except de.SearchNotConfigured:
         raise HTTPException(status_code=503, detail="Search engine not available")
@@ -113,6 +256,141 @@ async def concept_suggest(
         )
 
 
+# Most queries accepted by the batch search endpoint in one request
+SEARCH_BATCH_MAX_QUERIES = 1000
+
+
+@api_router.post(
+    APIPaths.search_batch,
+    summary="Search for `Concept` objects with many queries at once",
+    response_model=list[list[de.SearchResult]],
+    tags=["Concept"],
+    responses={503: {"description": "Search engine not available"}},
+)
+async def concept_search_batch(
+    queries: Annotated[list[req.SearchQuery], Body(max_length=SEARCH_BATCH_MAX_QUERIES)],
+    service=Depends(get_search_service),
+) -> list[list[de.SearchResult]]:
+    """
+    Run a list of searches, each with its own language and search options, and return the
+    results of each query in the same order.
+    """
+    try:
+        return await service.search_many(
+            [
+                de.SearchQuery(
+                    **query.model_dump(exclude={"filters"}),
+                    filters=(
+                        de.SearchFilter(**query.filters.model_dump()) if query.filters else None
+                    ),
+                )
+                for query in queries
+            ]
+        )
+    except de.SearchNotConfigured:
+        raise HTTPException(status_code=503, detail="Search engine not available")
+    except de.UnknownLanguage:
+        raise HTTPException(
+            status_code=422, detail="Search engine not configured for given language"
+        )
+
+
+@api_router.post(
+    APIPaths.search_reindex,
+    summary="Rebuild the search index from all concepts",
+    response_model=response.ReindexResult,
+    dependencies=[Depends(verify_auth_token)],
+    tags=["Concept"],
+    responses={503: {"description": "Search engine not available"}},
+)
+async def search_reindex(
+    batch_size: Annotated[
+        int | None, Query(ge=1, description="Concepts per Typesense bulk import")
+    ] = None,
+    concurrency: Annotated[int, Query(ge=1, description="Bulk imports run at once")] = 4,
+    service=Depends(get_graph_service),
+) -> response.ReindexResult:
+    """
+    Index all concepts into new search collections and switch searches over when finished.
+
+    Searches keep working during the reindex. Changes to concepts made while the reindex is
+    running can be missed.
+    """
+    try:
+        result = await service.search_reindex(batch_size=batch_size, concurrency=concurrency)
+        return response.ReindexResult(**result.to_json())
+    except de.SearchNotConfigured:
+        raise HTTPException(status_code=503, detail="Search engine not available")
+
+
+# Concept hierarchy
+
+MaxDepth = Annotated[int | None, Query(ge=1, description="Maximum number of levels to descend")]
+
+
+@api_router.get(
+    APIPaths.concept_descendants,
+    summary="Get all narrower `Concept` objects of a `Concept`, transitively",
+    response_model=list[response.Concept],
+    tags=["Concept"],
+)
+async def concept_descendants(
+    iri: str,
+    concept_scheme_iri: str | None = None,
+    max_depth: MaxDepth = None,
+    service=Depends(get_graph_service),
+) -> list[response.Concept]:
+    """
+    Follows `skos:broader` relationships down from the given concept. Results are sorted by depth
+    and then IRI, and can be filtered to a concept scheme with `concept_scheme_iri=<iri>`.
+    """
+    results = await service.concept_descendants(
+        concept_iri=iri, concept_scheme_iri=concept_scheme_iri, max_depth=max_depth
+    )
+    return json_ld_list(results, response.Concept)
+
+
+@api_router.get(
+    APIPaths.concept_tree,
+    summary="Get a compact tree of all narrower `Concept` IRIs below a `Concept`",
+    response_model=list[de.HierarchyNode],
+    tags=["Concept"],
+)
+async def concept_tree(
+    iri: str,
+    concept_scheme_iri: str | None = None,
+    max_depth: MaxDepth = None,
+    language: str | None = None,
+    service=Depends(get_graph_service),
+) -> list[de.HierarchyNode]:
+    """
+    Returns one node per narrower concept with its `depth` below `iri` and its `parent`, which is
+    enough to rebuild the subtree without fetching each concept. In a polyhierarchy, `parent` is
+    on the shortest path to `iri`. Give `language` to include the preferred label in that language.
+    """
+    return await service.concept_tree(
+        concept_iri=iri,
+        concept_scheme_iri=concept_scheme_iri,
+        max_depth=max_depth,
+        language=language,
+    )
+
+
+@api_router.get(
+    APIPaths.concept_subtree,
+    summary="Get the `skos:broader` relationships below a `Concept`",
+    response_model=list[response.Relationship],
+    response_model_exclude_unset=True,
+    tags=["Concept"],
+)
+async def concept_subtree(
+    iri: str,
+    service=Depends(get_graph_service),
+) -> list[response.Relationship]:
+    lst = await service.relationships_subtree(concept_iri=iri)
+    return json_ld_list(lst, response.Relationship, exclude_unset=True)
+
+
 # Concept
 
 
@@ -121,10 +399,15 @@ async def concept_suggest(
     summary="Get a list of concept objects with optional filters.",
     response_model=list[response.Concept],
     tags=["Concept"],
+    responses=LISTING_RESPONSES,
 )
 async def concept_all_get(
+    request: Request,
+    http_response: Response,
     concept_scheme_iri: str | None = None,
     top_concepts_only: bool = False,
+    limit: Limit = None,
+    after: After = None,
     service=Depends(get_graph_service),
 ) -> list[response.Concept]:
     """
@@ -136,11 +419,29 @@ async def concept_all_get(
     The list can be further filtered to only be top concepts of the given concept scheme (if
     `concept_scheme_iri` is specified) with the URL parameter `top_concepts_only=<bool>`. If
     `concept_scheme_iri` is not specified, `top_concepts_only` *has no effect*.
+
+    Results are sorted by IRI. Use `limit` and `after=<last IRI of previous page>` to page through
+    them; a `Link` header with `rel="next"` is returned when more results could be available.
+
+    Send `Accept: application/x-ndjson` to stream results as newline-delimited JSON-LD.
     """
+    if wants_ndjson(request):
+        return ndjson_response(
+            service.concept_stream_all(
+                concept_scheme_iri=concept_scheme_iri,
+                top_concepts_only=top_concepts_only,
+                limit=limit,
+                after=after,
+            )
+        )
     results = await service.concept_get_all(
-        concept_scheme_iri=concept_scheme_iri, top_concepts_only=top_concepts_only
+        concept_scheme_iri=concept_scheme_iri,
+        top_concepts_only=top_concepts_only,
+        limit=limit,
+        after=after,
     )
-    return [response.Concept(**obj.to_json_ld()) for obj in results]
+    add_next_page_link(request, http_response, results, limit)
+    return json_ld_list(results, response.Concept, http_response)
 
 
 @api_router.get(
@@ -156,7 +457,7 @@ async def concept_get(
 ) -> response.Concept:
     try:
         obj = await service.concept_get(iri=iri)
-        return response.Concept(**obj.to_json_ld())
+        return json_ld_object(obj, response.Concept)
     except de.ConceptNotFoundError:
         raise HTTPException(status_code=404, detail=f"Concept with IRI `{iri}` not found")
 
@@ -248,12 +549,20 @@ async def concept_delete(
     summary="Get all concept schemes",
     response_model=list[response.ConceptScheme],
     tags=["ConceptScheme"],
+    responses=LISTING_RESPONSES,
 )
 async def concept_scheme_get_all(
+    request: Request,
+    http_response: Response,
+    limit: Limit = None,
+    after: After = None,
     service=Depends(get_graph_service),
 ) -> list[response.ConceptScheme]:
-    concept_schemes = await service.concept_scheme_get_all()
-    return [response.ConceptScheme(**cs.to_json_ld()) for cs in concept_schemes]
+    if wants_ndjson(request):
+        return ndjson_response(service.concept_scheme_stream_all(limit=limit, after=after))
+    concept_schemes = await service.concept_scheme_get_all(limit=limit, after=after)
+    add_next_page_link(request, http_response, concept_schemes, limit)
+    return json_ld_list(concept_schemes, response.ConceptScheme, http_response)
 
 
 @api_router.get(
@@ -269,7 +578,7 @@ async def concept_scheme_get(
 ) -> response.ConceptScheme:
     try:
         obj = await service.concept_scheme_get(iri=iri)
-        return response.ConceptScheme(**obj.to_json_ld())
+        return json_ld_object(obj, response.ConceptScheme)
     except de.ConceptSchemeNotFoundError:
         raise HTTPException(status_code=404, detail=f"Concept Scheme with IRI `{iri}` not found")
 
@@ -353,7 +662,7 @@ async def relationships_get(
     service=Depends(get_graph_service),
 ) -> list[response.Relationship]:
     lst = await service.relationships_get(iri=iri, source=source, target=target)
-    return [response.Relationship(**obj.to_json_ld()) for obj in lst]
+    return json_ld_list(lst, response.Relationship, exclude_unset=True)
 
 
 @api_router.post(
@@ -405,6 +714,33 @@ async def relationship_delete(
     )
 
 
+@api_router.delete(
+    APIPaths.relationship_concept_scheme,
+    summary="Delete all `Concept` relationships in a `ConceptScheme`",
+    dependencies=[Depends(verify_auth_token)],
+    tags=["Concept"],
+)
+async def relationship_delete_for_concept_scheme(
+    concept_scheme_iri: str,
+    predicate: RelationshipVerbs | None = None,
+    service=Depends(get_graph_service),
+) -> JSONResponse:
+    """
+    Delete every relationship whose source is a concept in the given concept scheme, optionally
+    only for one predicate. Intended for large reorganisations of a concept scheme.
+    """
+    count = await service.relationships_delete_for_concept_scheme(
+        concept_scheme_iri=concept_scheme_iri, predicate=predicate
+    )
+    return JSONResponse(
+        status_code=200,
+        content={
+            "detail": "Relationships (possibly) deleted",
+            "count": count,
+        },
+    )
+
+
 # Correspondence
 
 
@@ -413,12 +749,20 @@ async def relationship_delete(
     summary="Get all `Correspondence` objects",
     response_model=list[response.Correspondence],
     tags=["Correspondence"],
+    responses=LISTING_RESPONSES,
 )
 async def correspondence_get_all(
+    request: Request,
+    http_response: Response,
+    limit: Limit = None,
+    after: After = None,
     service=Depends(get_graph_service),
 ) -> list[response.Correspondence]:
-    correspondences = await service.correspondence_get_all()
-    return [response.Correspondence(**obj.to_json_ld()) for obj in correspondences]
+    if wants_ndjson(request):
+        return ndjson_response(service.correspondence_stream_all(limit=limit, after=after))
+    correspondences = await service.correspondence_get_all(limit=limit, after=after)
+    add_next_page_link(request, http_response, correspondences, limit)
+    return json_ld_list(correspondences, response.Correspondence, http_response)
 
 
 @api_router.get(
@@ -434,7 +778,7 @@ async def correspondence_get(
 ) -> response.Correspondence:
     try:
         obj = await service.correspondence_get(iri=iri)
-        return response.Correspondence(**obj.to_json_ld())
+        return json_ld_object(obj, response.Correspondence)
     except de.CorrespondenceNotFoundError:
         raise HTTPException(status_code=404, detail=f"Correspondence with IRI `{iri}` not found")
 
@@ -511,22 +855,32 @@ async def correspondence_delete(
     summary="Get an `Association` object",
     response_model=list[response.Association],
     tags=["ConceptAssociation"],
-    responses={404: {"description": "Resource not found"}},
+    responses={404: {"description": "Resource not found"}} | LISTING_RESPONSES,
 )
 async def association_get_all(
+    request: Request,
+    http_response: Response,
     correspondence_iri: str | None = None,
     source_concept_iri: str | None = None,
     target_concept_iri: str | None = None,
     kind: de.AssociationKind | None = None,
+    limit: Limit = None,
+    after: After = None,
     service=Depends(get_graph_service),
 ) -> list[response.Association]:
-    results = await service.association_get_all(
-        correspondence_iri=correspondence_iri,
-        source_concept_iri=source_concept_iri,
-        target_concept_iri=target_concept_iri,
-        kind=kind,
-    )
-    return [response.Association(**obj.to_json_ld()) for obj in results]
+    filters = {
+        "correspondence_iri": correspondence_iri,
+        "source_concept_iri": source_concept_iri,
+        "target_concept_iri": target_concept_iri,
+        "kind": kind,
+        "limit": limit,
+        "after": after,
+    }
+    if wants_ndjson(request):
+        return ndjson_response(service.association_stream_all(**filters))
+    results = await service.association_get_all(**filters)
+    add_next_page_link(request, http_response, results, limit)
+    return json_ld_list(results, response.Association, http_response)
 
 
 @api_router.get(
@@ -542,7 +896,7 @@ async def association_get(
 ) -> response.Association:
     try:
         obj = await service.association_get(iri=iri)
-        return response.Association(**obj.to_json_ld())
+        return json_ld_object(obj, response.Association)
     except de.AssociationNotFoundError:
         raise HTTPException(status_code=404, detail=f"Association with IRI `{iri}` not found")
 
@@ -630,3 +984,91 @@ async def made_of_remove(
         raise HTTPException(
             status_code=404, detail=f"Correspondence with IRI `{made_of.id_}` not found"
         )
+
+
+# Bulk import
+
+
+@api_router.post(
+    APIPaths.bulk_import,
+    summary="Import concept schemes, concepts, and concept relationships in bulk",
+    response_model=response.ImportResult,
+    dependencies=[Depends(verify_auth_token)],
+    tags=["Import"],
+    responses={
+        409: {"description": "Resource already exists"},
+        422: {"description": "Validation or graph integrity error"},
+    },
+)
+async def bulk_import(
+    request: Request,
+    batch_size: Annotated[int, Query(ge=1, description="Rows per database insert")] = 1000,
+    service=Depends(get_graph_service),
+) -> response.ImportResult:
+    """
+    Import a whole dump in one transaction; nothing is written if any object is invalid.
+
+    The request body is a list of expanded JSON-LD objects, or Turtle if the `Content-Type` is
+    `text/turtle`. Concept schemes and concepts are validated like in the single object endpoints,
+    and relationships are taken from the concepts' `broader`, `narrower`, and mapping properties.
+    Objects of other types are ignored.
+    """
+    format = "turtle" if "turtle" in request.headers.get("content-type", "") else "json-ld"
+    try:
+        concept_schemes, concepts, relationships = parse_objects(
+            load_objects(await request.body(), format)
+        )
+        result = await service.bulk_import(
+            concept_schemes=concept_schemes,
+            concepts=concepts,
+            relationships=relationships,
+            batch_size=batch_size,
+        )
+        return response.ImportResult(**result.to_json())
+    except ImportValidationError as err:
+        raise HTTPException(status_code=422, detail=err.errors)
+    except (de.DuplicateIRI, de.DuplicateRelationship) as err:
+        raise HTTPException(status_code=409, detail=str(err))
+    except (
+        de.HierarchicRelationshipAcrossConceptScheme,
+        de.ConceptSchemesNotInDatabase,
+        de.HierarchyConflict,
+        de.RelationshipsReferencesConceptScheme,
+    ) as err:
+        raise HTTPException(status_code=422, detail=str(err))
+
+
+# Change log
+
+
+@api_router.get(
+    APIPaths.changes,
+    summary="Get changes made after a given sequence number, oldest first",
+    response_model=list[response.Change],
+    tags=["Changes"],
+    responses=LISTING_RESPONSES,
+)
+async def changes_get(
+    request: Request,
+    http_response: Response,
+    since: Annotated[
+        int, Query(ge=0, description="Return changes with sequence numbers after this one")
+    ] = 0,
+    limit: Limit = None,
+    service=Depends(get_graph_service),
+) -> list[response.Change]:
+    """
+    Feed of every create, update, and delete, for incremental replication.
+
+    Consumers store the `sequence` of the last change they applied, and pass it as `since` in the
+    next request. With `Accept: application/x-ndjson` the changes are streamed one per line.
+    """
+    if wants_ndjson(request):
+        return ndjson_response(
+            service.changes_stream(since=since, limit=limit), serialize=de.Change.to_json
+        )
+    changes = await service.changes_get(since=since, limit=limit)
+    if limit is not None and len(changes) == limit:
+        url = request.url.include_query_params(since=changes[-1].sequence)
+        http_response.headers["Link"] = f'<{url}>; rel="next"'
+    return [response.Change(**change.to_json()) for change in changes]
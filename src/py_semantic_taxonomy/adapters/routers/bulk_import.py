@@ -0,0 +1,61 @@
+import orjson
+from pydantic import ValidationError
+from rdflib import Graph
+
+import py_semantic_taxonomy.adapters.routers.request_dto as req
+from py_semantic_taxonomy.domain import entities as de
+from py_semantic_taxonomy.domain.constants import SKOS
+
+IMPORT_FORMATS = ("json-ld", "turtle")
+
+
+class ImportValidationError(Exception):
+    def __init__(self, errors: list[dict]):
+        super().__init__(f"{len(errors)} object(s) in import failed validation")
+        self.errors = errors
+
+
+def load_objects(data: bytes | str, format: str = "json-ld") -> list[dict]:
+    """Load a JSON-LD or Turtle dump as a list of expanded JSON-LD objects"""
+    if format not in IMPORT_FORMATS:
+        raise ValueError(f"Unknown import format `{format}`; must be one of {IMPORT_FORMATS}")
+    try:
+        if format == "turtle":
+            data = Graph().parse(data=data, format="turtle").serialize(format="json-ld")
+        objects = orjson.loads(data)
+    except Exception as exc:
+        raise ImportValidationError([{"@id": None, "errors": [str(exc)]}])
+    return objects if isinstance(objects, list) else [objects]
+
+
+def parse_objects(
+    objects: list[dict],
+) -> tuple[list[de.ConceptScheme], list[de.Concept], list[de.Relationship]]:
+    """Validate concept schemes and concepts with the same rules as the single object endpoints.
+
+    Objects with other types are ignored. All validation errors are collected before raising."""
+    concept_schemes, concepts, concept_objects, errors = [], [], [], []
+    for obj in objects:
+        types = obj.get("@type", [])
+        if f"{SKOS}ConceptScheme" in types:
+            validator, cls, target = req.ConceptScheme, de.ConceptScheme, concept_schemes
+        elif f"{SKOS}Concept" in types:
+            validator, cls, target = req.ConceptCreate, de.Concept, concepts
+            concept_objects.append(obj)
+        else:
+            continue
+        try:
+            validator.model_validate(obj)
+        except ValidationError as exc:
+            errors.append(
+                {
+                    "@id": obj.get("@id"),
+                    "errors": exc.errors(include_url=False, include_context=False),
+                }
+            )
+            continue
+        target.append(cls.from_json_ld(obj))
+
+    if errors:
+        raise ImportValidationError(errors)
+    return concept_schemes, concepts, de.Relationship.from_json_ld_list(concept_objects)
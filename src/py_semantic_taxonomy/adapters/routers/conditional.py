@@ -0,0 +1,48 @@
+import hashlib
+from typing import Callable
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from starlette.responses import StreamingResponse
+
+
+def etag_for(body: bytes) -> str:
+    """Strong entity tag from the response body, so it changes whenever the content does"""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as in RFC 9110 section 13.1.2
+    return etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+
+class ConditionalGetRoute(APIRoute):
+    """Add an `ETag` to successful `GET` responses, and answer a matching `If-None-Match` with
+    `304 Not Modified` and no body. Streamed responses are left alone."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def conditional_handler(request: Request) -> Response:
+            response = await handler(request)
+            if (
+                request.method not in ("GET", "HEAD")
+                or response.status_code != 200
+                or isinstance(response, StreamingResponse)
+            ):
+                return response
+            etag = etag_for(response.body)
+            if etag_matches(etag, request.headers.get("if-none-match", "")):
+                headers = {
+                    key: value
+                    for key, value in response.headers.items()
+                    if key not in ("content-length", "content-type")
+                }
+                headers["etag"] = etag
+                return Response(status_code=304, headers=headers)
+            response.headers["etag"] = etag
+            return response
+
+        return conditional_handler
@@ -0,0 +1,37 @@
+from functools import lru_cache
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from py_semantic_taxonomy.domain.entities import Serializable
+
+
+@lru_cache
+def optional_fields(model: type[BaseModel]) -> dict[str, Any]:
+    """Defaults of the optional fields of `model`, by alias.
+
+    `to_json_ld` leaves out empty lists, which the response models fill in."""
+    return {
+        field.alias or name: field.get_default(call_default_factory=True)
+        for name, field in model.model_fields.items()
+        if not field.is_required()
+    }
+
+
+def to_response_dict(
+    obj: Serializable, model: type[BaseModel], exclude_unset: bool = False
+) -> dict:
+    """Same JSON as `model(**obj.to_json_ld())` gives, without validating it"""
+    if exclude_unset:
+        return obj.to_json_ld()
+    return optional_fields(model) | obj.to_json_ld()
+
+
+def json_response(content: Any, headers: Response | None = None) -> Response:
+    """JSON serialized with `orjson`, with the headers set on `headers` by the endpoint"""
+    response = Response(content=orjson.dumps(content), media_type="application/json")
+    if headers is not None:
+        response.headers.update(headers.headers)
+    return response
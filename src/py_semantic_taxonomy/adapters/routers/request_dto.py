@@ -21,6 +21,8 @@ from py_semantic_taxonomy.adapters.routers.validation import (
 )
 from py_semantic_taxonomy.domain.constants import RDF_MAPPING as RDF
 from py_semantic_taxonomy.domain.constants import (
+    SEARCH_MAX_PER_PAGE,
+    SEARCH_PER_PAGE,
     SKOS,
     SKOS_RELATIONSHIP_PREDICATES,
     XKOS,
@@ -483,3 +485,30 @@ class Association(BaseModel):
         if SCHEME not in value:
             raise ValueError(f"`@type` must include `{SCHEME}`")
         return value
+
+
+class SearchFilter(BaseModel):
+    concept_scheme_iri: str | None = Field(
+        default=None, description="Only return concepts in this concept scheme"
+    )
+    top_concept_iri: str | None = Field(
+        default=None, description="Only return this top concept and its descendants"
+    )
+    max_depth: int | None = Field(
+        default=None, ge=0, description="Only return concepts at most this deep"
+    )
+
+
+class SearchQuery(BaseModel):
+    query: str
+    language: str
+    semantic: bool = True
+    prefix: bool = Field(default=False, description="Suggestion search; never semantic")
+    filters: SearchFilter | None = None
+    page: int = Field(default=1, ge=1, description="Page of results to return, starting at 1")
+    per_page: int = Field(
+        default=SEARCH_PER_PAGE,
+        ge=1,
+        le=SEARCH_MAX_PER_PAGE,
+        description="Number of results per page",
+    )
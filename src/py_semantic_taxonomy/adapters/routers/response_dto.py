@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from py_semantic_taxonomy.adapters.routers.doc_examples import (
@@ -10,9 +12,40 @@ from py_semantic_taxonomy.domain.constants import RDF_MAPPING as RDF
 from py_semantic_taxonomy.domain.constants import RelationshipVerbs as RV
 
 
+class CacheStatus(BaseModel):
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    hit_ratio: float
+
+
 class ServerStatus(BaseModel):
     version: str
     search: bool
+    cache: CacheStatus | None = None
+    search_cache: CacheStatus | None = None
+
+
+class ImportResult(BaseModel):
+    concept_schemes: int
+    concepts: int
+    relationships: int
+
+
+class Change(BaseModel):
+    sequence: int
+    kind: str
+    iri: str
+    operation: str
+    data: dict
+    created: datetime
+
+
+class ReindexResult(BaseModel):
+    concepts: int
+    seconds: float
+    collections: list[str]
 
 
 class ErrorMessage(BaseModel):
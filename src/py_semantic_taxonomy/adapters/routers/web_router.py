@@ -219,37 +219,68 @@ async def web_concept_view(
     """View a specific concept."""
     try:
         decoded_iri = unquote(iri)
-        concept = await service.concept_get(iri=decoded_iri)
-        if not concept_scheme:
-            return RedirectResponse(
-                concept_view_url(
-                    request,
-                    concept.id_,
-                    concept.schemes[0]["@id"],
-                    language or settings.languages[0],
+        # Page makes several reads; use one pooled connection for all of them
+        async with service.unit_of_work():
+            concept = await service.concept_get(iri=decoded_iri)
+            if not concept_scheme:
+                return RedirectResponse(
+                    concept_view_url(
+                        request,
+                        concept.id_,
+                        concept.schemes[0]["@id"],
+                        language or settings.languages[0],
+                    )
                 )
-            )
 
-        if not language:
-            return RedirectResponse(
-                concept_view_url(
-                    request, concept.id_, concept.schemes[0]["@id"], settings.languages[0]
+            if not language:
+                return RedirectResponse(
+                    concept_view_url(
+                        request, concept.id_, concept.schemes[0]["@id"], settings.languages[0]
+                    )
                 )
-            )
-        concept = concept.filter_language(language)
+            concept = concept.filter_language(language)
+
+            scheme = await service.concept_scheme_get(iri=unquote(concept_scheme))
 
-        scheme = await service.concept_scheme_get(iri=unquote(concept_scheme))
+            hierarchy = (
+                await service.concept_broader_in_ascending_order(
+                    concept_iri=concept.id_, concept_scheme_iri=scheme.id_
+                )
+            )[::-1]
+            hierarchy = [
+                (concept_view_url(request, c.id_, scheme.id_, language), c) for c in hierarchy
+            ]
 
-        hierarchy = (
-            await service.concept_broader_in_ascending_order(
-                concept_iri=concept.id_, concept_scheme_iri=scheme.id_
+            relationships = await service.relationships_get(
+                iri=decoded_iri, source=True, target=True
+            )
+            broader_iris = [
+                obj.target
+                for obj in relationships
+                if obj.source == concept.id_ and obj.predicate == RelationshipVerbs.broader
+            ]
+            narrower_iris = [
+                obj.source
+                for obj in relationships
+                if obj.target == concept.id_ and obj.predicate == RelationshipVerbs.broader
+            ]
+            associations = [
+                obj
+                for obj in await service.association_get_all(source_concept_iri=concept.id_)
+                if obj.kind == AssociationKind.simple
+            ]
+
+            # Fetch all linked concepts in one query instead of one query per link
+            linked_concepts = await service.concept_get_many(
+                iris=broader_iris
+                + narrower_iris
+                + [target["@id"] for obj in associations for target in obj.target_concepts]
             )
-        )[::-1]
-        hierarchy = [(concept_view_url(request, c.id_, scheme.id_, language), c) for c in hierarchy]
 
-        async def get_concept_and_link(iri: str) -> (str, de.Concept | str):
-            try:
-                concept = (await service.concept_get(iri=iri)).filter_language(language)
+            def get_concept_and_link(iri: str) -> (str, de.Concept | str):
+                if iri not in linked_concepts:
+                    return iri, iri
+                concept = linked_concepts[iri].filter_language(language)
                 url = concept_view_url(
                     request,
                     iri,
@@ -261,31 +292,19 @@ async def web_concept_view(
                     language,
                 )
                 return url, concept
-            except de.ConceptNotFoundError:
-                return iri, iri
-
-        relationships = await service.relationships_get(iri=decoded_iri, source=True, target=True)
-        broader = [
-            (await get_concept_and_link(obj.target))
-            for obj in relationships
-            if obj.source == concept.id_ and obj.predicate == RelationshipVerbs.broader
-        ]
-        narrower = [
-            (await get_concept_and_link(obj.source))
-            for obj in relationships
-            if obj.target == concept.id_ and obj.predicate == RelationshipVerbs.broader
-        ]
 
-        scheme_list = [
-            (request.url_for("web_concept_view", iri=quote(s["@id"])), s) for s in concept.schemes
-        ]
+            broader = [get_concept_and_link(iri) for iri in broader_iris]
+            narrower = [get_concept_and_link(iri) for iri in narrower_iris]
 
-        associations = await service.association_get_all(source_concept_iri=concept.id_)
-        formatted_associations = []
-        for obj in filter(lambda x: x.kind == AssociationKind.simple, associations):
-            for target in obj.target_concepts:
-                try:
-                    url, assoc_concept = await get_concept_and_link(target["@id"])
+            scheme_list = [
+                (request.url_for("web_concept_view", iri=quote(s["@id"])), s)
+                for s in concept.schemes
+            ]
+
+            formatted_associations = []
+            for obj in associations:
+                for target in obj.target_concepts:
+                    url, assoc_concept = get_concept_and_link(target["@id"])
                     formatted_associations.append(
                         {
                             "url": url,
@@ -296,17 +315,6 @@ async def web_concept_view(
                             ),
                         }
                     )
-                except de.ConceptNotFoundError:
-                    formatted_associations.append(
-                        {
-                            "url": target["@id"],
-                            "obj": target["@id"],
-                            "conditional": None,
-                            "conversion": target.get(
-                                "http://qudt.org/3.0.0/schema/qudt/conversionMultiplier"
-                            ),
-                        }
-                    )
 
         languages = [(request.url, Language.get(language).display_name(language).title())] + [
             (
@@ -1,16 +1,21 @@
+import asyncio
+from contextlib import suppress
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
-from py_semantic_taxonomy.adapters.persistence.database import (
-    create_engine,
-    init_db,
-)
+from py_semantic_taxonomy.adapters.persistence.database import init_db
 from py_semantic_taxonomy.adapters.routers.api_router import api_router
 from py_semantic_taxonomy.adapters.routers.catch_router import router as catch_router
 from py_semantic_taxonomy.adapters.routers.web_router import router as web_router
-from py_semantic_taxonomy.dependencies import get_search_service
+from py_semantic_taxonomy.cfg import get_settings
+from py_semantic_taxonomy.dependencies import (
+    get_engine,
+    get_graph_service,
+    get_kos_graph,
+    get_search_service,
+)
 
 # from fastapi.middleware.cors import CORSMiddleware
 
@@ -20,13 +25,69 @@ def create_app() -> FastAPI:
 
     @app.on_event("startup")
     async def database():
-        await init_db(create_engine())
+        await init_db(get_engine())
 
     @app.on_event("startup")
     async def search():
         ts = get_search_service()
         if ts.configured:
             await ts.initialize()
+            if get_settings().search_backend == "local":
+                # The in-memory index starts empty in every worker; changes after this sequence
+                # number are applied by the change listener
+                app.state.search_since = await get_graph_service().changes_last_sequence()
+                await get_graph_service().search_reindex()
+
+    @app.on_event("startup")
+    async def change_listener():
+        # Clear this worker's cache, and update its local search index, when any worker
+        # changes the graph
+        settings = get_settings()
+        if settings.db_backend != "postgres":
+            return
+        callbacks = []
+        graph = get_kos_graph()
+        if graph.cache_stats() is not None:
+            callbacks.append(lambda event: graph.invalidate_cache())
+        if (since := getattr(app.state, "search_since", None)) is not None:
+            from py_semantic_taxonomy.application.search_sync import SearchIndexSync
+
+            sync = SearchIndexSync(get_graph_service(), since=since)
+            callbacks.append(sync.on_change)
+            app.state.search_sync = asyncio.create_task(sync.run())
+        if callbacks:
+            from py_semantic_taxonomy.adapters.persistence.notifications import (
+                listen_for_changes,
+            )
+
+            def callback(event):
+                for function in callbacks:
+                    function(event)
+
+            app.state.change_listener = asyncio.create_task(listen_for_changes(callback))
+
+    @app.on_event("startup")
+    async def search_outbox():
+        # Index concepts written by any worker; on Postgres, workers claim different batches
+        settings = get_settings()
+        if settings.search_outbox and get_search_service().configured:
+            from py_semantic_taxonomy.application.search_outbox import run_search_outbox
+
+            app.state.search_outbox = asyncio.create_task(
+                run_search_outbox(
+                    get_graph_service(),
+                    batch_size=settings.search_outbox_batch_size,
+                    poll_interval=settings.search_outbox_poll_interval,
+                )
+            )
+
+    @app.on_event("shutdown")
+    async def stop_background_tasks():
+        for name in ("change_listener", "search_sync", "search_outbox"):
+            if task := getattr(app.state, name, None):
+                task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await task
 
     # app.add_middleware(
     #     CORSMiddleware,
@@ -1,3 +1,11 @@
+from collections import Counter
+from contextlib import AbstractAsyncContextManager
+from itertools import batched
+from typing import AsyncIterator
+
+import structlog
+
+from py_semantic_taxonomy.cfg import get_settings
 from py_semantic_taxonomy.dependencies import get_kos_graph, get_search_service
 from py_semantic_taxonomy.domain.constants import (
     SKOS_HIERARCHICAL_RELATIONSHIP_PREDICATES,
@@ -7,6 +15,8 @@ from py_semantic_taxonomy.domain.entities import (
     Association,
     AssociationKind,
     AssociationNotFoundError,
+    CacheStats,
+    Change,
     Concept,
     ConceptNotFoundError,
     ConceptScheme,
@@ -14,35 +24,71 @@ from py_semantic_taxonomy.domain.entities import (
     ConceptSchemesNotInDatabase,
     Correspondence,
     CorrespondenceNotFoundError,
-    DuplicateRelationship,
+    DuplicateIRI,
     GraphObject,
     HierarchicRelationshipAcrossConceptScheme,
     HierarchyConflict,
+    HierarchyNode,
+    ImportResult,
     MadeOf,
+    ReindexResult,
     Relationship,
     RelationshipsInCurrentConceptScheme,
     RelationshipsReferencesConceptScheme,
+    SearchHierarchy,
 )
 from py_semantic_taxonomy.domain.ports import KOSGraphDatabase, SearchService
 
+logger = structlog.get_logger("py-semantic-taxonomy")
+
+# Seconds before the first retry of a failed search outbox batch; doubled for every failure
+SEARCH_OUTBOX_BACKOFF = 1
+SEARCH_OUTBOX_MAX_BACKOFF = 300
+# Attempts after which a failing outbox item is no longer retried
+SEARCH_OUTBOX_MAX_ATTEMPTS = 20
+# Seconds a claimed outbox item is hidden from other workers while it is indexed
+SEARCH_OUTBOX_LEASE = 300
+
 
 class GraphService:
     def __init__(
         self,
         graph: KOSGraphDatabase | None = None,
         search: SearchService | None = None,
+        search_outbox: bool | None = None,
     ):
         self.graph = graph or get_kos_graph()
         self.search = search or get_search_service()
+        # Queue search index updates for `search_outbox_process` instead of doing them inline
+        self.search_outbox = (
+            get_settings().search_outbox if search_outbox is None else search_outbox
+        )
+
+    def unit_of_work(self) -> AbstractAsyncContextManager[None]:
+        """Share one database connection and transaction for all calls inside this context"""
+        return self.graph.unit_of_work()
+
+    def cache_stats(self) -> CacheStats | None:
+        """Hit and miss counters if the graph database is cached, otherwise `None`"""
+        return self.graph.cache_stats()
+
+    def _index_later(self) -> bool:
+        return self.search_outbox and self.search.is_configured()
 
     async def get_object_type(self, iri: str) -> GraphObject:
         return await self.graph.get_object_type(iri=iri)
 
+    async def get_object_types(self, iris: list[str]) -> dict[str, GraphObject]:
+        return await self.graph.get_object_types(iris=iris)
+
     # Concept
 
     async def concept_get(self, iri: str) -> Concept:
         return await self.graph.concept_get(iri=iri)
 
+    async def concept_get_many(self, iris: list[str]) -> dict[str, Concept]:
+        return await self.graph.concept_get_many(iris=iris)
+
     async def concept_broader_in_ascending_order(
         self, concept_iri: str, concept_scheme_iri: str
     ) -> list[Concept]:
@@ -50,6 +96,39 @@ class GraphService:
             concept_iri=concept_iri, concept_scheme_iri=concept_scheme_iri
         )
 
+    async def concept_descendants(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+    ) -> list[Concept]:
+        return await self.graph.concept_descendants(
+            concept_iri=concept_iri, concept_scheme_iri=concept_scheme_iri, max_depth=max_depth
+        )
+
+    async def concept_descendant_iris(self, iris: list[str]) -> list[str]:
+        return await self.graph.concept_descendant_iris(iris=iris)
+
+    async def concept_tree(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+        language: str | None = None,
+    ) -> list[HierarchyNode]:
+        return await self.graph.concept_tree(
+            concept_iri=concept_iri,
+            concept_scheme_iri=concept_scheme_iri,
+            max_depth=max_depth,
+            language=language,
+        )
+
+    async def relationships_subtree(self, concept_iri: str) -> list[Relationship]:
+        return await self.graph.relationships_subtree(concept_iri=concept_iri)
+
+    async def closure_rebuild(self) -> int:
+        return await self.graph.closure_rebuild()
+
     async def _concept_refers_to_concept_scheme_in_database(self, concept: Concept) -> None:
         concept_schemes = set(await self.concept_scheme_get_all_iris())
         given_cs = {cs["@id"] for cs in concept.schemes}
@@ -67,75 +146,170 @@ class GraphService:
     async def concept_create(
         self, concept: Concept, relationships: list[Relationship] = []
     ) -> Concept:
-        await self._concept_refers_to_concept_scheme_in_database(concept)
-
-        if concept.top_concept_of:
-            await self._check_top_concept(concept)
-
-            for rel in relationships:
-                if rel.source == concept.id_ and rel.predicate == RelationshipVerbs.broader:
-                    raise HierarchyConflict(
-                        f"Concept is marked as `topConceptOf` but also has broader relationship to `{rel.target}`"
-                    )
-
-        await self.graph.concept_create(concept=concept)
-        if relationships:
-            try:
-                await self.relationships_create(relationships)
-            except (HierarchicRelationshipAcrossConceptScheme, DuplicateRelationship) as err:
-                await self.concept_delete(concept.id_)
-                raise err
-
-        if self.search.is_configured():
-            await self.search.create_concept(concept)
+        async with self.unit_of_work():
+            await self._concept_refers_to_concept_scheme_in_database(concept)
+
+            if concept.top_concept_of:
+                await self._check_top_concept(concept)
+
+                for rel in relationships:
+                    if rel.source == concept.id_ and rel.predicate == RelationshipVerbs.broader:
+                        raise HierarchyConflict(
+                            f"Concept is marked as `topConceptOf` but also has broader relationship to `{rel.target}`"
+                        )
+
+            await self.graph.concept_create(concept=concept)
+            affected = []
+            if relationships:
+                # On error the unit of work rolls back the concept as well
+                await self._relationships_create(relationships)
+                affected = await self._hierarchy_affected(relationships)
+            # Existing relationships can already point at this IRI
+            affected = set(affected).union(await self._descendants_affected(concept.id_))
+            if self._index_later():
+                await self.graph.search_outbox_add([concept.id_])
+
+        if self.search.is_configured() and not self.search_outbox:
+            await self.search.create_concept(concept, await self._hierarchy(concept.id_))
+            # Narrower concepts are now below this concept
+            if affected := sorted(affected.difference([concept.id_])):
+                await self.search_refresh(affected)
 
         return concept
 
     async def concept_update(self, concept: Concept) -> Concept:
-        await self._concept_refers_to_concept_scheme_in_database(concept)
-
-        if concept.top_concept_of:
-            await self._check_top_concept(concept)
-
-        current = await self.graph.concept_get(concept.id_)
-        current_schemes = {cs["@id"] for cs in current.schemes}
-        new_schemes = {cs["@id"] for cs in concept.schemes}
-        if current_schemes.difference(new_schemes):
-            # Can remove a ConceptScheme only if it doesn't create cross-scheme hierarchical
-            # relationships
-            rel_schemes = (
-                await self.graph.known_concept_schemes_for_concept_hierarchical_relationships(
-                    concept.id_
-                )
-            )
-            if missing := set(rel_schemes).difference(new_schemes):
-                raise RelationshipsInCurrentConceptScheme(
-                    f"Update asked to change concept schemes, but existing concept scheme {missing} had hierarchical relationships."
+        async with self.unit_of_work():
+            await self._concept_refers_to_concept_scheme_in_database(concept)
+
+            if concept.top_concept_of:
+                await self._check_top_concept(concept)
+
+            current = await self.graph.concept_get(concept.id_)
+            current_schemes = {cs["@id"] for cs in current.schemes}
+            new_schemes = {cs["@id"] for cs in concept.schemes}
+            if current_schemes.difference(new_schemes):
+                # Can remove a ConceptScheme only if it doesn't create cross-scheme hierarchical
+                # relationships
+                rel_schemes = (
+                    await self.graph.known_concept_schemes_for_concept_hierarchical_relationships(
+                        concept.id_
+                    )
                 )
-        concept = await self.graph.concept_update(concept=concept)
+                if missing := set(rel_schemes).difference(new_schemes):
+                    raise RelationshipsInCurrentConceptScheme(
+                        f"Update asked to change concept schemes, but existing concept scheme {missing} had hierarchical relationships."
+                    )
+            concept = await self.graph.concept_update(concept=concept)
+            if self._index_later():
+                await self.graph.search_outbox_add([concept.id_])
 
-        if self.search.is_configured():
-            await self.search.update_concept(concept)
+        if self.search.is_configured() and not self.search_outbox:
+            await self.search.update_concept(concept, await self._hierarchy(concept.id_))
 
         return concept
 
     async def concept_delete(self, iri: str) -> None:
-        rowcount = await self.graph.concept_delete(iri=iri)
-        if not rowcount:
-            raise ConceptNotFoundError(f"Concept with IRI `{iri}` not found")
-
-        if self.search.is_configured():
+        async with self.unit_of_work():
+            # Narrower concepts can't be found once this concept is gone
+            affected = await self._descendants_affected(iri)
+            rowcount = await self.graph.concept_delete(iri=iri)
+            if not rowcount:
+                raise ConceptNotFoundError(f"Concept with IRI `{iri}` not found")
+            if self._index_later():
+                await self.graph.search_outbox_add([iri])
+
+        if self.search.is_configured() and not self.search_outbox:
             await self.search.delete_concept(iri)
+            if affected:
+                await self.search_refresh(affected)
 
         return
 
+    async def bulk_import(
+        self,
+        concept_schemes: list[ConceptScheme],
+        concepts: list[Concept],
+        relationships: list[Relationship],
+        batch_size: int = 1000,
+    ) -> ImportResult:
+        """Import many objects in one transaction; nothing is written if any check fails.
+
+        Checks are done on the whole import at once instead of per object. Concepts and
+        relationships are written with multi-row inserts of `batch_size` rows."""
+        if duplicates := [
+            iri
+            for iri, count in Counter(obj.id_ for obj in concept_schemes + concepts).items()
+            if count > 1
+        ]:
+            raise DuplicateIRI(f"IRIs given more than once in import: {sorted(duplicates)}")
+
+        broader_sources = {
+            rel.source for rel in relationships if rel.predicate == RelationshipVerbs.broader
+        }
+        for concept in concepts:
+            if concept.top_concept_of and concept.id_ in broader_sources:
+                raise HierarchyConflict(
+                    f"Concept `{concept.id_}` is marked as `topConceptOf` but also has broader relationship"
+                )
+
+        async with self.unit_of_work():
+            for concept_scheme in concept_schemes:
+                await self.graph.concept_scheme_create(concept_scheme=concept_scheme)
+
+            known_schemes = set(await self.concept_scheme_get_all_iris())
+            for concept in concepts:
+                if not known_schemes.intersection(cs["@id"] for cs in concept.schemes):
+                    raise ConceptSchemesNotInDatabase(
+                        f"Concept `{concept.id_}` must be in at least one concept scheme in the database"
+                    )
+
+            for batch in batched(concepts, batch_size):
+                await self.graph.concept_create_many(list(batch))
+            for batch in batched(relationships, batch_size):
+                await self._relationships_create(list(batch))
+            if self._index_later():
+                await self.graph.search_outbox_add([concept.id_ for concept in concepts])
+
+        if self.search.is_configured() and not self.search_outbox:
+            hierarchies = await self.graph.concept_search_hierarchy(
+                [concept.id_ for concept in concepts]
+            )
+            await self.search.create_concepts(concepts, hierarchies=hierarchies)
+
+        return ImportResult(
+            concept_schemes=len(concept_schemes),
+            concepts=len(concepts),
+            relationships=len(relationships),
+        )
+
     async def concept_get_all(
-        self, concept_scheme_iri: str | None = None, top_concepts_only: bool = False
+        self,
+        concept_scheme_iri: str | None = None,
+        top_concepts_only: bool = False,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Concept]:
         """Get all concepts that belong to a given concept scheme."""
         return await self.graph.concept_get_all(
             concept_scheme_iri=concept_scheme_iri,
             top_concepts_only=top_concepts_only,
+            limit=limit,
+            after=after,
+        )
+
+    def concept_stream_all(
+        self,
+        concept_scheme_iri: str | None = None,
+        top_concepts_only: bool = False,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Concept]:
+        """Like `concept_get_all`, but yields concepts without loading them all into memory."""
+        return self.graph.concept_stream_all(
+            concept_scheme_iri=concept_scheme_iri,
+            top_concepts_only=top_concepts_only,
+            limit=limit,
+            after=after,
         )
 
     # Concept Scheme
@@ -146,8 +320,15 @@ class GraphService:
     async def concept_scheme_get_all_iris(self) -> list[str]:
         return await self.graph.concept_scheme_get_all_iris()
 
-    async def concept_scheme_get_all(self) -> list[ConceptScheme]:
-        return await self.graph.concept_scheme_get_all()
+    async def concept_scheme_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[ConceptScheme]:
+        return await self.graph.concept_scheme_get_all(limit=limit, after=after)
+
+    def concept_scheme_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[ConceptScheme]:
+        return self.graph.concept_scheme_stream_all(limit=limit, after=after)
 
     async def concept_scheme_create(self, concept_scheme: ConceptScheme) -> ConceptScheme:
         return await self.graph.concept_scheme_create(concept_scheme=concept_scheme)
@@ -175,39 +356,113 @@ class GraphService:
     async def _relationships_check_source_target_share_known_concept_scheme(
         self, relationships: list[Relationship]
     ) -> None:
-        for rel in relationships:
-            if rel.predicate in SKOS_HIERARCHICAL_RELATIONSHIP_PREDICATES and not (
-                await self.graph.relationship_source_target_share_known_concept_scheme(rel)
-            ):
-                raise HierarchicRelationshipAcrossConceptScheme(
-                    f"Hierarchical relationship between `{rel.source}` and `{rel.target}` crosses Concept Schemes. Use an associative relationship like `skos:broadMatch` instead."
+        hierarchical = [
+            rel
+            for rel in relationships
+            if rel.predicate in SKOS_HIERARCHICAL_RELATIONSHIP_PREDICATES
+        ]
+        if not hierarchical:
+            return
+        if crossing := await self.graph.relationships_crossing_concept_schemes(hierarchical):
+            raise HierarchicRelationshipAcrossConceptScheme(
+                " ".join(
+                    f"Hierarchical relationship between `{rel.source}` and `{rel.target}` crosses Concept Schemes."
+                    for rel in crossing
                 )
+                + " Use an associative relationship like `skos:broadMatch` instead."
+            )
+
+    async def _hierarchy(self, iri: str) -> SearchHierarchy:
+        return (await self.graph.concept_search_hierarchy([iri]))[iri]
+
+    async def _hierarchy_affected(self, relationships: list[Relationship]) -> list[str]:
+        """Concepts whose `SearchHierarchy` changes when `relationships` are added or removed.
+
+        These are the sources of `broader` relationships and all their descendants. They are
+        queued in the search outbox if it is used, otherwise returned for `search_refresh`."""
+        if not self.search.is_configured():
+            return []
+        sources = {
+            rel.source for rel in relationships if rel.predicate == RelationshipVerbs.broader
+        }
+        if not sources:
+            return []
+        iris = sources.union(await self.graph.concept_descendant_iris(sorted(sources)))
+        if self._index_later():
+            await self.graph.search_outbox_add(sorted(iris))
+            return []
+        return sorted(iris)
+
+    async def _descendants_affected(self, iri: str) -> list[str]:
+        """Narrower concepts of `iri`, whose `SearchHierarchy` changes when `iri` is created or
+        deleted. Queued or returned like in `_hierarchy_affected`."""
+        if not self.search.is_configured():
+            return []
+        if not (iris := await self.graph.concept_descendant_iris([iri])):
+            return []
+        if self._index_later():
+            await self.graph.search_outbox_add(iris)
+            return []
+        return iris
 
     async def relationships_create(self, relationships: list[Relationship]) -> list[Relationship]:
-        concept_schemes = await self.concept_scheme_get_all_iris()
-        for rel in relationships:
-            if rel.source in concept_schemes:
-                raise RelationshipsReferencesConceptScheme(
-                    f"Relationship `{rel}` source refers to concept scheme `{rel.source}`"
-                )
-            if rel.target in concept_schemes:
-                raise RelationshipsReferencesConceptScheme(
-                    f"Relationship `{rel}` target refers to concept scheme `{rel.target}`"
-                )
+        async with self.unit_of_work():
+            created = await self._relationships_create(relationships)
+            affected = await self._hierarchy_affected(relationships)
+        if affected:
+            await self.search_refresh(affected)
+        return created
+
+    async def _relationships_create(self, relationships: list[Relationship]) -> list[Relationship]:
+        async with self.unit_of_work():
+            concept_schemes = await self.concept_scheme_get_all_iris()
+            for rel in relationships:
+                if rel.source in concept_schemes:
+                    raise RelationshipsReferencesConceptScheme(
+                        f"Relationship `{rel}` source refers to concept scheme `{rel.source}`"
+                    )
+                if rel.target in concept_schemes:
+                    raise RelationshipsReferencesConceptScheme(
+                        f"Relationship `{rel}` target refers to concept scheme `{rel.target}`"
+                    )
 
-        await self._relationships_check_source_target_share_known_concept_scheme(relationships)
-        return await self.graph.relationships_create(relationships)
+            await self._relationships_check_source_target_share_known_concept_scheme(relationships)
+            return await self.graph.relationships_create(relationships)
 
     async def relationships_delete(self, relationships: list[Relationship]) -> int:
-        return await self.graph.relationships_delete(relationships)
+        async with self.unit_of_work():
+            count = await self.graph.relationships_delete(relationships)
+            affected = await self._hierarchy_affected(relationships)
+        if affected:
+            await self.search_refresh(affected)
+        return count
+
+    async def relationships_delete_for_concept_scheme(
+        self, concept_scheme_iri: str, predicate: RelationshipVerbs | None = None
+    ) -> int:
+        async with self.unit_of_work():
+            deleted = await self.graph.relationships_delete_for_concept_scheme(
+                concept_scheme_iri=concept_scheme_iri, predicate=predicate
+            )
+            affected = await self._hierarchy_affected(deleted)
+        if affected:
+            await self.search_refresh(affected)
+        return len(deleted)
 
     # Correspondence
 
     async def correspondence_get(self, iri: str) -> Correspondence:
         return await self.graph.correspondence_get(iri=iri)
 
-    async def correspondence_get_all(self) -> list[Correspondence]:
-        return await self.graph.correspondence_get_all()
+    async def correspondence_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[Correspondence]:
+        return await self.graph.correspondence_get_all(limit=limit, after=after)
+
+    def correspondence_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[Correspondence]:
+        return self.graph.correspondence_stream_all(limit=limit, after=after)
 
     async def correspondence_create(self, correspondence: Correspondence) -> Correspondence:
         return await self.graph.correspondence_create(correspondence=correspondence)
@@ -238,12 +493,34 @@ class GraphService:
         source_concept_iri: str | None = None,
         target_concept_iri: str | None = None,
         kind: AssociationKind | None = None,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Association]:
         return await self.graph.association_get_all(
             correspondence_iri=correspondence_iri,
             source_concept_iri=source_concept_iri,
             target_concept_iri=target_concept_iri,
             kind=kind,
+            limit=limit,
+            after=after,
+        )
+
+    def association_stream_all(
+        self,
+        correspondence_iri: str | None = None,
+        source_concept_iri: str | None = None,
+        target_concept_iri: str | None = None,
+        kind: AssociationKind | None = None,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Association]:
+        return self.graph.association_stream_all(
+            correspondence_iri=correspondence_iri,
+            source_concept_iri=source_concept_iri,
+            target_concept_iri=target_concept_iri,
+            kind=kind,
+            limit=limit,
+            after=after,
         )
 
     async def association_create(self, association: Association) -> Association:
@@ -254,3 +531,98 @@ class GraphService:
         if not rowcount:
             raise AssociationNotFoundError(f"Association with IRI `{iri}` not found")
         return
+
+    # Change log
+
+    async def changes_get(self, since: int = 0, limit: int | None = None) -> list[Change]:
+        return await self.graph.changes_get(since=since, limit=limit)
+
+    def changes_stream(self, since: int = 0, limit: int | None = None) -> AsyncIterator[Change]:
+        return self.graph.changes_stream(since=since, limit=limit)
+
+    async def changes_last_sequence(self) -> int:
+        return await self.graph.changes_last_sequence()
+
+    # Search
+
+    async def search_reindex(
+        self, batch_size: int | None = None, concurrency: int = 4
+    ) -> ReindexResult:
+        """Rebuild the search collections from all concepts in the graph database"""
+        concepts = self.graph.concept_stream_all(concept_scheme_iri=None, top_concepts_only=False)
+        return await self.search.reindex(
+            concepts,
+            batch_size=batch_size,
+            concurrency=concurrency,
+            hierarchy=self.graph.concept_search_hierarchy,
+        )
+
+    async def search_refresh(self, iris: list[str]) -> None:
+        """Index the concepts `iris` as they are now, removing deleted concepts from the index.
+
+        Reads skip the graph read cache, which can be behind writes by other workers. A subtree
+        can be large, so this goes in batches of `PyST_typesense_import_batch_size`."""
+        # `CachedKOSGraphDatabase` wraps the uncached graph as `graph`
+        graph = getattr(self.graph, "graph", self.graph)
+        for batch in batched(sorted(set(iris)), get_settings().typesense_import_batch_size):
+            concepts = await graph.concept_get_many(list(batch))
+            await self.search.index_concepts(
+                list(concepts.values()),
+                [iri for iri in batch if iri not in concepts],
+                hierarchies=await graph.concept_search_hierarchy(list(concepts)),
+            )
+
+    async def search_outbox_process(self, batch_size: int = 100) -> int:
+        """Index one batch of concepts from the search outbox, and return the batch size.
+
+        Each concept is indexed as it is now in the database, or removed from the index if it
+        was deleted, so the order of outbox items doesn't matter. The claim is committed before
+        indexing, so no database locks are held while the search engine is called. If the batch
+        fails, its concepts are indexed one at a time, and only the failed ones are retried, with
+        exponential backoff; after `SEARCH_OUTBOX_MAX_ATTEMPTS` attempts they are left in the
+        outbox for inspection."""
+        items = await self.graph.search_outbox_claim(
+            limit=batch_size, lease=SEARCH_OUTBOX_LEASE, max_attempts=SEARCH_OUTBOX_MAX_ATTEMPTS
+        )
+        if not items:
+            return 0
+        iris = sorted({item.iri for item in items})
+        failed = set()
+        try:
+            await self.search_refresh(iris)
+        except Exception as exc:
+            logger.warning(
+                "Search indexing of %s concepts failed (%s); indexing them one at a time",
+                len(iris),
+                exc,
+            )
+            for iri in iris:
+                try:
+                    await self.search_refresh([iri])
+                except Exception:
+                    failed.add(iri)
+
+        if done := [item.id_ for item in items if item.iri not in failed]:
+            await self.graph.search_outbox_complete(done)
+        if not failed:
+            return len(items)
+        retry = [item for item in items if item.iri in failed]
+        attempts = max(item.attempts for item in retry)
+        delay = min(SEARCH_OUTBOX_BACKOFF * 2 ** (attempts - 1), SEARCH_OUTBOX_MAX_BACKOFF)
+        await self.graph.search_outbox_retry([item.id_ for item in retry], delay)
+        if dead := sorted(
+            {item.iri for item in retry if item.attempts >= SEARCH_OUTBOX_MAX_ATTEMPTS}
+        ):
+            logger.error(
+                "Giving up on search indexing of %s concepts after %s attempts: %s",
+                len(dead),
+                SEARCH_OUTBOX_MAX_ATTEMPTS,
+                dead,
+            )
+        else:
+            logger.warning(
+                "Search indexing of %s concepts failed; retrying in %s seconds",
+                len(failed),
+                delay,
+            )
+        return 0
@@ -0,0 +1,25 @@
+import asyncio
+
+import structlog
+
+from py_semantic_taxonomy.domain.ports import GraphService
+
+logger = structlog.get_logger("py-semantic-taxonomy")
+
+
+async def run_search_outbox(
+    service: GraphService, batch_size: int = 100, poll_interval: float = 1
+) -> None:
+    """Index concepts queued in the search outbox, until cancelled.
+
+    Full batches are followed immediately by the next one; otherwise wait `poll_interval`
+    seconds before checking for new work."""
+    logger.info("Starting search outbox worker")
+    while True:
+        try:
+            count = await service.search_outbox_process(batch_size=batch_size)
+        except Exception:
+            logger.exception("Search outbox worker failed to process a batch")
+            count = 0
+        if count < batch_size:
+            await asyncio.sleep(poll_interval)
@@ -1,14 +1,26 @@
+import asyncio
+import time
+from itertools import batched
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+from uuid import uuid4
+
 import structlog
 
 from py_semantic_taxonomy.cfg import get_settings
 from py_semantic_taxonomy.dependencies import get_search_engine
+from py_semantic_taxonomy.domain.constants import SEARCH_PER_PAGE
 from py_semantic_taxonomy.domain.entities import (
+    CacheStats,
     Concept,
+    ReindexResult,
+    SearchFilter,
+    SearchHierarchy,
     SearchNotConfigured,
+    SearchQuery,
     SearchResult,
     UnknownLanguage,
 )
-from py_semantic_taxonomy.domain.hash_utils import hash_fnv64
+from py_semantic_taxonomy.domain.hash_utils import hash_fnv64, hash_fnv64_many
 from py_semantic_taxonomy.domain.ports import SearchEngine
 
 logger = structlog.get_logger("py-semantic-taxonomy")
@@ -21,6 +33,18 @@ def c(language: str, prefix: str = "") -> str:
         return f"pyst-concepts-{language}"
 
 
+async def abatched(iterator: AsyncIterator, n: int) -> AsyncIterator[list]:
+    """Like `itertools.batched`, for async iterators"""
+    batch = []
+    async for item in iterator:
+        batch.append(item)
+        if len(batch) == n:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 class SearchService:
     def __init__(self, engine: SearchEngine | None = None):
         self.settings = get_settings()
@@ -28,6 +52,16 @@ class SearchService:
             lang: c(lang, self.settings.typesense_prefix) for lang in self.settings.languages
         }
 
+        if self.settings.search_backend in ("local", "postgres"):
+            self.engine = engine or get_search_engine()
+            self.configured = True
+            logger.info(
+                "Using %s search engine for languages: %s",
+                self.settings.search_backend,
+                ",".join(self.languages),
+            )
+            return
+
         if self.settings.typesense_url == "missing" or not self.settings.typesense_url:
             self.configured = False
             logger.warning("Typesense not configured; search functionality won't work.")
@@ -43,6 +77,10 @@ class SearchService:
     def is_configured(self) -> bool:
         return self.configured
 
+    def cache_stats(self) -> CacheStats | None:
+        """Hit and miss counters if search results are cached, otherwise `None`"""
+        return self.engine.cache_stats() if self.is_configured() else None
+
     async def initialize(self) -> None:
         if not self.is_configured():
             raise SearchNotConfigured
@@ -55,34 +93,116 @@ class SearchService:
 
         await self.engine.reset()
 
-    async def create_concept(self, concept: Concept) -> None:
+    def _include(self, dct: dict) -> bool:
+        return not self.settings.typesense_exclude_if_missing_for_language or bool(
+            dct["pref_label"]
+        )
+
+    async def create_concept(
+        self, concept: Concept, hierarchy: SearchHierarchy | None = None
+    ) -> None:
+        if not self.is_configured():
+            raise SearchNotConfigured
+
+        # One request per language, so send them concurrently
+        await asyncio.gather(
+            *[
+                self.engine.create_concept(dct, collection)
+                for language, collection in self.languages.items()
+                if self._include(dct := concept.to_search_dict(language, hierarchy))
+            ]
+        )
+
+    def _search_dicts(
+        self,
+        concepts: Iterable[Concept],
+        language: str,
+        hierarchies: dict[str, SearchHierarchy] | None,
+    ) -> list[dict]:
+        hierarchies = hierarchies or {}
+        dcts = [
+            concept.to_search_dict(language, hierarchies.get(concept.id_)) for concept in concepts
+        ]
+        return [dct for dct in dcts if self._include(dct)]
+
+    async def create_concepts(
+        self,
+        concepts: list[Concept],
+        batch_size: int | None = None,
+        hierarchies: dict[str, SearchHierarchy] | None = None,
+    ) -> None:
+        """Index many concepts with Typesense bulk imports of up to `batch_size` documents"""
         if not self.is_configured():
             raise SearchNotConfigured
 
-        for language, collection in self.languages.items():
-            dct = concept.to_search_dict(language)
-            if not (self.settings.typesense_exclude_if_missing_for_language) or dct["pref_label"]:
-                await self.engine.create_concept(dct, collection)
+        batch_size = batch_size or self.settings.typesense_import_batch_size
+        for batch in batched(concepts, batch_size):
+            requests = []
+            for language, collection in self.languages.items():
+                if dcts := self._search_dicts(batch, language, hierarchies):
+                    requests.append(self.engine.create_concepts(dcts, collection))
+            await asyncio.gather(*requests)
 
-    async def update_concept(self, concept: Concept) -> None:
+    async def update_concept(
+        self, concept: Concept, hierarchy: SearchHierarchy | None = None
+    ) -> None:
         if not self.is_configured():
             raise SearchNotConfigured
 
-        for language, collection in self.languages.items():
-            dct = concept.to_search_dict(language)
-            if not (self.settings.typesense_exclude_if_missing_for_language) or dct["pref_label"]:
-                await self.engine.update_concept(dct, collection)
+        await asyncio.gather(
+            *[
+                self.engine.update_concept(dct, collection)
+                for language, collection in self.languages.items()
+                if self._include(dct := concept.to_search_dict(language, hierarchy))
+            ]
+        )
 
     async def delete_concept(self, iri: str) -> None:
         if not self.is_configured():
             raise SearchNotConfigured
 
-        for collection in self.languages.values():
-            await self.engine.delete_concept(hash_fnv64(iri), collection)
+        await asyncio.gather(
+            *[
+                self.engine.delete_concept(hash_fnv64(iri), collection)
+                for collection in self.languages.values()
+            ]
+        )
+
+    async def index_concepts(
+        self,
+        concepts: list[Concept],
+        removed: list[str],
+        hierarchies: dict[str, SearchHierarchy] | None = None,
+    ) -> None:
+        """Replace the documents of `concepts`, and delete the documents of the `removed` IRIs"""
+        if not self.is_configured():
+            raise SearchNotConfigured
+
+        ids = hash_fnv64_many([concept.id_ for concept in concepts] + removed)
+
+        async def index(language: str, collection: str) -> None:
+            if ids:
+                await self.engine.delete_concepts(ids, collection)
+            if dcts := self._search_dicts(concepts, language, hierarchies):
+                await self.engine.create_concepts(dcts, collection)
+
+        await asyncio.gather(
+            *[index(language, collection) for language, collection in self.languages.items()]
+        )
 
     async def search(
-        self, query: str, language: str, semantic: bool = True, prefix: bool = False
+        self,
+        query: str,
+        language: str,
+        semantic: bool = True,
+        prefix: bool = False,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
     ) -> list[SearchResult]:
+        """One page of results, optionally filtered by concept scheme, top concept, or depth.
+
+        Among equally good matches, concepts higher up in the hierarchy come first."""
         if not self.is_configured():
             raise SearchNotConfigured
 
@@ -93,8 +213,117 @@ class SearchService:
             semantic = False
 
         return await self.engine.search(
-            query=query, collection=self.languages[language], semantic=semantic, prefix=prefix
+            query=query,
+            collection=self.languages[language],
+            semantic=semantic,
+            prefix=prefix,
+            filters=filters,
+            page=page,
+            per_page=per_page,
+        )
+
+    async def suggest(
+        self,
+        query: str,
+        language: str,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[SearchResult]:
+        return await self.search(
+            query=query,
+            language=language,
+            prefix=True,
+            filters=filters,
+            page=page,
+            per_page=per_page,
         )
 
-    async def suggest(self, query: str, language: str) -> list[SearchResult]:
-        return await self.search(query=query, language=language, prefix=True)
+    async def search_many(self, queries: list[SearchQuery]) -> list[list[SearchResult]]:
+        """Results for each query, in order, with as few search engine requests as possible"""
+        if not self.is_configured():
+            raise SearchNotConfigured
+
+        if any(query.language not in self.languages for query in queries):
+            raise UnknownLanguage
+        if not queries:
+            return []
+
+        return await self.engine.search_many(
+            [
+                {
+                    "query": query.query,
+                    "collection": self.languages[query.language],
+                    # Prefix search is never semantic, see `search`
+                    "semantic": query.semantic and not query.prefix,
+                    "prefix": query.prefix,
+                    "filters": query.filters,
+                    "page": query.page,
+                    "per_page": query.per_page,
+                }
+                for query in queries
+            ]
+        )
+
+    async def reindex(
+        self,
+        concepts: AsyncIterator[Concept],
+        batch_size: int | None = None,
+        concurrency: int = 4,
+        hierarchy: Callable[[list[str]], Awaitable[dict[str, SearchHierarchy]]] | None = None,
+    ) -> ReindexResult:
+        """Index `concepts` into new collections, then point the usual collection names at them.
+
+        Searches keep using the old collections until the aliases are swapped, and the old
+        collections are deleted afterwards. At most `concurrency` bulk imports run at once.
+        `hierarchy` looks up the `SearchHierarchy` of each batch of concepts."""
+        if not self.is_configured():
+            raise SearchNotConfigured
+
+        batch_size = batch_size or self.settings.typesense_import_batch_size
+        # Unique, so a concurrent or quick second reindex can't reuse the live collections
+        suffix = uuid4().hex
+        targets = {language: f"{alias}-{suffix}" for language, alias in self.languages.items()}
+        created = []
+
+        start, count = time.perf_counter(), 0
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def import_batch(dcts: list[dict], collection: str) -> None:
+            try:
+                await self.engine.create_concepts(dcts, collection)
+            finally:
+                semaphore.release()
+
+        try:
+            for collection in targets.values():
+                await self.engine.create_collection(collection)
+                created.append(collection)
+            async with asyncio.TaskGroup() as group:
+                async for batch in abatched(concepts, batch_size):
+                    hierarchies = (
+                        await hierarchy([concept.id_ for concept in batch]) if hierarchy else None
+                    )
+                    for language, collection in targets.items():
+                        if dcts := self._search_dicts(batch, language, hierarchies):
+                            await semaphore.acquire()
+                            group.create_task(import_batch(dcts, collection))
+                    count += len(batch)
+                    logger.info(
+                        "Queued %s concepts for reindexing (%.0f concepts/second)",
+                        count,
+                        count / (time.perf_counter() - start),
+                    )
+        except BaseException:
+            for collection in created:
+                await self.engine.delete_collection(collection)
+            raise
+
+        for language, collection in targets.items():
+            previous = await self.engine.swap_alias(self.languages[language], collection)
+            if previous is not None and previous != collection:
+                await self.engine.delete_collection(previous)
+
+        elapsed = time.perf_counter() - start
+        logger.info("Reindexed %s concepts in %.1f seconds", count, elapsed)
+        return ReindexResult(concepts=count, seconds=elapsed, collections=list(targets.values()))
@@ -0,0 +1,85 @@
+import asyncio
+from contextlib import suppress
+
+import structlog
+
+from py_semantic_taxonomy.domain.constants import RelationshipVerbs
+from py_semantic_taxonomy.domain.entities import Change, ChangeEvent
+from py_semantic_taxonomy.domain.ports import GraphService
+
+logger = structlog.get_logger("py-semantic-taxonomy")
+
+
+class SearchIndexSync:
+    """Keep this worker's in-process search index up to date with changes by other workers.
+
+    `on_change` is the callback for `listen_for_changes`. Notifications only wake up `run`, which
+    reads the change log after `since` and refreshes the changed concepts, one page of changes at
+    a time, so changes to many objects at once and changes missed while disconnected need no
+    rebuild of the whole index. A changed relationship can move its source in the hierarchy, so
+    the source and all its descendants are refreshed; the same goes for created and deleted
+    concepts. A change can become visible in the change log after its notification, so the log
+    is also read every `poll_interval` seconds."""
+
+    def __init__(
+        self,
+        service: GraphService,
+        since: int,
+        poll_interval: float = 5,
+        batch_size: int = 1000,
+    ):
+        self.service = service
+        # Sequence number of the last change applied to the index
+        self.since = since
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.changed = asyncio.Event()
+
+    def on_change(self, event: ChangeEvent | None) -> None:
+        self.changed.set()
+
+    async def run(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self.changed.wait(), self.poll_interval)
+            self.changed.clear()
+            try:
+                while await self.apply_changes():
+                    pass
+            except Exception:
+                logger.exception("Failed to update the local search index")
+
+    async def apply_changes(self) -> bool:
+        """Apply one page of changes, and return whether there could be more"""
+        changes = await self.service.changes_get(since=self.since, limit=self.batch_size)
+        if not changes:
+            return False
+        await self.refresh(changes)
+        # Only move on once the page is applied, so failed pages are retried
+        self.since = changes[-1].sequence
+        return len(changes) == self.batch_size
+
+    async def refresh(self, changes: list[Change]) -> None:
+        iris, moved, deleted = set(), set(), set()
+        for change in changes:
+            if change.kind == "relationship" or (
+                change.kind == "concept" and change.operation == "create"
+            ):
+                moved.add(change.iri)
+            elif change.kind == "concept" and change.operation == "delete":
+                deleted.add(change.iri)
+            elif change.kind == "concept":
+                iris.add(change.iri)
+        iris.update(deleted)
+        for iri in sorted(deleted):
+            # Relationships are kept when a concept is deleted
+            narrower = await self.service.relationships_get(
+                iri, source=False, target=True, verb=RelationshipVerbs.broader
+            )
+            moved.update(rel.source for rel in narrower)
+        if moved:
+            moved = sorted(moved)
+            descendants = await self.service.concept_descendant_iris(moved)
+            iris.update(moved, descendants)
+        if iris:
+            await self.service.search_refresh(sorted(iris))
@@ -10,14 +10,41 @@ class Settings(BaseSettings):
     db_host: str = "localhost"
     db_port: int = 5432
     db_name: str = "PyST"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    # Seconds; -1 disables recycling
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    hierarchy_closure: bool = False
+    # Number of cached graph database reads per worker; 0 disables the cache
+    cache_maxsize: int = 0
+    # Seconds
+    cache_ttl: float = 300
 
     auth_token: str = "missing"
+    # Write read responses straight to JSON instead of validating them into response models
+    fast_json: bool = False
 
+    # "typesense", "postgres" for full text search in the graph database, or "local" for the
+    # built-in in-memory search engine
+    search_backend: str = "typesense"
     typesense_url: str = "missing"
     typesense_api_key: str = "missing"
     typesense_embedding_model: str = "ts/all-MiniLM-L12-v2"
     typesense_exclude_if_missing_for_language: bool = True
     typesense_prefix: str = ""
+    # Documents per Typesense bulk import request
+    typesense_import_batch_size: int = 1000
+    # Number of cached search results per worker; 0 disables the cache
+    search_cache_maxsize: int = 0
+    # Seconds
+    search_cache_ttl: float = 60
+    # Index concepts from a background worker instead of during the request
+    search_outbox: bool = False
+    search_outbox_batch_size: int = 100
+    # Seconds between checks for new work when the outbox is empty
+    search_outbox_poll_interval: float = 1
 
     languages: list[str] = ["en", "de", "es", "fr", "pt", "it", "da"]
 
@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from py_semantic_taxonomy.adapters.persistence.database import init_db
+from py_semantic_taxonomy.adapters.routers.bulk_import import (
+    IMPORT_FORMATS,
+    ImportValidationError,
+    load_objects,
+    parse_objects,
+)
+from py_semantic_taxonomy.dependencies import get_engine, get_graph_service, get_search_service
+
+
+async def _setup() -> None:
+    await init_db(get_engine())
+    search = get_search_service()
+    if search.configured:
+        await search.initialize()
+
+
+async def import_file(path: Path, format: str, batch_size: int) -> int:
+    start = time.perf_counter()
+    try:
+        concept_schemes, concepts, relationships = parse_objects(
+            load_objects(path.read_bytes(), format)
+        )
+    except ImportValidationError as err:
+        for error in err.errors:
+            print(f"{error['@id']}: {error['errors']}", file=sys.stderr)
+        print(f"Import aborted: {err}", file=sys.stderr)
+        return 1
+
+    await _setup()
+    try:
+        result = await get_graph_service().bulk_import(
+            concept_schemes=concept_schemes,
+            concepts=concepts,
+            relationships=relationships,
+            batch_size=batch_size,
+        )
+    except Exception as err:
+        print(f"Import aborted: {type(err).__name__}: {err}", file=sys.stderr)
+        return 1
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Imported {result.concept_schemes} concept schemes, {result.concepts} concepts, and "
+        f"{result.relationships} relationships in {elapsed:.1f} seconds "
+        f"({result.concepts / elapsed:.0f} concepts/second)"
+    )
+    return 0
+
+
+async def rebuild_closure() -> int:
+    start = time.perf_counter()
+    await _setup()
+    count = await get_graph_service().closure_rebuild()
+    print(
+        f"Rebuilt hierarchy closure with {count} rows in {time.perf_counter() - start:.1f} seconds"
+    )
+    return 0
+
+
+async def reindex(batch_size: int | None, concurrency: int) -> int:
+    await init_db(get_engine())
+    if not get_search_service().configured:
+        print("Reindex aborted: Search is not configured", file=sys.stderr)
+        return 1
+    result = await get_graph_service().search_reindex(
+        batch_size=batch_size, concurrency=concurrency
+    )
+    print(
+        f"Reindexed {result.concepts} concepts into {len(result.collections)} collections in "
+        f"{result.seconds:.1f} seconds ({result.concepts / result.seconds:.0f} concepts/second)"
+    )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="pyst", description="PyST administration commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser(
+        "import", help="Bulk import concept schemes and concepts from a JSON-LD or Turtle file"
+    )
+    importer.add_argument("path", type=Path)
+    importer.add_argument(
+        "--format",
+        choices=IMPORT_FORMATS,
+        help="Input format; inferred from the file extension if not given",
+    )
+    importer.add_argument("--batch-size", type=int, default=1000, help="Rows per database insert")
+
+    commands.add_parser(
+        "rebuild-closure", help="Rebuild the hierarchy closure table from all relationships"
+    )
+
+    reindexer = commands.add_parser(
+        "reindex", help="Rebuild the search collections from all concepts without downtime"
+    )
+    reindexer.add_argument(
+        "--batch-size", type=int, help="Concepts per Typesense bulk import request"
+    )
+    reindexer.add_argument(
+        "--concurrency", type=int, default=4, help="Bulk import requests sent at once"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "import":
+        format = args.format or ("turtle" if args.path.suffix == ".ttl" else "json-ld")
+        return asyncio.run(import_file(args.path, format, args.batch_size))
+    if args.command == "rebuild-closure":
+        return asyncio.run(rebuild_closure())
+    if args.command == "reindex":
+        return asyncio.run(reindex(args.batch_size, args.concurrency))
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,29 +1,69 @@
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from py_semantic_taxonomy.domain.ports import GraphService as GraphServiceProtocol
 from py_semantic_taxonomy.domain.ports import KOSGraphDatabase, SearchEngine
 from py_semantic_taxonomy.domain.ports import SearchService as SearchServiceProtocol
 
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> "AsyncEngine":
+    """The database engine, and so connection pool, shared by everything in this process"""
+    from py_semantic_taxonomy.adapters.persistence.database import create_engine
+
+    return create_engine()
+
 
 @lru_cache(maxsize=1)
 def get_kos_graph() -> KOSGraphDatabase:
     # Import inside function so we don't import any database-related stuff in tests
     from py_semantic_taxonomy.adapters.persistence.graph import PostgresKOSGraphDatabase
+    from py_semantic_taxonomy.cfg import get_settings
 
-    return PostgresKOSGraphDatabase()
+    settings = get_settings()
+    graph = PostgresKOSGraphDatabase(engine=get_engine())
+    if settings.cache_maxsize:
+        from py_semantic_taxonomy.adapters.persistence.cache import CachedKOSGraphDatabase
+
+        return CachedKOSGraphDatabase(graph, maxsize=settings.cache_maxsize, ttl=settings.cache_ttl)
+    return graph
 
 
 @lru_cache(maxsize=1)
 def get_search_engine() -> SearchEngine:
-    from py_semantic_taxonomy.adapters.persistence.search_engine import TypesenseSearchEngine
     from py_semantic_taxonomy.cfg import get_settings
 
     settings = get_settings()
-    return TypesenseSearchEngine(
-        url=settings.typesense_url,
-        api_key=settings.typesense_api_key,
-        embedding_model=settings.typesense_embedding_model,
-    )
+    if settings.search_backend == "local":
+        from py_semantic_taxonomy.adapters.persistence.local_search import LocalSearchEngine
+
+        return LocalSearchEngine()
+    elif settings.search_backend == "postgres":
+        from py_semantic_taxonomy.adapters.persistence.postgres_search import (
+            PostgresSearchEngine,
+        )
+
+        engine = PostgresSearchEngine(engine=get_engine())
+    else:
+        from py_semantic_taxonomy.adapters.persistence.search_engine import (
+            TypesenseSearchEngine,
+        )
+
+        engine = TypesenseSearchEngine(
+            url=settings.typesense_url,
+            api_key=settings.typesense_api_key,
+            embedding_model=settings.typesense_embedding_model,
+        )
+    if settings.search_cache_maxsize:
+        from py_semantic_taxonomy.adapters.persistence.cache import CachedSearchEngine
+
+        return CachedSearchEngine(
+            engine, maxsize=settings.search_cache_maxsize, ttl=settings.search_cache_ttl
+        )
+    return engine
 
 
 @lru_cache(maxsize=1)
@@ -23,6 +23,9 @@ SKOS_RELATIONSHIP_PREDICATES = SKOS_ASSOCIATE_RELATIONSHIP_PREDICATES.union(
     SKOS_HIERARCHICAL_RELATIONSHIP_PREDICATES
 )
 
+# Search results per page by default, and at most (the Typesense limit)
+SEARCH_PER_PAGE = 50
+SEARCH_MAX_PER_PAGE = 250
 
 RDF_MAPPING: dict[str, str] = {
     "id_": "@id",
@@ -73,10 +76,18 @@ class APIPaths(enum.StrEnum):
     concept_scheme = "/concept_schemes/{iri:path}"
     concept_scheme_all = "/concept_schemes/"
     relationship = "/relationships/"
+    relationship_concept_scheme = "/relationships/concept_scheme/"
     correspondence = "/correspondences/{iri:path}"
     correspondence_all = "/correspondences/"
     association = "/associations/{iri:path}"
     association_all = "/associations/"
     made_of = "/made_ofs/"
     search = "/concepts/search/"
+    search_batch = "/concepts/search/batch/"
+    search_reindex = "/search/reindex/"
+    bulk_import = "/import/"
     suggest = "/concepts/suggest/"
+    concept_descendants = "/concepts/descendants/"
+    concept_subtree = "/concepts/subtree/"
+    concept_tree = "/concepts/tree/"
+    changes = "/changes/"
@@ -1,10 +1,12 @@
 from copy import copy
 from dataclasses import asdict, dataclass, field, fields
 from datetime import datetime
+from functools import cache
 from urllib.parse import quote_plus, unquote
 
 from py_semantic_taxonomy.domain.constants import (
     RDF_MAPPING,
+    SEARCH_PER_PAGE,
     SKOS_RELATIONSHIP_PREDICATES,
     AssociationKind,
     RelationshipVerbs,
@@ -25,42 +27,52 @@ def select_language(objs: list[dict], language: str) -> str:
     return [obj for obj in objs if obj["@language"].lower().startswith(language.lower())]
 
 
+@cache
+def field_names(cls: type) -> tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+@cache
+def json_ld_keys(cls: type, fields_: frozenset[str] = frozenset()) -> tuple[tuple[str, str], ...]:
+    """`(attribute, JSON-LD key)` pairs of the `RDF_MAPPING` attributes of `cls`, in that order"""
+    class_fields = fields_ or set(field_names(cls)).difference({"extra"})
+    return tuple((attr, label) for attr, label in RDF_MAPPING.items() if attr in class_fields)
+
+
 # Allow mixing non-default and default values in dataclasses
 # See https://www.trueblade.com/blogs/news/python-3-10-new-dataclass-features
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Serializable:
     def to_db_dict(self) -> dict:
-        return asdict(self)
+        # Shallow, unlike `asdict`; the values are only read when building the statement
+        return {name: getattr(self, name) for name in field_names(type(self))}
 
-    def to_json_ld(self, fields_: list[str] = [], extra: bool = True) -> dict:
+    def to_json_ld(self, fields_: frozenset[str] = frozenset(), extra: bool = True) -> dict:
         """Return this data formatted as (but not serialized to) SKOS expanded JSON LD"""
-        class_fields = fields_ or {f.name for f in fields(self)}.difference({"extra"})
         dct = copy(self.extra) if extra else {}
-        for attr, label in RDF_MAPPING.items():
-            if attr not in class_fields:
-                continue
+        for attr, label in json_ld_keys(type(self), fields_):
             if value := getattr(self, attr):
                 dct[label] = value
 
         return dct
 
     @classmethod
-    def from_json_ld(cls, dict_: dict, fields_: list[str] = [], extra: bool = True) -> "SKOS":
-        source_dict, data = copy(dict_), {}
-        class_fields = fields_ or {f.name for f in fields(cls)}.difference({"extra"})
-        for dataclass_label, skos_label in RDF_MAPPING.items():
-            if dataclass_label in class_fields and skos_label in source_dict:
-                data[dataclass_label] = source_dict.pop(skos_label)
+    def from_json_ld(
+        cls, dict_: dict, fields_: frozenset[str] = frozenset(), extra: bool = True
+    ) -> "SKOS":
+        keys = json_ld_keys(cls, fields_)
+        data = {attr: dict_[label] for attr, label in keys if label in dict_}
         if extra:
+            labels = {label for _, label in keys}
             data["extra"] = {
                 key: value
-                for key, value in source_dict.items()
-                if key not in SKOS_RELATIONSHIP_PREDICATES
+                for key, value in dict_.items()
+                if key not in labels and key not in SKOS_RELATIONSHIP_PREDICATES
             }
         return cls(**data)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class SKOS(Serializable):
     id_: str
     types: list[str]
@@ -74,15 +86,15 @@ class SKOS(Serializable):
     extra: dict = field(default_factory=dict)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Concept(SKOS):
     schemes: list[dict]
     alt_labels: list[dict[str, str]] = field(default_factory=list)
     hidden_labels: list[dict[str, str]] = field(default_factory=list)
     top_concept_of: list[dict] = field(default_factory=list)
 
-    def to_search_dict(self, language: str) -> dict:
-        return {
+    def to_search_dict(self, language: str, hierarchy: "SearchHierarchy | None" = None) -> dict:
+        dct = {
             # Can't use URL as id, even if escaped:
             # https://github.com/typesense/typesense/issues/192
             "id": hash_fnv64(self.id_),
@@ -95,7 +107,12 @@ class Concept(SKOS):
             # Not language-specific
             "notation": " ".join([obj["@value"] for obj in self.notations]),
             "all_languages_pref_labels": [obj["@value"] for obj in self.pref_labels],
+            "concept_schemes": [obj["@id"] for obj in self.schemes],
         }
+        if hierarchy is not None:
+            dct["depth"] = hierarchy.depth
+            dct["top_concepts"] = hierarchy.top_concepts
+        return dct
 
     def filter_language(self, language: str) -> "Concept":
         SAME_FIELDS = (
@@ -119,7 +136,7 @@ class Concept(SKOS):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ConceptScheme(SKOS):
     created: list[datetime]
     creators: list[dict]
@@ -153,7 +170,7 @@ class Relationship:
     predicate: RelationshipVerbs
 
     def to_db_dict(self) -> dict:
-        return asdict(self)
+        return {name: getattr(self, name) for name in field_names(Relationship)}
 
     def to_json_ld(self) -> dict:
         """Return this data formatted as (but not serialized to) SKOS expanded JSON LD"""
@@ -192,26 +209,30 @@ class Relationship:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Correspondence(ConceptScheme):
     compares: list[dict]
     made_ofs: list[dict] = field(default_factory=list)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MadeOf(Serializable):
     id_: str
     made_ofs: list[dict]
 
     def to_json_ld(self) -> dict:
-        return super().to_json_ld(extra=False)
+        return Serializable.to_json_ld(self, extra=False)
 
     @classmethod
     def from_json_ld(cls, dict_: dict) -> "Association":
-        return super().from_json_ld(dict_=dict_, extra=False)
+        return super(MadeOf, cls).from_json_ld(dict_=dict_, extra=False)
+
+
+# Exclude `extra` from the JSON-LD of associations
+ASSOCIATION_FIELDS = frozenset({"id_", "types", "source_concepts", "target_concepts"})
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Association(Serializable):
     id_: str
     types: list[str]
@@ -226,21 +247,49 @@ class Association(Serializable):
         )
 
     def to_json_ld(self) -> dict:
-        # Exclude `extra`
-        return super().to_json_ld(fields_={"id_", "types", "source_concepts", "target_concepts"})
+        return Serializable.to_json_ld(self, fields_=ASSOCIATION_FIELDS)
 
     @classmethod
     def from_json_ld(cls, dict_: dict) -> "Association":
-        # Exclude `extra`
-        return super().from_json_ld(
-            dict_=dict_, fields_={"id_", "types", "source_concepts", "target_concepts"}
-        )
+        return super(Association, cls).from_json_ld(dict_=dict_, fields_=ASSOCIATION_FIELDS)
 
 
 # For type hinting
 GraphObject = Concept | ConceptScheme | Correspondence | Association
 
 
+@dataclass
+class SearchHierarchy:
+    """Position of a concept in the `broader` hierarchy, stored in its search documents.
+
+    `top_concepts` are the ancestors without broader concepts, and `depth` is the number of
+    `broader` steps to the furthest of them. Concepts without broader concepts are their own top
+    concept, with depth 0."""
+
+    depth: int
+    top_concepts: list[str]
+
+
+@dataclass(frozen=True)
+class SearchFilter:
+    """Restrict search results to one concept scheme, one top concept's subtree, or a depth"""
+
+    concept_scheme_iri: str | None = None
+    top_concept_iri: str | None = None
+    max_depth: int | None = None
+
+
+@dataclass
+class SearchQuery:
+    query: str
+    language: str
+    semantic: bool = True
+    prefix: bool = False
+    filters: SearchFilter | None = None
+    page: int = 1
+    per_page: int = SEARCH_PER_PAGE
+
+
 @dataclass
 class SearchResult:
     id_: str
@@ -266,6 +315,86 @@ class SearchResult:
         return asdict(self)
 
 
+@dataclass
+class HierarchyNode:
+    id_: str
+    depth: int
+    parent: str
+    pref_label: str | None = None
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits or self.misses else 0.0
+
+    def to_json(self) -> dict:
+        return asdict(self) | {"hit_ratio": self.hit_ratio}
+
+
+@dataclass
+class ChangeEvent:
+    kind: str
+    iri: str | None
+    operation: str
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class Change:
+    sequence: int
+    kind: str
+    iri: str
+    operation: str
+    data: dict
+    created: datetime
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class SearchOutboxItem:
+    id_: int
+    iri: str
+    attempts: int
+    available_at: datetime
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class ImportResult:
+    concept_schemes: int = 0
+    concepts: int = 0
+    relationships: int = 0
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class ReindexResult:
+    concepts: int
+    seconds: float
+    collections: list[str]
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+
 class NotFoundError(Exception):
     pass
 
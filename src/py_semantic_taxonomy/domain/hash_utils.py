@@ -30,24 +30,46 @@
 
 import base64
 import struct
+from functools import lru_cache
+from typing import Iterable
 
+FNV_OFFSET = 0xCBF29CE484222325
+FNV_PRIME = 0x100000001B3
+MASK = 0xFFFFFFFFFFFFFFFF
+PACK = struct.Struct("<Q").pack
+# Document IDs kept in memory; more than a default Typesense import batch, so other languages of
+# a batch don't hash its IRIs again
+DOCUMENT_ID_CACHE_SIZE = 16384
 
-def fnv64(data: bytes) -> int:
-    hash_ = 0xCBF29CE484222325
+
+def fnv64(data: bytes, hash_: int = FNV_OFFSET) -> int:
+    """FNV-1 hash of `data`. Pass the hash of a prefix as `hash_` to continue hashing from it."""
     for b in data:
-        hash_ *= 0x100000001B3
-        hash_ &= 0xFFFFFFFFFFFFFFFF
-        hash_ ^= b
+        hash_ = (hash_ * FNV_PRIME & MASK) ^ b
     return hash_
 
 
+@lru_cache(maxsize=1024)
+def _prefix_hash(prefix: bytes) -> int:
+    return fnv64(prefix)
+
+
+@lru_cache(maxsize=DOCUMENT_ID_CACHE_SIZE)
 def hash_fnv64(dn: str, salt: str = "abc123") -> str:
-    # Turn dn into bytes with a salt, dn is expected to be ascii data
-    data = salt.encode("ascii") + dn.encode("ascii")
-    # Hash data
-    hash_ = fnv64(data)
-    # Pack hash (int) into bytes
-    bhash = struct.pack("<Q", hash_)
+    """Search document ID for the IRI `dn`.
+
+    IRIs are hashed as UTF-8, which is the same as ASCII for ASCII IRIs, so their IDs didn't
+    change when non-ASCII IRIs were allowed. Each IRI is hashed once per language, so IDs are
+    cached. FNV hashes one byte at a time, so the hash of the salt plus the IRI namespace (up to
+    the last `/` or `#`) is cached too, and only the rest of each IRI is hashed."""
+    data = dn.encode("utf-8")
+    split = max(data.rfind(b"/"), data.rfind(b"#")) + 1
+    hash_ = fnv64(data[split:], _prefix_hash(salt.encode("utf-8") + data[:split]))
     # Encode in base64. There is always a padding "=" at the end, because the
     # hash is always 64bits long. We don't need it.
-    return base64.urlsafe_b64encode(bhash)[:-1].decode("ascii")
+    return base64.urlsafe_b64encode(PACK(hash_))[:-1].decode("ascii")
+
+
+def hash_fnv64_many(dns: Iterable[str], salt: str = "abc123") -> list[str]:
+    """`hash_fnv64` of each of `dns`, in order"""
+    return [hash_fnv64(dn, salt) for dn in dns]
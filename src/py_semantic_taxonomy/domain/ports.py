@@ -1,44 +1,107 @@
-from typing import Protocol, runtime_checkable
+from contextlib import AbstractAsyncContextManager
+from typing import AsyncIterator, Awaitable, Callable, Protocol, runtime_checkable
 
-from py_semantic_taxonomy.domain.constants import RelationshipVerbs
+from py_semantic_taxonomy.domain.constants import SEARCH_PER_PAGE, RelationshipVerbs
 from py_semantic_taxonomy.domain.entities import (
     Association,
     AssociationKind,
+    CacheStats,
+    Change,
     Concept,
     ConceptScheme,
     Correspondence,
     GraphObject,
+    HierarchyNode,
+    ImportResult,
     MadeOf,
+    ReindexResult,
     Relationship,
+    SearchFilter,
+    SearchHierarchy,
+    SearchOutboxItem,
+    SearchQuery,
     SearchResult,
 )
 
 
 @runtime_checkable
 class KOSGraphDatabase(Protocol):
+    def unit_of_work(self) -> AbstractAsyncContextManager[None]: ...
+
+    def cache_stats(self) -> CacheStats | None: ...
+
+    def invalidate_cache(self) -> None: ...
+
     async def get_object_type(self, iri: str) -> GraphObject: ...
 
+    async def get_object_types(self, iris: list[str]) -> dict[str, GraphObject]: ...
+
     async def concept_get(self, iri: str) -> Concept: ...
 
+    async def concept_get_many(self, iris: list[str]) -> dict[str, Concept]: ...
+
     async def concept_create(self, concept: Concept) -> Concept: ...
 
+    async def concept_create_many(self, concepts: list[Concept]) -> list[Concept]: ...
+
     async def concept_update(self, concept: Concept) -> Concept: ...
 
     async def concept_delete(self, iri: str) -> int: ...
 
     async def concept_get_all(
-        self, concept_scheme_iri: str | None, top_concepts_only: bool
+        self,
+        concept_scheme_iri: str | None,
+        top_concepts_only: bool,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Concept]: ...
 
+    def concept_stream_all(
+        self,
+        concept_scheme_iri: str | None,
+        top_concepts_only: bool,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Concept]: ...
+
     async def concept_broader_in_ascending_order(
         self, concept_iri: str, concept_scheme_iri: str
     ) -> list[Concept]: ...
 
+    async def concept_descendants(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+    ) -> list[Concept]: ...
+
+    async def concept_descendant_iris(self, iris: list[str]) -> list[str]: ...
+
+    async def concept_tree(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+        language: str | None = None,
+    ) -> list[HierarchyNode]: ...
+
+    async def relationships_subtree(self, concept_iri: str) -> list[Relationship]: ...
+
+    async def concept_search_hierarchy(self, iris: list[str]) -> dict[str, SearchHierarchy]: ...
+
+    async def closure_rebuild(self) -> int: ...
+
     async def concept_scheme_get(self, iri: str) -> ConceptScheme: ...
 
     async def concept_scheme_get_all_iris(self) -> list[str]: ...
 
-    async def concept_scheme_get_all(self) -> list[ConceptScheme]: ...
+    async def concept_scheme_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[ConceptScheme]: ...
+
+    def concept_scheme_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[ConceptScheme]: ...
 
     async def concept_scheme_create(self, concept_scheme: ConceptScheme) -> ConceptScheme: ...
 
@@ -56,17 +119,31 @@ class KOSGraphDatabase(Protocol):
 
     async def relationships_delete(self, relationships: list[Relationship]) -> int: ...
 
+    async def relationships_delete_for_concept_scheme(
+        self, concept_scheme_iri: str, predicate: RelationshipVerbs | None = None
+    ) -> list[Relationship]: ...
+
     async def relationship_source_target_share_known_concept_scheme(
         self, relationship: Relationship
     ) -> bool: ...
 
+    async def relationships_crossing_concept_schemes(
+        self, relationships: list[Relationship]
+    ) -> list[Relationship]: ...
+
     async def known_concept_schemes_for_concept_hierarchical_relationships(
         self, iri: str
     ) -> list[str]: ...
 
     async def correspondence_get(self, iri: str) -> Correspondence: ...
 
-    async def correspondence_get_all(self) -> list[Correspondence]: ...
+    async def correspondence_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[Correspondence]: ...
+
+    def correspondence_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[Correspondence]: ...
 
     async def correspondence_create(self, correspondence: Correspondence) -> Correspondence: ...
 
@@ -82,8 +159,20 @@ class KOSGraphDatabase(Protocol):
         source_concept_iri: str | None,
         target_concept_iri: str | None,
         kind: AssociationKind | None,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Association]: ...
 
+    def association_stream_all(
+        self,
+        correspondence_iri: str | None,
+        source_concept_iri: str | None,
+        target_concept_iri: str | None,
+        kind: AssociationKind | None,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Association]: ...
+
     async def association_create(self, association: Association) -> Association: ...
 
     async def association_delete(self, iri: str) -> int: ...
@@ -92,17 +181,64 @@ class KOSGraphDatabase(Protocol):
 
     async def made_of_remove(self, made_of: MadeOf) -> Correspondence: ...
 
+    async def changes_get(self, since: int = 0, limit: int | None = None) -> list[Change]: ...
+
+    def changes_stream(self, since: int = 0, limit: int | None = None) -> AsyncIterator[Change]: ...
+
+    async def changes_last_sequence(self) -> int: ...
+
+    async def search_outbox_add(self, iris: list[str]) -> None: ...
+
+    async def search_outbox_claim(
+        self, limit: int, lease: float, max_attempts: int
+    ) -> list[SearchOutboxItem]: ...
+
+    async def search_outbox_complete(self, ids: list[int]) -> None: ...
+
+    async def search_outbox_retry(self, ids: list[int], delay: float) -> None: ...
+
 
 @runtime_checkable
 class GraphService(Protocol):
+    def unit_of_work(self) -> AbstractAsyncContextManager[None]: ...
+
+    def cache_stats(self) -> CacheStats | None: ...
+
     async def get_object_type(self, iri: str) -> GraphObject: ...
 
+    async def get_object_types(self, iris: list[str]) -> dict[str, GraphObject]: ...
+
     async def concept_get(self, iri: str) -> Concept: ...
 
+    async def concept_get_many(self, iris: list[str]) -> dict[str, Concept]: ...
+
     async def concept_broader_in_ascending_order(
         self, concept_iri: str, concept_scheme_iri: str
     ) -> list[Concept]: ...
 
+    async def concept_descendants(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+    ) -> list[Concept]: ...
+
+    async def concept_descendant_iris(self, iris: list[str]) -> list[str]: ...
+
+    async def concept_tree(
+        self,
+        concept_iri: str,
+        concept_scheme_iri: str | None = None,
+        max_depth: int | None = None,
+        language: str | None = None,
+    ) -> list[HierarchyNode]: ...
+
+    async def relationships_subtree(self, concept_iri: str) -> list[Relationship]: ...
+
+    async def concept_search_hierarchy(self, iris: list[str]) -> dict[str, SearchHierarchy]: ...
+
+    async def closure_rebuild(self) -> int: ...
+
     async def concept_create(
         self, concept: Concept, relationships: list[Relationship] = []
     ) -> Concept: ...
@@ -111,15 +247,41 @@ class GraphService(Protocol):
 
     async def concept_delete(self, iri: str) -> None: ...
 
+    async def bulk_import(
+        self,
+        concept_schemes: list[ConceptScheme],
+        concepts: list[Concept],
+        relationships: list[Relationship],
+        batch_size: int = 1000,
+    ) -> ImportResult: ...
+
     async def concept_get_all(
-        self, concept_scheme_iri: str | None, top_concepts_only: bool
+        self,
+        concept_scheme_iri: str | None,
+        top_concepts_only: bool,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Concept]: ...
 
+    def concept_stream_all(
+        self,
+        concept_scheme_iri: str | None,
+        top_concepts_only: bool,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Concept]: ...
+
     async def concept_scheme_get(self, iri: str) -> ConceptScheme: ...
 
     async def concept_scheme_get_all_iris(self) -> list[str]: ...
 
-    async def concept_scheme_get_all(self) -> list[ConceptScheme]: ...
+    async def concept_scheme_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[ConceptScheme]: ...
+
+    def concept_scheme_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[ConceptScheme]: ...
 
     async def concept_scheme_create(self, concept_scheme: ConceptScheme) -> ConceptScheme: ...
 
@@ -141,9 +303,19 @@ class GraphService(Protocol):
 
     async def relationships_delete(self, relationships: list[Relationship]) -> int: ...
 
+    async def relationships_delete_for_concept_scheme(
+        self, concept_scheme_iri: str, predicate: RelationshipVerbs | None = None
+    ) -> int: ...
+
     async def correspondence_get(self, iri: str) -> Correspondence: ...
 
-    async def correspondence_get_all(self) -> list[Correspondence]: ...
+    async def correspondence_get_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> list[Correspondence]: ...
+
+    def correspondence_stream_all(
+        self, limit: int | None = None, after: str | None = None
+    ) -> AsyncIterator[Correspondence]: ...
 
     async def correspondence_create(self, correspondence: Correspondence) -> Correspondence: ...
 
@@ -163,46 +335,137 @@ class GraphService(Protocol):
         source_concept_iri: str | None,
         target_concept_iri: str | None,
         kind: AssociationKind | None,
+        limit: int | None = None,
+        after: str | None = None,
     ) -> list[Association]: ...
 
+    def association_stream_all(
+        self,
+        correspondence_iri: str | None,
+        source_concept_iri: str | None,
+        target_concept_iri: str | None,
+        kind: AssociationKind | None,
+        limit: int | None = None,
+        after: str | None = None,
+    ) -> AsyncIterator[Association]: ...
+
     async def association_create(self, association: Association) -> Association: ...
 
     async def association_delete(self, iri: str) -> None: ...
 
+    async def changes_get(self, since: int = 0, limit: int | None = None) -> list[Change]: ...
+
+    def changes_stream(self, since: int = 0, limit: int | None = None) -> AsyncIterator[Change]: ...
+
+    async def changes_last_sequence(self) -> int: ...
+
+    async def search_reindex(
+        self, batch_size: int | None = None, concurrency: int = 4
+    ) -> ReindexResult: ...
+
+    async def search_refresh(self, iris: list[str]) -> None: ...
+
+    async def search_outbox_process(self, batch_size: int = 100) -> int: ...
+
 
 @runtime_checkable
 class SearchEngine(Protocol):
+    def cache_stats(self) -> CacheStats | None: ...
+
     async def initialize(self, collections: list[str]) -> None: ...
 
     async def reset(self) -> None: ...
 
     async def create_concept(self, concept: dict, collection: str) -> None: ...
 
+    async def create_concepts(self, concepts: list[dict], collection: str) -> None: ...
+
+    async def create_collection(self, name: str) -> None: ...
+
+    async def delete_collection(self, name: str) -> None: ...
+
+    async def swap_alias(self, alias: str, collection: str) -> str | None: ...
+
     async def update_concept(self, concept: dict, collection: str) -> None: ...
 
     async def delete_concept(self, id_: str, collection: str) -> None: ...
 
+    async def delete_concepts(self, ids: list[str], collection: str) -> None: ...
+
     async def search(
-        self, query: str, collection: str, semantic: bool, prefix: bool
+        self,
+        query: str,
+        collection: str,
+        semantic: bool,
+        prefix: bool,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
     ) -> list[SearchResult]: ...
 
+    async def search_many(self, queries: list[dict]) -> list[list[SearchResult]]: ...
+
 
 @runtime_checkable
 class SearchService(Protocol):
     def is_configured(self) -> bool: ...
 
+    def cache_stats(self) -> CacheStats | None: ...
+
     async def initialize(self) -> None: ...
 
     async def reset(self) -> None: ...
 
-    async def create_concept(self, concept: Concept) -> None: ...
+    async def create_concept(
+        self, concept: Concept, hierarchy: SearchHierarchy | None = None
+    ) -> None: ...
+
+    async def create_concepts(
+        self,
+        concepts: list[Concept],
+        batch_size: int | None = None,
+        hierarchies: dict[str, SearchHierarchy] | None = None,
+    ) -> None: ...
 
-    async def update_concept(self, concept: Concept) -> None: ...
+    async def update_concept(
+        self, concept: Concept, hierarchy: SearchHierarchy | None = None
+    ) -> None: ...
 
     async def delete_concept(self, iri: str) -> None: ...
 
+    async def index_concepts(
+        self,
+        concepts: list[Concept],
+        removed: list[str],
+        hierarchies: dict[str, SearchHierarchy] | None = None,
+    ) -> None: ...
+
     async def search(
-        self, query: str, language: str, semantic: bool = True, prefix: bool = False
+        self,
+        query: str,
+        language: str,
+        semantic: bool = True,
+        prefix: bool = False,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
     ) -> list[SearchResult]: ...
 
-    async def suggest(self, query: str, language: str) -> list[SearchResult]: ...
+    async def suggest(
+        self,
+        query: str,
+        language: str,
+        filters: SearchFilter | None = None,
+        page: int = 1,
+        per_page: int = SEARCH_PER_PAGE,
+    ) -> list[SearchResult]: ...
+
+    async def search_many(self, queries: list[SearchQuery]) -> list[list[SearchResult]]: ...
+
+    async def reindex(
+        self,
+        concepts: AsyncIterator[Concept],
+        batch_size: int | None = None,
+        concurrency: int = 4,
+        hierarchy: Callable[[list[str]], Awaitable[dict[str, SearchHierarchy]]] | None = None,
+    ) -> ReindexResult: ...
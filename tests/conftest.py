@@ -111,7 +111,9 @@ def entities(cn) -> list[GraphObject]:
 
 @pytest.fixture
 def mock_kos_graph() -> AsyncMock:
-    return AsyncMock(spec=KOSGraphDatabase)
+    mock = AsyncMock(spec=KOSGraphDatabase)
+    mock.relationships_crossing_concept_schemes.return_value = []
+    return mock
 
 
 @pytest.fixture
@@ -340,3 +340,45 @@ async def test_delete_concept(postgres, cn_db_engine, cn, client):
 
     response = await client.get(get_full_api_path("concept", iri=cn.concept_top["@id"]))
     assert response.status_code == 404
+
+
+@pytest.mark.postgres
+async def test_concept_write_notifies(postgres, cn_db_engine, cn, client):
+    import asyncio
+
+    from py_semantic_taxonomy.adapters.persistence.notifications import listen_for_changes
+    from py_semantic_taxonomy.domain.entities import ChangeEvent
+
+    events = []
+    listener = asyncio.create_task(listen_for_changes(events.append))
+    while not events:
+        await asyncio.sleep(0.05)
+
+    response = await client.delete(get_full_api_path("concept", iri=cn.concept_mid["@id"]))
+    assert response.status_code == 204
+    for _ in range(100):
+        if len(events) > 1:
+            break
+        await asyncio.sleep(0.05)
+    listener.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await listener
+
+    assert events[1] == ChangeEvent(kind="concept", iri=cn.concept_mid["@id"], operation="delete")
+
+
+@pytest.mark.postgres
+async def test_concept_write_changes_feed(postgres, cn_db_engine, cn, client):
+    response = await client.delete(get_full_api_path("concept", iri=cn.concept_mid["@id"]))
+    assert response.status_code == 204
+
+    response = await client.get(get_full_api_path("changes"))
+    assert response.status_code == 200
+    assert [(obj["kind"], obj["iri"], obj["operation"]) for obj in response.json()] == [
+        ("concept", cn.concept_mid["@id"], "delete")
+    ]
+
+    response = await client.get(
+        get_full_api_path("changes"), params={"since": response.json()[0]["sequence"]}
+    )
+    assert response.json() == []
@@ -148,3 +148,20 @@ async def test_relationship_delete(postgres, cn_db_engine, client, relationships
         "detail": "Relationships (possibly) deleted",
         "count": 0,
     }
+
+
+@pytest.mark.postgres
+async def test_relationship_delete_for_concept_scheme(
+    postgres, cn_db_engine, cn, client, relationships
+):
+    response = await client.delete(
+        get_full_api_path("relationship_concept_scheme"),
+        params={"concept_scheme_iri": cn.scheme["@id"], "predicate": RelationshipVerbs.broader},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"detail": "Relationships (possibly) deleted", "count": 2}
+
+    response = await client.get(
+        get_full_api_path("relationship"), params={"iri": relationships[3].source}
+    )
+    assert response.json() == []
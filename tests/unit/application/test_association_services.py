@@ -28,6 +28,8 @@ async def test_associations_get_all_all_filters(graph_service, entities):
         source_concept_iri="http://example.com/b",
         target_concept_iri="http://example.com/c",
         kind=AssociationKind.conditional,
+        limit=None,
+        after=None,
     )
 
 
@@ -42,6 +44,8 @@ async def test_associations_get_all_no_filters(graph_service, entities):
         source_concept_iri=None,
         target_concept_iri=None,
         kind=None,
+        limit=None,
+        after=None,
     )
 
 
@@ -7,11 +7,16 @@ from py_semantic_taxonomy.domain.constants import RelationshipVerbs
 from py_semantic_taxonomy.domain.entities import (
     Concept,
     ConceptNotFoundError,
+    ConceptScheme,
     ConceptSchemesNotInDatabase,
+    DuplicateIRI,
     DuplicateRelationship,
     HierarchyConflict,
+    HierarchyNode,
+    ImportResult,
     Relationship,
     RelationshipsInCurrentConceptScheme,
+    SearchHierarchy,
 )
 
 
@@ -24,22 +29,38 @@ async def test_concept_get(graph_service, entities):
     mock_kos_graph.concept_get.assert_called_with(iri=entities[0].id_)
 
 
+async def test_concept_get_many(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.concept_get_many.return_value = {entities[0].id_: entities[0]}
+
+    result = await graph_service.concept_get_many([entities[0].id_])
+    assert result == {entities[0].id_: entities[0]}
+    mock_kos_graph.concept_get_many.assert_called_with(iris=[entities[0].id_])
+
+
 async def test_concept_create(graph_service, cn, entities, relationships):
     entities[0].top_concept_of = []
 
     mock_kos_graph = graph_service.graph
     mock_kos_graph.concept_create.return_value = entities[0]
     mock_kos_graph.concept_scheme_get_all_iris.return_value = [cn.scheme["@id"]]
+    hierarchy = SearchHierarchy(depth=0, top_concepts=[entities[0].id_])
+    mock_kos_graph.concept_search_hierarchy.return_value = {entities[0].id_: hierarchy}
+    mock_kos_graph.concept_descendant_iris.return_value = []
+    mock_kos_graph.concept_get_many.return_value = {}
 
     result = await graph_service.concept_create(entities[0])
     assert result == entities[0]
     mock_kos_graph.concept_create.assert_called_with(concept=entities[0])
-    graph_service.search.create_concept.assert_called_once_with(entities[0])
+    graph_service.search.create_concept.assert_called_once_with(entities[0], hierarchy)
+    graph_service.search.index_concepts.assert_not_called()
 
     result = await graph_service.concept_create(entities[0], relationships)
     assert result == entities[0]
     mock_kos_graph.concept_create.assert_called_with(concept=entities[0])
-    graph_service.search.create_concept.assert_called_with(entities[0])
+    graph_service.search.create_concept.assert_called_with(entities[0], hierarchy)
+    # Sources of the new `broader` relationships are refreshed as well
+    graph_service.search.index_concepts.assert_awaited_once()
 
 
 async def test_concept_create_hierarchy_conflict_existing_relationship(
@@ -112,17 +133,16 @@ async def test_concept_create_error(graph_service, cn, entities, relationships):
     mock_kos_graph.concept_create.return_value = entities[0]
     mock_kos_graph.concept_scheme_get_all_iris.return_value = [cn.scheme["@id"]]
 
-    graph_service.relationships_create = AsyncMock(side_effect=DuplicateRelationship())
+    graph_service._relationships_create = AsyncMock(side_effect=DuplicateRelationship())
     graph_service.concept_delete = AsyncMock()
 
-    try:
+    with pytest.raises(DuplicateRelationship):
         await graph_service.concept_create(concept=entities[0], relationships=relationships)
-    except DuplicateRelationship:
-        pass
 
     mock_kos_graph.concept_create.assert_called_with(concept=entities[0])
-    graph_service.relationships_create.assert_called_with(relationships)
-    graph_service.concept_delete.assert_called_with(entities[0].id_)
+    graph_service._relationships_create.assert_called_with(relationships)
+    graph_service.concept_delete.assert_not_called()
+    graph_service.search.create_concept.assert_not_called()
 
 
 async def test_concept_update(graph_service, cn, entities):
@@ -131,11 +151,13 @@ async def test_concept_update(graph_service, cn, entities):
     mock_kos_graph = graph_service.graph
     mock_kos_graph.concept_update.return_value = entities[0]
     mock_kos_graph.concept_scheme_get_all_iris.return_value = [cn.scheme["@id"]]
+    hierarchy = SearchHierarchy(depth=0, top_concepts=[entities[0].id_])
+    mock_kos_graph.concept_search_hierarchy.return_value = {entities[0].id_: hierarchy}
 
     result = await graph_service.concept_update(entities[0])
     assert result == entities[0]
     mock_kos_graph.concept_update.assert_called_with(concept=entities[0])
-    graph_service.search.update_concept.assert_called_once_with(entities[0])
+    graph_service.search.update_concept.assert_called_once_with(entities[0], hierarchy)
 
 
 async def test_concept_update_hierarchy_conflict_existing_relationship(
@@ -234,11 +256,30 @@ async def test_concept_update_cross_scheme_relationship_not_called(graph_service
 async def test_concept_delete(graph_service, entities):
     mock_kos_graph = graph_service.graph
     mock_kos_graph.concept_delete.return_value = 1
+    mock_kos_graph.concept_descendant_iris.return_value = []
 
     result = await graph_service.concept_delete(entities[0].id_)
     assert result is None
     mock_kos_graph.concept_delete.assert_called_with(iri=entities[0].id_)
     graph_service.search.delete_concept.assert_called_once_with(entities[0].id_)
+    graph_service.search.index_concepts.assert_not_called()
+
+
+async def test_concept_delete_refreshes_descendants(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.concept_delete.return_value = 1
+    # Deleting a mid-level concept changes the depth and top concepts of everything below it
+    mock_kos_graph.concept_descendant_iris.return_value = [entities[1].id_]
+    mock_kos_graph.concept_get_many.return_value = {entities[1].id_: entities[1]}
+    hierarchy = SearchHierarchy(depth=0, top_concepts=[entities[1].id_])
+    mock_kos_graph.concept_search_hierarchy.return_value = {entities[1].id_: hierarchy}
+
+    await graph_service.concept_delete(entities[0].id_)
+    mock_kos_graph.concept_descendant_iris.assert_called_once_with([entities[0].id_])
+    graph_service.search.delete_concept.assert_called_once_with(entities[0].id_)
+    graph_service.search.index_concepts.assert_called_once_with(
+        [entities[1]], [], hierarchies={entities[1].id_: hierarchy}
+    )
 
 
 async def concept_delete_not_found(graph_service, entities):
@@ -256,13 +297,19 @@ async def test_concept_get_all(graph_service, entities):
     result = await graph_service.concept_get_all(entities[3].id_)
     assert result == [entities[0]]
     mock_kos_graph.concept_get_all.assert_called_with(
-        concept_scheme_iri=entities[3].id_, top_concepts_only=False
+        concept_scheme_iri=entities[3].id_,
+        top_concepts_only=False,
+        limit=None,
+        after=None,
     )
 
     result = await graph_service.concept_get_all(entities[3].id_, True)
     assert result == [entities[0]]
     mock_kos_graph.concept_get_all.assert_called_with(
-        concept_scheme_iri=entities[3].id_, top_concepts_only=True
+        concept_scheme_iri=entities[3].id_,
+        top_concepts_only=True,
+        limit=None,
+        after=None,
     )
 
 
@@ -273,11 +320,119 @@ async def test_concept_get_all_no_concept_scheme(graph_service, entities):
     result = await graph_service.concept_get_all()
     assert result == []
     mock_kos_graph.concept_get_all.assert_called_with(
-        concept_scheme_iri=None, top_concepts_only=False
+        concept_scheme_iri=None,
+        top_concepts_only=False,
+        limit=None,
+        after=None,
     )
 
     result = await graph_service.concept_get_all(None, True)
     assert result == []
     mock_kos_graph.concept_get_all.assert_called_with(
-        concept_scheme_iri=None, top_concepts_only=True
+        concept_scheme_iri=None,
+        top_concepts_only=True,
+        limit=None,
+        after=None,
+    )
+
+
+async def test_concept_stream_all(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.concept_stream_all.return_value = "stream"
+
+    result = graph_service.concept_stream_all(entities[3].id_, limit=10)
+    assert result == "stream"
+    mock_kos_graph.concept_stream_all.assert_called_with(
+        concept_scheme_iri=entities[3].id_, top_concepts_only=False, limit=10, after=None
+    )
+
+
+async def test_bulk_import(graph_service, cn, relationships):
+    concept_schemes = [ConceptScheme.from_json_ld(cn.scheme)]
+    concepts = [Concept.from_json_ld(cn.concept_mid), Concept.from_json_ld(cn.concept_low)]
+
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.concept_scheme_get_all_iris.return_value = [cn.scheme["@id"]]
+    mock_kos_graph.relationships_create.return_value = relationships
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+
+    result = await graph_service.bulk_import(
+        concept_schemes=concept_schemes,
+        concepts=concepts,
+        relationships=relationships,
+        batch_size=1,
+    )
+    assert result == ImportResult(concept_schemes=1, concepts=2, relationships=len(relationships))
+    mock_kos_graph.concept_scheme_create.assert_called_once_with(concept_scheme=concept_schemes[0])
+    assert mock_kos_graph.concept_create_many.await_count == 2
+    mock_kos_graph.concept_create_many.assert_called_with([concepts[1]])
+    assert mock_kos_graph.relationships_create.await_count == len(relationships)
+    mock_kos_graph.concept_search_hierarchy.assert_called_once_with(
+        [concept.id_ for concept in concepts]
+    )
+    graph_service.search.create_concepts.assert_called_once_with(concepts, hierarchies={})
+
+
+async def test_bulk_import_duplicate_iri(graph_service, cn):
+    concept = Concept.from_json_ld(cn.concept_low)
+    with pytest.raises(DuplicateIRI):
+        await graph_service.bulk_import(
+            concept_schemes=[], concepts=[concept, concept], relationships=[]
+        )
+    graph_service.graph.concept_create_many.assert_not_called()
+
+
+async def test_bulk_import_hierarchy_conflict(graph_service, cn):
+    concept = Concept.from_json_ld(cn.concept_top)
+    with pytest.raises(HierarchyConflict):
+        await graph_service.bulk_import(
+            concept_schemes=[],
+            concepts=[concept],
+            relationships=[
+                Relationship(source=concept.id_, target="foo", predicate=RelationshipVerbs.broader)
+            ],
+        )
+    graph_service.graph.concept_create_many.assert_not_called()
+
+
+async def test_bulk_import_concept_scheme_missing(graph_service, cn):
+    graph_service.graph.concept_scheme_get_all_iris.return_value = []
+    with pytest.raises(ConceptSchemesNotInDatabase):
+        await graph_service.bulk_import(
+            concept_schemes=[],
+            concepts=[Concept.from_json_ld(cn.concept_low)],
+            relationships=[],
+        )
+    graph_service.graph.concept_create_many.assert_not_called()
+
+
+async def test_concept_descendants(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.concept_descendants.return_value = [entities[1]]
+
+    result = await graph_service.concept_descendants(entities[0].id_)
+    assert result == [entities[1]]
+    mock_kos_graph.concept_descendants.assert_called_with(
+        concept_iri=entities[0].id_, concept_scheme_iri=None, max_depth=None
+    )
+
+
+async def test_relationships_subtree(graph_service, entities, relationships):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.relationships_subtree.return_value = [relationships[3]]
+
+    result = await graph_service.relationships_subtree(entities[0].id_)
+    assert result == [relationships[3]]
+    mock_kos_graph.relationships_subtree.assert_called_with(concept_iri=entities[0].id_)
+
+
+async def test_concept_tree(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    node = HierarchyNode(id_=entities[1].id_, depth=1, parent=entities[0].id_)
+    mock_kos_graph.concept_tree.return_value = [node]
+
+    result = await graph_service.concept_tree(entities[0].id_, max_depth=2, language="en")
+    assert result == [node]
+    mock_kos_graph.concept_tree.assert_called_with(
+        concept_iri=entities[0].id_, concept_scheme_iri=None, max_depth=2, language="en"
     )
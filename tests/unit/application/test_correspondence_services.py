@@ -18,7 +18,7 @@ async def test_correspondence_get_all(graph_service, entities):
 
     result = await graph_service.correspondence_get_all()
     assert result[0] == entities[3]
-    mock_kos_graph.correspondence_get_all.assert_called_with()
+    mock_kos_graph.correspondence_get_all.assert_called_with(limit=None, after=None)
 
 
 async def test_correspondence_create(graph_service, cn, entities, relationships):
@@ -27,7 +27,7 @@ async def test_concept_scheme_get_all(graph_service, entities):
 
     result = await graph_service.concept_scheme_get_all()
     assert result == [entities[2], entities[4]]
-    mock_kos_graph.concept_scheme_get_all.assert_called_with()
+    mock_kos_graph.concept_scheme_get_all.assert_called_with(limit=None, after=None)
 
 
 async def test_concept_scheme_create(graph_service, entities):
@@ -30,17 +30,50 @@ async def test_relationships_get(graph_service, relationships):
 async def test_relationship_create(graph_service, relationships):
     mock_kos_graph = graph_service.graph
     mock_kos_graph.relationships_create.return_value = relationships
+    mock_kos_graph.concept_descendant_iris.return_value = []
+    mock_kos_graph.concept_get_many.return_value = {}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
 
     result = await graph_service.relationships_create(relationships)
     assert result == relationships
     mock_kos_graph.relationships_create.assert_called_with(relationships)
 
+    # Sources of `broader` relationships and their descendants move in the hierarchy
+    sources = sorted(
+        {rel.source for rel in relationships if rel.predicate == RelationshipVerbs.broader}
+    )
+    # One query for the descendants of all sources
+    mock_kos_graph.concept_descendant_iris.assert_awaited_once_with(sources)
+    mock_kos_graph.concept_get_many.assert_awaited_once_with(sources)
+    graph_service.search.index_concepts.assert_awaited_once_with([], sources, hierarchies={})
 
-async def test_relationship_create_cross_concept_scheme_hierarchical(graph_service, relationships):
+
+async def test_relationship_create_refreshes_descendants(graph_service, entities):
     mock_kos_graph = graph_service.graph
-    mock_kos_graph.relationship_source_target_share_known_concept_scheme.return_value = False
+    rel = Relationship(source="a", target="b", predicate=RelationshipVerbs.broader)
+    mock_kos_graph.relationships_create.return_value = [rel]
+    mock_kos_graph.concept_descendant_iris.return_value = [entities[2].id_]
+    mock_kos_graph.concept_get_many.return_value = {entities[2].id_: entities[2]}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+
+    await graph_service.relationships_create([rel])
+    mock_kos_graph.concept_descendant_iris.assert_awaited_once_with(["a"])
+    mock_kos_graph.concept_get_many.assert_awaited_once_with(sorted(["a", entities[2].id_]))
+    graph_service.search.index_concepts.assert_awaited_once_with(
+        [entities[2]], ["a"], hierarchies={}
+    )
+
+
+async def test_relationship_create_associative_no_refresh(graph_service):
+    rel = Relationship(source="a", target="b", predicate=RelationshipVerbs.exact_match)
+    await graph_service.relationships_create([rel])
+    graph_service.search.index_concepts.assert_not_called()
 
+
+async def test_relationship_create_cross_concept_scheme_hierarchical(graph_service, relationships):
+    mock_kos_graph = graph_service.graph
     rel = relationships[3]
+    mock_kos_graph.relationships_crossing_concept_schemes.return_value = [rel]
 
     with pytest.raises(HierarchicRelationshipAcrossConceptScheme) as excinfo:
         await graph_service.relationships_create([rel])
@@ -67,21 +100,66 @@ async def test_relationship_create_reference_concept_scheme(graph_service, relat
 
 async def test_relationship_create_cross_concept_scheme_associative(graph_service, relationships):
     mock_kos_graph = graph_service.graph
-    mock_kos_graph.relationship_source_target_share_known_concept_scheme.return_value = False
-
     associative = Relationship(
         source=relationships[3].source,
         target=relationships[3].target,
         predicate=RelationshipVerbs.broad_match,
     )
     await graph_service.relationships_create([associative])
-    mock_kos_graph.relationship_source_target_share_known_concept_scheme.assert_not_called()
+    mock_kos_graph.relationships_crossing_concept_schemes.assert_not_called()
+
+
+async def test_relationship_create_cross_concept_scheme_reports_all(graph_service):
+    mock_kos_graph = graph_service.graph
+    crossing = [
+        Relationship(source="a", target="b", predicate=RelationshipVerbs.broader),
+        Relationship(source="c", target="d", predicate=RelationshipVerbs.narrower),
+    ]
+    mock_kos_graph.relationships_crossing_concept_schemes.return_value = crossing
+
+    with pytest.raises(HierarchicRelationshipAcrossConceptScheme) as excinfo:
+        await graph_service.relationships_create(
+            crossing
+            + [Relationship(source="e", target="f", predicate=RelationshipVerbs.exact_match)]
+        )
+    assert excinfo.match("between `a` and `b`")
+    assert excinfo.match("between `c` and `d`")
+    mock_kos_graph.relationships_crossing_concept_schemes.assert_awaited_once_with(crossing)
 
 
 async def test_relationship_delete(graph_service, relationships):
     mock_kos_graph = graph_service.graph
     mock_kos_graph.relationships_delete.return_value = 1
+    mock_kos_graph.concept_descendant_iris.return_value = []
+    mock_kos_graph.concept_get_many.return_value = {}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
 
     result = await graph_service.relationships_delete(relationships)
     assert result == 1
     mock_kos_graph.relationships_delete.assert_called_with(relationships)
+    graph_service.search.index_concepts.assert_awaited_once()
+
+
+async def test_relationship_delete_for_concept_scheme(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    deleted = [
+        Relationship(source="a", target="b", predicate=RelationshipVerbs.broader),
+        Relationship(source="c", target="d", predicate=RelationshipVerbs.exact_match),
+    ]
+    mock_kos_graph.relationships_delete_for_concept_scheme.return_value = deleted
+    mock_kos_graph.concept_descendant_iris.return_value = [entities[2].id_]
+    mock_kos_graph.concept_get_many.return_value = {entities[2].id_: entities[2]}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+
+    result = await graph_service.relationships_delete_for_concept_scheme(
+        "http://example.com/cs", RelationshipVerbs.broader
+    )
+    assert result == 2
+    mock_kos_graph.relationships_delete_for_concept_scheme.assert_called_with(
+        concept_scheme_iri="http://example.com/cs", predicate=RelationshipVerbs.broader
+    )
+    # Sources of deleted `broader` relationships and their descendants move in the hierarchy
+    mock_kos_graph.concept_descendant_iris.assert_awaited_once_with(["a"])
+    graph_service.search.index_concepts.assert_awaited_once_with(
+        [entities[2]], ["a"], hierarchies={}
+    )
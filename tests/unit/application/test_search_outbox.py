@@ -0,0 +1,192 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, call
+
+import pytest
+
+from py_semantic_taxonomy.adapters.persistence.cache import CachedKOSGraphDatabase
+from py_semantic_taxonomy.application.graph_service import (
+    SEARCH_OUTBOX_LEASE,
+    SEARCH_OUTBOX_MAX_ATTEMPTS,
+    GraphService,
+)
+from py_semantic_taxonomy.application.search_outbox import run_search_outbox
+from py_semantic_taxonomy.cfg import get_settings
+from py_semantic_taxonomy.domain.entities import SearchHierarchy, SearchOutboxItem
+from py_semantic_taxonomy.domain.ports import SearchService as SearchServicePort
+
+
+def item(id_: int, iri: str, attempts: int = 0) -> SearchOutboxItem:
+    return SearchOutboxItem(
+        id_=id_, iri=iri, attempts=attempts, available_at=datetime.now(timezone.utc)
+    )
+
+
+@pytest.fixture
+def outbox_service(graph_service):
+    graph_service.search_outbox = True
+    return graph_service
+
+
+async def test_concept_create_search_outbox(outbox_service, cn, entities):
+    entities[0].top_concept_of = []
+    outbox_service.graph.concept_scheme_get_all_iris.return_value = [cn.scheme["@id"]]
+    outbox_service.graph.concept_descendant_iris.return_value = []
+
+    await outbox_service.concept_create(entities[0])
+    outbox_service.graph.search_outbox_add.assert_called_once_with([entities[0].id_])
+    outbox_service.search.create_concept.assert_not_called()
+
+
+async def test_concept_delete_search_outbox(outbox_service, entities):
+    outbox_service.graph.concept_delete.return_value = 1
+    outbox_service.graph.concept_descendant_iris.return_value = []
+
+    await outbox_service.concept_delete(entities[0].id_)
+    outbox_service.graph.search_outbox_add.assert_called_once_with([entities[0].id_])
+    outbox_service.search.delete_concept.assert_not_called()
+
+
+async def test_concept_delete_search_outbox_descendants(outbox_service, entities):
+    outbox_service.graph.concept_delete.return_value = 1
+    outbox_service.graph.concept_descendant_iris.return_value = [entities[1].id_]
+
+    await outbox_service.concept_delete(entities[0].id_)
+    assert outbox_service.graph.search_outbox_add.call_args_list == [
+        call([entities[1].id_]),
+        call([entities[0].id_]),
+    ]
+
+
+async def test_search_outbox_not_used_without_search(outbox_service, entities):
+    outbox_service.search.is_configured.return_value = False
+    outbox_service.graph.concept_delete.return_value = 1
+
+    await outbox_service.concept_delete(entities[0].id_)
+    outbox_service.graph.search_outbox_add.assert_not_called()
+
+
+async def test_search_outbox_process(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.search_outbox_claim.return_value = [
+        item(1, entities[0].id_),
+        item(2, "http://example.com/deleted"),
+        item(3, entities[0].id_),
+    ]
+    mock_kos_graph.concept_get_many.return_value = {entities[0].id_: entities[0]}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+
+    assert await graph_service.search_outbox_process(batch_size=3) == 3
+    mock_kos_graph.search_outbox_claim.assert_called_once_with(
+        limit=3, lease=SEARCH_OUTBOX_LEASE, max_attempts=SEARCH_OUTBOX_MAX_ATTEMPTS
+    )
+    graph_service.search.index_concepts.assert_called_once_with(
+        [entities[0]], ["http://example.com/deleted"], hierarchies={}
+    )
+    mock_kos_graph.search_outbox_complete.assert_called_once_with([1, 2, 3])
+
+
+async def test_search_outbox_process_empty(graph_service):
+    graph_service.graph.search_outbox_claim.return_value = []
+
+    assert await graph_service.search_outbox_process() == 0
+    graph_service.search.index_concepts.assert_not_called()
+
+
+async def test_search_outbox_process_failure(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    # Attempts include the current one, which was counted when claiming
+    mock_kos_graph.search_outbox_claim.return_value = [item(1, entities[0].id_, attempts=4)]
+    mock_kos_graph.concept_get_many.return_value = {}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+    graph_service.search.index_concepts.side_effect = OSError("Typesense unavailable")
+
+    assert await graph_service.search_outbox_process() == 0
+    mock_kos_graph.search_outbox_retry.assert_called_once_with([1], 8)
+    mock_kos_graph.search_outbox_complete.assert_not_called()
+
+
+async def test_search_outbox_process_partial_failure(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.search_outbox_claim.return_value = [
+        item(1, entities[0].id_, attempts=1),
+        item(2, "http://example.com/broken", attempts=1),
+    ]
+    mock_kos_graph.concept_get_many.return_value = {}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+    # The whole batch fails, then each concept is indexed on its own
+    graph_service.search.index_concepts.side_effect = [OSError, None, OSError]
+
+    assert await graph_service.search_outbox_process() == 0
+    mock_kos_graph.search_outbox_complete.assert_called_once_with([1])
+    mock_kos_graph.search_outbox_retry.assert_called_once_with([2], 1)
+
+
+async def test_search_outbox_process_give_up(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.search_outbox_claim.return_value = [
+        item(1, entities[0].id_, attempts=SEARCH_OUTBOX_MAX_ATTEMPTS)
+    ]
+    mock_kos_graph.concept_get_many.return_value = {}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+    graph_service.search.index_concepts.side_effect = OSError
+
+    assert await graph_service.search_outbox_process() == 0
+    # Left in the outbox, where `search_outbox_claim` skips it from now on
+    mock_kos_graph.search_outbox_retry.assert_called_once()
+    mock_kos_graph.search_outbox_complete.assert_not_called()
+
+
+async def test_run_search_outbox():
+    service = AsyncMock()
+    service.search_outbox_process.side_effect = [2, 1, ValueError, asyncio.CancelledError]
+
+    with pytest.raises(asyncio.CancelledError):
+        await run_search_outbox(service, batch_size=2, poll_interval=0)
+    assert service.search_outbox_process.await_count == 4
+
+
+async def test_search_refresh(graph_service, entities):
+    graph_service.graph.concept_get_many.return_value = {entities[0].id_: entities[0]}
+    hierarchy = SearchHierarchy(depth=0, top_concepts=[entities[0].id_])
+    graph_service.graph.concept_search_hierarchy.return_value = {entities[0].id_: hierarchy}
+
+    await graph_service.search_refresh([entities[0].id_, "http://example.com/deleted"])
+    graph_service.graph.concept_search_hierarchy.assert_called_once_with([entities[0].id_])
+    graph_service.search.index_concepts.assert_called_once_with(
+        [entities[0]], ["http://example.com/deleted"], hierarchies={entities[0].id_: hierarchy}
+    )
+
+
+async def test_search_refresh_skips_cache(mock_kos_graph, entities):
+    cached = CachedKOSGraphDatabase(mock_kos_graph)
+    # A stale copy, e.g. from before another worker's write
+    cached.cache.set(("concept_get", entities[0].id_), entities[1])
+    graph_service = GraphService(graph=cached, search=AsyncMock(spec=SearchServicePort))
+    mock_kos_graph.concept_get_many.return_value = {entities[0].id_: entities[0]}
+    mock_kos_graph.concept_search_hierarchy.return_value = {}
+
+    await graph_service.search_refresh([entities[0].id_])
+    mock_kos_graph.concept_get_many.assert_called_once_with([entities[0].id_])
+    graph_service.search.index_concepts.assert_called_once_with([entities[0]], [], hierarchies={})
+
+
+async def test_search_refresh_batched(graph_service, entities, monkeypatch):
+    monkeypatch.setenv("PyST_typesense_import_batch_size", "2")
+    get_settings.cache_clear()
+    graph_service.graph.concept_get_many.side_effect = [
+        {entities[0].id_: entities[0]},
+        {},
+    ]
+    graph_service.graph.concept_search_hierarchy.return_value = {}
+
+    iris = ["http://example.com/deleted-1", "http://example.com/deleted-2", entities[0].id_]
+    await graph_service.search_refresh(iris)
+    assert graph_service.graph.concept_get_many.await_args_list == [
+        call(["http://data.europa.eu/xsp/cn2024/010011000090", "http://example.com/deleted-1"]),
+        call(["http://example.com/deleted-2"]),
+    ]
+    assert graph_service.search.index_concepts.await_args_list == [
+        call([entities[0]], ["http://example.com/deleted-1"], hierarchies={}),
+        call([], ["http://example.com/deleted-2"], hierarchies={}),
+    ]
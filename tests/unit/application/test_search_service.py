@@ -1,6 +1,19 @@
+import asyncio
+from unittest.mock import call
+
 import pytest
 
-from py_semantic_taxonomy.domain.entities import SearchNotConfigured, UnknownLanguage
+from py_semantic_taxonomy.adapters.persistence.local_search import LocalSearchEngine
+from py_semantic_taxonomy.application.search_service import SearchService
+from py_semantic_taxonomy.dependencies import get_search_engine
+from py_semantic_taxonomy.domain.constants import SEARCH_PER_PAGE
+from py_semantic_taxonomy.domain.entities import (
+    SearchFilter,
+    SearchNotConfigured,
+    SearchQuery,
+    UnknownLanguage,
+)
+from py_semantic_taxonomy.domain.hash_utils import hash_fnv64
 
 
 def test_search_service_instantiation(search_service):
@@ -9,6 +22,23 @@ def test_search_service_instantiation(search_service):
     assert search_service.is_configured()
 
 
+async def test_search_service_local_backend(monkeypatch, entities):
+    monkeypatch.setenv("PyST_search_backend", "local")
+    monkeypatch.setenv("PyST_languages", '["en", "de"]')
+    get_search_engine.cache_clear()
+    try:
+        service = SearchService()
+        assert service.is_configured()
+        assert isinstance(service.engine, LocalSearchEngine)
+
+        await service.initialize()
+        await service.create_concept(entities[1])
+        results = await service.search("live animals", "en")
+        assert [result.id_ for result in results] == [entities[1].id_]
+    finally:
+        get_search_engine.cache_clear()
+
+
 async def test_search_service_initialize_search_index(search_service):
     await search_service.initialize()
     search_service.engine.initialize.assert_called_once_with(
@@ -52,6 +82,25 @@ async def test_search_service_create_concept_include_empties(search_service, ent
     assert search_service.engine.create_concept.call_args[0][1] == "pyst-concepts-de"
 
 
+async def test_search_service_create_concepts(search_service, entities):
+    await search_service.create_concepts([entities[0], entities[1]])
+    search_service.engine.create_concepts.assert_called_once()
+    assert len(search_service.engine.create_concepts.call_args[0][0]) == 2
+    assert search_service.engine.create_concepts.call_args[0][1] == "pyst-concepts-en"
+
+
+async def test_search_service_create_concepts_batches(search_service, entities):
+    search_service.settings.typesense_exclude_if_missing_for_language = False
+    await search_service.create_concepts([entities[0], entities[1], entities[5]], batch_size=2)
+    calls = search_service.engine.create_concepts.call_args_list
+    assert [(len(call[0][0]), call[0][1]) for call in calls] == [
+        (2, "pyst-concepts-en"),
+        (2, "pyst-concepts-de"),
+        (1, "pyst-concepts-en"),
+        (1, "pyst-concepts-de"),
+    ]
+
+
 async def test_search_service_update_concept_error(search_service, entities):
     search_service.configured = False
     with pytest.raises(SearchNotConfigured):
@@ -71,6 +120,22 @@ async def test_search_service_update_concept_include_empties(search_service, ent
     assert search_service.engine.update_concept.call_args[0][1] == "pyst-concepts-de"
 
 
+async def test_search_service_update_concept_concurrent(search_service, entities):
+    search_service.settings.typesense_exclude_if_missing_for_language = False
+    in_flight, most = 0, 0
+
+    async def update(dct, collection):
+        nonlocal in_flight, most
+        in_flight += 1
+        most = max(most, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    search_service.engine.update_concept.side_effect = update
+    await search_service.update_concept(entities[0])
+    assert most == 2
+
+
 async def test_search_service_delete_concept_error(search_service, entities):
     search_service.configured = False
     with pytest.raises(SearchNotConfigured):
@@ -97,19 +162,185 @@ async def test_search_service_search_language_error(search_service):
 async def test_search_service_search_default(search_service):
     await search_service.search("foo", "de")
     search_service.engine.search.assert_called_once_with(
-        query="foo", collection=search_service.languages["de"], semantic=True, prefix=False
+        query="foo",
+        collection=search_service.languages["de"],
+        semantic=True,
+        prefix=False,
+        filters=None,
+        page=1,
+        per_page=50,
     )
 
 
 async def test_search_service_search_semantic(search_service):
     await search_service.search("foo", "de", False)
     search_service.engine.search.assert_called_once_with(
-        query="foo", collection=search_service.languages["de"], semantic=False, prefix=False
+        query="foo",
+        collection=search_service.languages["de"],
+        semantic=False,
+        prefix=False,
+        filters=None,
+        page=1,
+        per_page=50,
     )
 
 
 async def test_search_service_search_suggest(search_service):
     await search_service.suggest("foo", "de")
     search_service.engine.search.assert_called_once_with(
-        query="foo", collection=search_service.languages["de"], semantic=False, prefix=True
+        query="foo",
+        collection=search_service.languages["de"],
+        semantic=False,
+        prefix=True,
+        filters=None,
+        page=1,
+        per_page=50,
     )
+
+
+async def test_search_service_search_filters(search_service):
+    filters = SearchFilter(top_concept_iri="http://example.com/top", max_depth=2)
+    await search_service.suggest("foo", "de", filters=filters, page=3, per_page=10)
+    search_service.engine.search.assert_called_once_with(
+        query="foo",
+        collection=search_service.languages["de"],
+        semantic=False,
+        prefix=True,
+        filters=filters,
+        page=3,
+        per_page=10,
+    )
+
+
+async def stream(concepts):
+    for concept in concepts:
+        yield concept
+
+
+async def test_search_service_reindex(search_service, entities):
+    engine = search_service.engine
+    engine.swap_alias.side_effect = [None, "pyst-concepts-de-old"]
+    search_service.settings.typesense_exclude_if_missing_for_language = False
+    concepts = [entities[0], entities[1], entities[5]]
+
+    result = await search_service.reindex(stream(concepts), batch_size=2, concurrency=1)
+    assert result.concepts == 3
+    en, de = result.collections
+    assert en.startswith("pyst-concepts-en-") and de.startswith("pyst-concepts-de-")
+
+    assert [call[0][0] for call in engine.create_collection.call_args_list] == [en, de]
+    calls = engine.create_concepts.call_args_list
+    assert [(len(call[0][0]), call[0][1]) for call in calls] == [(2, en), (2, de), (1, en), (1, de)]
+    assert [call[0] for call in engine.swap_alias.call_args_list] == [
+        ("pyst-concepts-en", en),
+        ("pyst-concepts-de", de),
+    ]
+    engine.delete_collection.assert_called_once_with("pyst-concepts-de-old")
+
+
+async def test_search_service_reindex_error(search_service, entities):
+    engine = search_service.engine
+    engine.create_concepts.side_effect = ValueError
+
+    with pytest.raises(ExceptionGroup):
+        await search_service.reindex(stream([entities[0]]))
+    created = [call[0][0] for call in engine.create_collection.call_args_list]
+    assert [call[0][0] for call in engine.delete_collection.call_args_list] == created
+    engine.swap_alias.assert_not_called()
+
+
+async def test_search_service_reindex_create_collection_error(search_service):
+    engine = search_service.engine
+    engine.create_collection.side_effect = [None, ValueError]
+
+    with pytest.raises(ValueError):
+        await search_service.reindex(stream([]))
+    # Only the collection which was created is removed
+    first = engine.create_collection.call_args_list[0][0][0]
+    engine.delete_collection.assert_called_once_with(first)
+
+
+async def test_search_service_reindex_unique_collections(search_service):
+    engine = search_service.engine
+    first = await search_service.reindex(stream([]))
+    engine.swap_alias.side_effect = first.collections
+    second = await search_service.reindex(stream([]))
+    assert not set(first.collections).intersection(second.collections)
+    engine.delete_collection.assert_has_calls([call(name) for name in first.collections])
+
+
+async def test_search_service_reindex_same_collection(search_service):
+    engine = search_service.engine
+    engine.swap_alias.side_effect = lambda alias, collection: collection
+
+    await search_service.reindex(stream([]))
+    engine.delete_collection.assert_not_called()
+
+
+async def test_search_service_reindex_configured_error(search_service):
+    search_service.configured = False
+    with pytest.raises(SearchNotConfigured):
+        await search_service.reindex(stream([]))
+
+
+async def test_search_service_index_concepts(search_service, entities):
+    engine = search_service.engine
+    await search_service.index_concepts([entities[0]], ["http://example.com/deleted"])
+
+    ids = [entities[0].to_search_dict("en")["id"], hash_fnv64("http://example.com/deleted")]
+    assert [call[0] for call in engine.delete_concepts.call_args_list] == [
+        (ids, "pyst-concepts-en"),
+        (ids, "pyst-concepts-de"),
+    ]
+    engine.create_concepts.assert_called_once()
+    assert engine.create_concepts.call_args[0][1] == "pyst-concepts-en"
+
+
+async def test_search_service_index_concepts_error(search_service):
+    search_service.configured = False
+    with pytest.raises(SearchNotConfigured):
+        await search_service.index_concepts([], [])
+
+
+async def test_search_service_search_many(search_service):
+    filters = SearchFilter(top_concept_iri="http://example.com/top")
+    await search_service.search_many(
+        [
+            SearchQuery("foo", "de"),
+            SearchQuery(
+                "ba", "en", semantic=True, prefix=True, filters=filters, page=3, per_page=5
+            ),
+        ]
+    )
+    search_service.engine.search_many.assert_called_once_with(
+        [
+            {
+                "query": "foo",
+                "collection": "pyst-concepts-de",
+                "semantic": True,
+                "prefix": False,
+                "filters": None,
+                "page": 1,
+                "per_page": SEARCH_PER_PAGE,
+            },
+            {
+                "query": "ba",
+                "collection": "pyst-concepts-en",
+                "semantic": False,
+                "prefix": True,
+                "filters": filters,
+                "page": 3,
+                "per_page": 5,
+            },
+        ]
+    )
+
+
+async def test_search_service_search_many_empty(search_service):
+    assert await search_service.search_many([]) == []
+    search_service.engine.search_many.assert_not_called()
+
+
+async def test_search_service_search_many_language_error(search_service):
+    with pytest.raises(UnknownLanguage):
+        await search_service.search_many([SearchQuery("foo", "de"), SearchQuery("foo", "xx")])
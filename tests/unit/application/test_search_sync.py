@@ -0,0 +1,143 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+from py_semantic_taxonomy.application.search_sync import SearchIndexSync
+from py_semantic_taxonomy.domain.constants import RelationshipVerbs
+from py_semantic_taxonomy.domain.entities import Change, ChangeEvent, Relationship
+
+
+def change(sequence: int, kind: str, iri: str, operation: str) -> Change:
+    return Change(
+        sequence=sequence,
+        kind=kind,
+        iri=iri,
+        operation=operation,
+        data={},
+        created=datetime.now(timezone.utc),
+    )
+
+
+async def run_once(sync: SearchIndexSync) -> None:
+    task = asyncio.create_task(sync.run())
+    for _ in range(5):
+        await asyncio.sleep(0)
+    task.cancel()
+
+
+async def test_search_index_sync_refresh():
+    service = AsyncMock()
+    service.changes_get.side_effect = [
+        [
+            change(4, "concept", "http://example.com/b", "update"),
+            change(5, "made_of", "http://example.com/c", "create"),
+            change(6, "concept", "http://example.com/b", "update"),
+        ],
+    ]
+    sync = SearchIndexSync(service, since=3)
+    sync.on_change(ChangeEvent(kind="concept", iri="http://example.com/b", operation="update"))
+
+    await run_once(sync)
+    service.changes_get.assert_called_once_with(since=3, limit=1000)
+    service.search_refresh.assert_called_once_with(["http://example.com/b"])
+    service.search_reindex.assert_not_called()
+    assert sync.since == 6
+
+
+async def test_search_index_sync_pages():
+    service = AsyncMock()
+    # Changes to many objects at once are read from the change log, not rebuilt
+    service.changes_get.side_effect = [
+        [change(1, "concept", "http://example.com/a", "update")],
+        [change(2, "concept", "http://example.com/b", "update")],
+        [],
+    ]
+    sync = SearchIndexSync(service, since=0, batch_size=1)
+    sync.on_change(ChangeEvent(kind="concept", iri=None, operation="update"))
+
+    await run_once(sync)
+    assert [call.kwargs["since"] for call in service.changes_get.call_args_list] == [0, 1, 2]
+    assert [call.args[0] for call in service.search_refresh.call_args_list] == [
+        ["http://example.com/a"],
+        ["http://example.com/b"],
+    ]
+    service.search_reindex.assert_not_called()
+    assert sync.since == 2
+
+
+async def test_search_index_sync_relationship():
+    service = AsyncMock()
+    service.changes_get.return_value = [
+        change(1, "concept", "http://example.com/a", "update"),
+        change(2, "relationship", "http://example.com/c", "create"),
+    ]
+    service.concept_descendant_iris.return_value = ["http://example.com/d"]
+    sync = SearchIndexSync(service, since=0)
+
+    await sync.apply_changes()
+    # A relationship can move its source, and so all its descendants, in the hierarchy
+    service.concept_descendant_iris.assert_called_once_with(["http://example.com/c"])
+    service.search_refresh.assert_called_once_with(
+        ["http://example.com/a", "http://example.com/c", "http://example.com/d"]
+    )
+
+
+async def test_search_index_sync_concept_create_delete():
+    service = AsyncMock()
+    service.changes_get.return_value = [
+        change(1, "concept", "http://example.com/a", "create"),
+        change(2, "concept", "http://example.com/b", "delete"),
+    ]
+    service.relationships_get.return_value = [
+        Relationship(
+            source="http://example.com/c",
+            target="http://example.com/b",
+            predicate=RelationshipVerbs.broader,
+        )
+    ]
+    service.concept_descendant_iris.return_value = ["http://example.com/d"]
+    sync = SearchIndexSync(service, since=0)
+
+    await sync.apply_changes()
+    # Narrower concepts of a deleted concept are found from its remaining relationships
+    service.relationships_get.assert_called_once_with(
+        "http://example.com/b", source=False, target=True, verb=RelationshipVerbs.broader
+    )
+    service.concept_descendant_iris.assert_called_once_with(
+        ["http://example.com/a", "http://example.com/c"]
+    )
+    service.search_refresh.assert_called_once_with(
+        [
+            "http://example.com/a",
+            "http://example.com/b",
+            "http://example.com/c",
+            "http://example.com/d",
+        ]
+    )
+
+
+async def test_search_index_sync_nothing_new():
+    service = AsyncMock()
+    service.changes_get.return_value = []
+    sync = SearchIndexSync(service, since=7)
+
+    assert not await sync.apply_changes()
+    service.search_refresh.assert_not_called()
+    assert sync.since == 7
+
+
+async def test_search_index_sync_failure():
+    service = AsyncMock()
+    service.changes_get.return_value = [change(8, "concept", "http://example.com/a", "update")]
+    service.search_refresh.side_effect = OSError
+    sync = SearchIndexSync(service, since=7)
+    sync.on_change(None)
+
+    task = asyncio.create_task(sync.run())
+    for _ in range(5):
+        await asyncio.sleep(0)
+    service.search_refresh.assert_called_once()
+    assert not task.done()
+    task.cancel()
+    # The failed changes are read again next time
+    assert sync.since == 7
@@ -35,3 +35,27 @@ async def test_object_type_get_association(graph_service, entities):
     result = await graph_service.get_object_type(entities[8].id_)
     assert result == Association
     mock_kos_graph.get_object_type.assert_called_with(iri=entities[8].id_)
+
+
+async def test_object_types_get(graph_service, entities):
+    mock_kos_graph = graph_service.graph
+    mock_kos_graph.get_object_types.return_value = {entities[0].id_: Concept}
+
+    result = await graph_service.get_object_types([entities[0].id_])
+    assert result == {entities[0].id_: Concept}
+    mock_kos_graph.get_object_types.assert_called_with(iris=[entities[0].id_])
+
+
+async def test_search_reindex(graph_service):
+    graph_service.graph.concept_stream_all.return_value = stream = object()
+
+    await graph_service.search_reindex(batch_size=10, concurrency=2)
+    graph_service.graph.concept_stream_all.assert_called_once_with(
+        concept_scheme_iri=None, top_concepts_only=False
+    )
+    graph_service.search.reindex.assert_called_once_with(
+        stream,
+        batch_size=10,
+        concurrency=2,
+        hierarchy=graph_service.graph.concept_search_hierarchy,
+    )
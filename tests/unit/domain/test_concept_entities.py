@@ -1,10 +1,13 @@
-from dataclasses import fields
+import copy
+from dataclasses import asdict, fields
+
+import pytest
 
 from py_semantic_taxonomy.adapters.routers import request_dto as request
 from py_semantic_taxonomy.adapters.routers import response_dto as response
 from py_semantic_taxonomy.domain.constants import RDF_MAPPING as RDF
 from py_semantic_taxonomy.domain.constants import SKOS_RELATIONSHIP_PREDICATES, RelationshipVerbs
-from py_semantic_taxonomy.domain.entities import Concept
+from py_semantic_taxonomy.domain.entities import Concept, SearchHierarchy, json_ld_keys
 
 
 def test_concept_domain_request_dto_same_fields():
@@ -151,10 +154,25 @@ def test_concept_to_search_dict(cn):
             "SECTION I - LIVE ANIMALS; ANIMAL PRODUCTS",
             "E PRODUTOS DO REINO ANIMAL",
         ],
+        "concept_schemes": ["http://data.europa.eu/xsp/cn2024/cn2024"],
     }
     assert given == expected, "Conversion to search dict failed"
 
 
+def test_concept_to_search_dict_hierarchy(cn):
+    hierarchy = SearchHierarchy(depth=2, top_concepts=["http://example.com/top"])
+    given = Concept.from_json_ld(cn.concept_top).to_search_dict("en", hierarchy)
+    assert given["depth"] == 2
+    assert given["top_concepts"] == ["http://example.com/top"]
+
+
+def test_concept_to_search_dict_non_ascii_iri(cn):
+    cn.concept_top["@id"] = "http://example.com/Bäume"
+    given = Concept.from_json_ld(cn.concept_top).to_search_dict("en")
+    assert given["url"] == "http%3A%2F%2Fexample.com%2FB%C3%A4ume"
+    assert given["id"]
+
+
 def test_concept_from_json_ld(cn):
     given = Concept.from_json_ld(cn.concept_top)
     expected = Concept(
@@ -218,3 +236,40 @@ def test_concept_to_json_ld(cn):
     }
     given = Concept.from_json_ld(cn.concept_top).to_json_ld()
     assert given == expected, "Conversion to JSON-LD failed"
+
+
+def test_concept_json_ld_keys():
+    keys = json_ld_keys(Concept)
+    assert [attr for attr, _ in keys] == [
+        attr for attr in RDF if attr in {f.name for f in fields(Concept)}
+    ], "Attributes not in `RDF_MAPPING` order"
+    assert all(RDF[attr] == label for attr, label in keys)
+    assert "extra" not in dict(keys)
+    assert json_ld_keys(Concept) is keys, "Mapping not cached"
+
+
+def test_concept_from_json_ld_other_mapped_keys_in_extra(cn):
+    obj = cn.concept_top | {RDF["version"]: [{"@value": "1"}]}
+    given = Concept.from_json_ld(obj)
+    assert given.extra[RDF["version"]] == [{"@value": "1"}]
+    assert RDF["version"] in given.to_json_ld()
+
+
+def test_concept_from_json_ld_doesnt_change_input(cn):
+    obj = copy.deepcopy(cn.concept_top)
+    Concept.from_json_ld(obj)
+    assert obj == cn.concept_top
+
+
+def test_concept_to_db_dict_shallow(cn):
+    concept = Concept.from_json_ld(cn.concept_top)
+    given = concept.to_db_dict()
+    assert given == asdict(concept)
+    assert given["pref_labels"] is concept.pref_labels
+
+
+def test_concept_slots(cn):
+    concept = Concept.from_json_ld(cn.concept_top)
+    assert not hasattr(concept, "__dict__")
+    with pytest.raises(AttributeError):
+        concept.label = "foo"
@@ -0,0 +1,47 @@
+import base64
+import struct
+
+from py_semantic_taxonomy.domain.hash_utils import fnv64, hash_fnv64, hash_fnv64_many
+
+# Computed with the original byte-by-byte implementation; search document IDs must not change
+KNOWN = {
+    "http://data.europa.eu/xsp/cn2024/010011000090": "iMEtIMBiU8E",
+    "urn:isbn:0451450523": "qTApkN5NM80",
+    "": "hVpoOmVYlCQ",
+}
+
+
+def test_fnv64():
+    assert fnv64(b"hello") == 0x7B495389BDBDD4C7
+    assert fnv64(b"lo", fnv64(b"hel")) == fnv64(b"hello")
+
+
+def test_hash_fnv64():
+    for iri, expected in KNOWN.items():
+        assert hash_fnv64(iri) == expected
+    assert hash_fnv64("http://data.europa.eu/xsp/cn2024/010011000090", salt="") == "qKKtzdCaa9M"
+    assert hash_fnv64("urn:isbn:0451450523", salt="") == "SX5auRA6MIc"
+
+
+def test_hash_fnv64_many():
+    assert hash_fnv64_many(list(KNOWN) * 2) == list(KNOWN.values()) * 2
+    assert hash_fnv64_many(iri for iri in KNOWN) == list(KNOWN.values())
+    assert hash_fnv64_many([]) == []
+
+
+def test_hash_fnv64_non_ascii():
+    # IRIs may contain Unicode characters; these are hashed as UTF-8
+    assert hash_fnv64("http://example.com/Bäume") != hash_fnv64("http://example.com/Baume")
+    assert (
+        hash_fnv64("http://example.com/Bäume") == hash_fnv64_many(["http://example.com/Bäume"])[0]
+    )
+    assert hash_fnv64("http://example.com/Bäume", salt="") == base64.urlsafe_b64encode(
+        struct.pack("<Q", fnv64("http://example.com/Bäume".encode("utf-8")))
+    )[:-1].decode("ascii")
+
+
+def test_hash_fnv64_cached():
+    hash_fnv64.cache_clear()
+    hash_fnv64_many(list(KNOWN) * 3)
+    info = hash_fnv64.cache_info()
+    assert (info.hits, info.misses) == (6, 3)
@@ -0,0 +1,162 @@
+import inspect
+
+import pytest
+
+from py_semantic_taxonomy.adapters.persistence.cache import (
+    CACHED_READS,
+    MISSING,
+    WRITES,
+    CachedKOSGraphDatabase,
+    TTLCache,
+)
+from py_semantic_taxonomy.domain.entities import CacheStats, Concept, ConceptNotFoundError
+from py_semantic_taxonomy.domain.ports import KOSGraphDatabase
+
+
+@pytest.fixture
+def cached(graph) -> CachedKOSGraphDatabase:
+    return CachedKOSGraphDatabase(graph, maxsize=100, ttl=60)
+
+
+def test_all_protocol_methods_classified():
+    methods = {
+        name
+        for name, _ in inspect.getmembers(KOSGraphDatabase, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    uncached_reads = {
+        "unit_of_work",
+        "cache_stats",
+        "invalidate_cache",
+        "get_object_types",
+        "concept_get_many",
+        "concept_search_hierarchy",
+        "concept_descendant_iris",
+        "concept_get_all",
+        "concept_stream_all",
+        "concept_scheme_get_all",
+        "concept_scheme_stream_all",
+        "relationship_source_target_share_known_concept_scheme",
+        "relationships_crossing_concept_schemes",
+        "correspondence_get_all",
+        "correspondence_stream_all",
+        "association_get_all",
+        "association_stream_all",
+        "changes_get",
+        "changes_stream",
+        "changes_last_sequence",
+        "search_outbox_add",
+        "search_outbox_claim",
+        "search_outbox_complete",
+        "search_outbox_retry",
+    }
+    assert methods == CACHED_READS | WRITES | uncached_reads
+
+
+def test_ttl_cache_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+    assert cache.hits == 2
+
+
+def test_ttl_cache_expiry():
+    cache = TTLCache(maxsize=2, ttl=-1)
+    cache.set("a", 1)
+    assert cache.get("a") is MISSING
+    assert cache.misses == 1
+    assert len(cache) == 0
+
+
+async def test_cached_read(sqlite, entities, cached):
+    assert await cached.concept_get(entities[0].id_) == entities[0]
+    assert await cached.concept_get(iri=entities[0].id_) == entities[0]
+    assert cached.cache_stats() == CacheStats(hits=1, misses=1, size=1, maxsize=100)
+
+
+async def test_cached_read_returns_copy(sqlite, entities, cached):
+    result = await cached.concept_get(entities[0].id_)
+    result.pref_labels.clear()
+    assert await cached.concept_get(entities[0].id_) == entities[0]
+
+
+async def test_cached_read_not_found_not_cached(sqlite, cached):
+    with pytest.raises(ConceptNotFoundError):
+        await cached.concept_get("http://example.com/foo")
+    assert len(cached.cache) == 0
+
+
+async def test_write_invalidates(sqlite, cn, entities, cached):
+    await cached.concept_get(entities[0].id_)
+    await cached.concept_scheme_get_all_iris()
+
+    new = Concept.from_json_ld(cn.concept_low)
+    await cached.concept_create(new)
+    assert len(cached.cache) == 0
+    assert await cached.concept_get(new.id_) == new
+
+
+async def test_unit_of_work_bypasses_cache(sqlite, cn, entities, cached):
+    await cached.concept_get(entities[0].id_)
+    new = Concept.from_json_ld(cn.concept_low)
+
+    with pytest.raises(ValueError):
+        async with cached.unit_of_work():
+            await cached.concept_create(new)
+            assert await cached.concept_get(new.id_) == new
+            raise ValueError
+
+    assert len(cached.cache) == 0
+    with pytest.raises(ConceptNotFoundError):
+        await cached.concept_get(new.id_)
+
+
+async def test_read_only_unit_of_work_keeps_cache(sqlite, entities, cached):
+    await cached.concept_get(entities[0].id_)
+    async with cached.unit_of_work():
+        await cached.concept_get(entities[1].id_)
+    assert len(cached.cache) == 2
+
+
+async def test_unit_of_work_without_writes_uses_cache(sqlite, entities, cached):
+    await cached.concept_get(entities[0].id_)
+    async with cached.unit_of_work():
+        assert await cached.concept_get(entities[0].id_) == entities[0]
+        assert await cached.concept_get_many([entities[0].id_]) == {entities[0].id_: entities[0]}
+    assert cached.cache.hits == 2
+
+
+async def test_unit_of_work_bypasses_cache_after_write(sqlite, cn, entities, cached):
+    new = Concept.from_json_ld(cn.concept_low)
+    async with cached.unit_of_work():
+        await cached.concept_get(entities[0].id_)
+        await cached.concept_create(new)
+        await cached.concept_get(entities[0].id_)
+        await cached.concept_get_many([entities[0].id_])
+    assert cached.cache.hits == 0
+
+
+async def test_concept_get_many_shares_cache(sqlite, entities, cached):
+    await cached.concept_get(entities[0].id_)
+
+    result = await cached.concept_get_many([entities[0].id_, entities[1].id_, "foo"])
+    assert result == {entities[0].id_: entities[0], entities[1].id_: entities[1]}
+    assert cached.cache.hits == 1
+
+    await cached.concept_get(entities[1].id_)
+    assert cached.cache.hits == 2
+
+
+async def test_graph_without_cache_has_no_stats(sqlite, graph):
+    assert graph.cache_stats() is None
+
+
+async def test_invalidate_cache(sqlite, entities, cached):
+    await cached.concept_get(entities[0].id_)
+    cached.invalidate_cache()
+    assert len(cached.cache) == 0
@@ -0,0 +1,125 @@
+import asyncio
+import contextvars
+from copy import deepcopy
+from unittest.mock import AsyncMock
+
+import pytest
+
+from py_semantic_taxonomy.domain.constants import RelationshipVerbs
+from py_semantic_taxonomy.domain.entities import Concept, Relationship
+
+
+def summary(changes) -> list[tuple]:
+    return [(change.kind, change.iri, change.operation, change.data) for change in changes]
+
+
+async def test_changes_concept(sqlite, cn, graph):
+    concept = Concept.from_json_ld(cn.concept_low)
+    await graph.concept_create(concept)
+    await graph.concept_update(concept)
+    await graph.concept_delete(concept.id_)
+    await graph.concept_delete("http://example.com/missing")
+
+    changes = await graph.changes_get()
+    assert [change.sequence for change in changes] == [1, 2, 3]
+    assert summary(changes) == [
+        ("concept", concept.id_, "create", {}),
+        ("concept", concept.id_, "update", {}),
+        ("concept", concept.id_, "delete", {}),
+    ]
+    assert all(change.created for change in changes)
+
+
+async def test_changes_last_sequence(sqlite, cn, graph):
+    assert await graph.changes_last_sequence() == 0
+    await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+    await graph.concept_scheme_delete(cn.scheme_2023["@id"])
+    assert await graph.changes_last_sequence() == 2
+
+
+async def test_changes_since_limit(sqlite, cn, graph):
+    concepts = [Concept.from_json_ld(cn.concept_low)]
+    await graph.concept_create_many(concepts)
+    await graph.concept_scheme_delete(cn.scheme_2023["@id"])
+    await graph.association_delete(cn.association_top["@id"])
+
+    changes = await graph.changes_get(since=1, limit=1)
+    assert summary(changes) == [("concept_scheme", cn.scheme_2023["@id"], "delete", {})]
+    assert await graph.changes_get(since=3) == []
+
+    streamed = [change async for change in graph.changes_stream(since=1)]
+    assert summary(streamed) == [
+        ("concept_scheme", cn.scheme_2023["@id"], "delete", {}),
+        ("association", cn.association_top["@id"], "delete", {}),
+    ]
+
+
+async def test_changes_relationships(sqlite, cn, graph):
+    rel = Relationship(source="a", target="b", predicate=RelationshipVerbs.exact_match)
+    data = {"target": "b", "predicate": str(RelationshipVerbs.exact_match)}
+    missing = Relationship(source="a", target="c", predicate=RelationshipVerbs.exact_match)
+    await graph.relationships_create([rel])
+    await graph.relationships_delete([rel, missing])
+    await graph.relationships_delete([missing])
+
+    changes = await graph.changes_get()
+    assert summary(changes) == [
+        ("relationship", rel.source, "create", data),
+        ("relationship", rel.source, "delete", data),
+    ]
+
+
+async def test_changes_made_of(sqlite, graph, made_of):
+    await graph.made_of_add(made_of)
+    await graph.made_of_add(made_of)
+    await graph.made_of_remove(made_of)
+    await graph.made_of_remove(made_of)
+
+    stored = sorted(made_of.made_ofs, key=lambda x: x["@id"])
+    changes = await graph.changes_get()
+    assert summary(changes) == [
+        ("made_of", made_of.id_, "create", {"made_ofs": made_of.made_ofs}),
+        ("made_of", made_of.id_, "delete", {"made_ofs": stored}),
+    ]
+
+
+async def test_changes_rolled_back(sqlite, cn, graph):
+    try:
+        async with graph.unit_of_work():
+            await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert await graph.changes_get() == []
+
+
+async def test_changes_no_op_writes_dont_notify(sqlite, cn, graph, made_of, monkeypatch):
+    monkeypatch.setattr(graph, "_notify", AsyncMock())
+    await graph.concept_delete("http://example.com/missing")
+    await graph.relationships_delete(
+        [Relationship(source="a", target="b", predicate=RelationshipVerbs.exact_match)]
+    )
+    await graph.association_delete("http://example.com/missing")
+    await graph.made_of_remove(made_of)
+
+    assert await graph.changes_get() == []
+    graph._notify.assert_not_called()
+
+
+@pytest.mark.postgres
+async def test_changes_late_commit(postgres, cn, graph):
+    first, second = deepcopy(cn.concept_low), deepcopy(cn.concept_low)
+    second["@id"] = "http://example.com/second"
+    async with graph.unit_of_work():
+        await graph.concept_create(Concept.from_json_ld(first))
+        # Another writer isn't blocked, but its change is hidden until the older transaction
+        # has committed, as that change gets a lower sequence number
+        await asyncio.create_task(
+            graph.concept_create(Concept.from_json_ld(second)), context=contextvars.Context()
+        )
+        assert await asyncio.create_task(graph.changes_get(), context=contextvars.Context()) == []
+
+    changes = await graph.changes_get()
+    assert [change.iri for change in changes] == [first["@id"], second["@id"]]
+    assert changes[0].sequence < changes[1].sequence
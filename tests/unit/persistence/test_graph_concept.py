@@ -2,9 +2,13 @@ import pytest
 
 from py_semantic_taxonomy.domain.constants import RelationshipVerbs
 from py_semantic_taxonomy.domain.entities import (
+    Association,
     Concept,
     ConceptNotFoundError,
+    ConceptScheme,
+    Correspondence,
     DuplicateIRI,
+    NotFoundError,
     Relationship,
 )
 
@@ -14,6 +18,56 @@ async def test_get_object_type_concept(sqlite, graph):
     assert concept is Concept, "Wrong result type"
 
 
+async def test_get_object_type_not_found(sqlite, graph):
+    with pytest.raises(NotFoundError):
+        await graph.get_object_type(iri="http://data.europa.eu/xsp/cn2024/woof")
+
+
+async def test_get_object_types(sqlite, entities, graph):
+    given = await graph.get_object_types(
+        iris=[
+            entities[0].id_,
+            entities[2].id_,
+            entities[3].id_,
+            entities[8].id_,
+            entities[0].id_,
+            "http://data.europa.eu/xsp/cn2024/woof",
+        ]
+    )
+    assert given == {
+        entities[0].id_: Concept,
+        entities[2].id_: ConceptScheme,
+        entities[3].id_: Correspondence,
+        entities[8].id_: Association,
+    }
+
+
+async def test_get_object_types_many(sqlite, entities, graph):
+    iris = [f"http://data.europa.eu/xsp/cn2024/missing-{index}" for index in range(12_000)]
+    given = await graph.get_object_types(iris=iris + [entities[0].id_, entities[8].id_])
+    assert given == {entities[0].id_: Concept, entities[8].id_: Association}
+
+
+@pytest.mark.postgres
+async def test_get_object_types_many_postgres(postgres, entities, graph):
+    # More bind parameters than asyncpg allows in one statement if not batched
+    iris = [f"http://data.europa.eu/xsp/cn2024/missing-{index}" for index in range(12_000)]
+    given = await graph.get_object_types(iris=iris + [entities[0].id_, entities[8].id_])
+    assert given == {entities[0].id_: Concept, entities[8].id_: Association}
+
+
+async def test_get_object_types_batched(sqlite, entities, graph, monkeypatch):
+    monkeypatch.setattr("py_semantic_taxonomy.adapters.persistence.graph.OBJECT_TYPE_BATCH_SIZE", 1)
+    given = await graph.get_object_types(
+        iris=[entities[0].id_, entities[2].id_, "http://data.europa.eu/xsp/cn2024/woof"]
+    )
+    assert given == {entities[0].id_: Concept, entities[2].id_: ConceptScheme}
+
+
+async def test_get_object_types_empty(sqlite, graph):
+    assert await graph.get_object_types(iris=[]) == {}
+
+
 async def test_get_concept(sqlite, entities, graph):
     concept = await graph.concept_get(iri="http://data.europa.eu/xsp/cn2024/010011000090")
     assert isinstance(concept, Concept), "Wrong result type"
@@ -25,6 +79,38 @@ async def test_get_concept_not_found(sqlite, graph):
         await graph.concept_get(iri="http://data.europa.eu/xsp/cn2024/woof")
 
 
+async def test_get_many_concepts(sqlite, entities, graph):
+    given = await graph.concept_get_many(
+        iris=[entities[0].id_, entities[1].id_, "http://data.europa.eu/xsp/cn2024/woof"]
+    )
+    assert given == {entities[0].id_: entities[0], entities[1].id_: entities[1]}
+
+
+async def test_get_many_concepts_empty(sqlite, graph):
+    assert await graph.concept_get_many(iris=[]) == {}
+
+
+async def test_concept_get_all_paginated(sqlite, entities, graph):
+    expected = sorted([entities[0], entities[1], entities[5], entities[6]], key=lambda x: x.id_)
+    first = await graph.concept_get_all(concept_scheme_iri=None, top_concepts_only=False, limit=3)
+    assert first == expected[:3]
+    second = await graph.concept_get_all(
+        concept_scheme_iri=None, top_concepts_only=False, limit=3, after=first[-1].id_
+    )
+    assert second == expected[3:]
+
+
+async def test_concept_stream_all(sqlite, entities, graph):
+    expected = sorted([entities[0], entities[1], entities[5], entities[6]], key=lambda x: x.id_)
+    given = [
+        obj
+        async for obj in graph.concept_stream_all(
+            concept_scheme_iri=None, top_concepts_only=False, after=expected[0].id_
+        )
+    ]
+    assert given == expected[1:]
+
+
 async def test_create_concept(sqlite, cn, entities, graph):
     expected = Concept.from_json_ld(cn.concept_low)
 
@@ -175,3 +261,26 @@ async def test_concept_broader_in_ascending_order(postgres, cn, graph):
     result = await graph.concept_broader_in_ascending_order(a.id_, cn.scheme["@id"])
     result_ids = [obj.id_ for obj in result]
     assert result_ids == expected
+
+
+async def test_concept_create_many(sqlite, cn, graph):
+    expected = Concept.from_json_ld(cn.concept_low)
+    await graph.concept_create_many([expected])
+
+    assert await graph.concept_get(iri=expected.id_) == expected
+
+
+async def test_concept_create_many_duplicate(sqlite, cn, entities, graph):
+    new = Concept.from_json_ld(cn.concept_low)
+    with pytest.raises(DuplicateIRI):
+        await graph.concept_create_many([new, entities[0]])
+
+    with pytest.raises(ConceptNotFoundError):
+        await graph.concept_get(iri=new.id_)
+
+
+async def test_concept_create_many_duplicate_batched(sqlite, cn, entities, graph, monkeypatch):
+    monkeypatch.setattr("py_semantic_taxonomy.adapters.persistence.graph.IN_CLAUSE_BATCH_SIZE", 1)
+    new = Concept.from_json_ld(cn.concept_low)
+    with pytest.raises(DuplicateIRI):
+        await graph.concept_create_many([new, entities[0]])
@@ -46,12 +46,12 @@ async def test_create_correspondence(sqlite, cn, graph):
 async def test_update_correspondence(sqlite, cn, graph):
     expected = Correspondence.from_json_ld(cn.correspondence)
     # This will be ignored
-    expected.made_of = ["foo", "bar"]
+    expected.made_ofs = ["foo", "bar"]
 
     response = await graph.correspondence_update(correspondence=expected)
     assert isinstance(response, Correspondence), "Wrong result type"
 
-    expected.made_of = []
+    expected.made_ofs = []
     assert response == expected, "Data attributes from database differ"
 
     given = await graph.correspondence_get(iri=cn.correspondence["@id"])
@@ -28,6 +28,18 @@ async def test_concept_scheme_get_all(sqlite, entities, graph):
     assert cs == sorted([entities[4], entities[2]], key=lambda x: x.id_)
 
 
+async def test_concept_scheme_get_all_paginated(sqlite, entities, graph):
+    expected = sorted([entities[4], entities[2]], key=lambda x: x.id_)
+    assert await graph.concept_scheme_get_all(limit=1) == expected[:1]
+    assert await graph.concept_scheme_get_all(limit=1, after=expected[0].id_) == expected[1:]
+    assert await graph.concept_scheme_get_all(after=expected[1].id_) == []
+
+
+async def test_concept_scheme_stream_all(sqlite, entities, graph):
+    given = [obj async for obj in graph.concept_scheme_stream_all()]
+    assert given == sorted([entities[4], entities[2]], key=lambda x: x.id_)
+
+
 async def test_get_concept_scheme_not_found(sqlite, graph):
     with pytest.raises(ConceptSchemeNotFoundError):
         await graph.concept_scheme_get(iri="http://data.europa.eu/xsp/cn2024/woof")
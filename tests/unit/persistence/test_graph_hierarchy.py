@@ -0,0 +1,176 @@
+import pytest
+from sqlalchemy import select
+
+from py_semantic_taxonomy.adapters.persistence.tables import concept_closure_table
+from py_semantic_taxonomy.domain.constants import RelationshipVerbs
+from py_semantic_taxonomy.domain.entities import (
+    Concept,
+    HierarchyNode,
+    Relationship,
+    SearchHierarchy,
+)
+
+
+@pytest.fixture
+async def closure_graph(cn_db_engine):
+    from py_semantic_taxonomy.adapters.persistence.graph import PostgresKOSGraphDatabase
+
+    graph = PostgresKOSGraphDatabase(engine=cn_db_engine, closure=True)
+    await graph.closure_rebuild()
+    return graph
+
+
+async def closure_rows(graph) -> set[tuple[str, str, int]]:
+    async with graph.engine.connect() as conn:
+        stmt = select(
+            concept_closure_table.c.descendant,
+            concept_closure_table.c.ancestor,
+            concept_closure_table.c.depth,
+        )
+        return set((await conn.execute(stmt)).fetchall())
+
+
+async def test_closure_rebuild(sqlite, cn, graph, closure_graph):
+    assert await closure_graph.closure_rebuild() == 2
+    assert await closure_rows(closure_graph) == {
+        (cn.concept_mid["@id"], cn.concept_top["@id"], 1),
+        (cn.concept_2023_low["@id"], cn.concept_2023_top["@id"], 1),
+    }
+
+
+@pytest.mark.parametrize("closure", [True, False])
+async def test_concept_descendants(sqlite, cn, graph, closure_graph, closure):
+    graph = closure_graph if closure else graph
+    await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+
+    result = await graph.concept_descendants(concept_iri=cn.concept_top["@id"])
+    assert [obj.id_ for obj in result] == [cn.concept_mid["@id"], cn.concept_low["@id"]]
+    assert await graph.concept_descendants(concept_iri=cn.concept_low["@id"]) == []
+
+
+@pytest.mark.parametrize("closure", [True, False])
+async def test_concept_descendant_iris(sqlite, cn, graph, closure_graph, closure):
+    graph = closure_graph if closure else graph
+    await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+
+    given = await graph.concept_descendant_iris(
+        [cn.concept_top["@id"], cn.concept_mid["@id"], cn.concept_low["@id"]]
+    )
+    assert given == sorted([cn.concept_mid["@id"], cn.concept_low["@id"]])
+    assert await graph.concept_descendant_iris([cn.concept_low["@id"]]) == []
+    assert await graph.concept_descendant_iris([]) == []
+
+
+@pytest.mark.parametrize("closure", [True, False])
+async def test_relationships_subtree(sqlite, cn, graph, closure_graph, relationships, closure):
+    graph = closure_graph if closure else graph
+    await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+
+    result = await graph.relationships_subtree(concept_iri=cn.concept_top["@id"])
+    assert result == [relationships[3], relationships[4]]
+    assert await graph.relationships_subtree(concept_iri=cn.concept_low["@id"]) == []
+
+
+async def test_closure_concept_create(sqlite, cn, closure_graph):
+    await closure_graph.concept_create(Concept.from_json_ld(cn.concept_low))
+    rows = await closure_rows(closure_graph)
+    assert (cn.concept_low["@id"], cn.concept_mid["@id"], 1) in rows
+    assert (cn.concept_low["@id"], cn.concept_top["@id"], 2) in rows
+
+
+async def test_closure_concept_delete(sqlite, cn, closure_graph):
+    await closure_graph.concept_create(Concept.from_json_ld(cn.concept_low))
+    await closure_graph.concept_delete(cn.concept_mid["@id"])
+
+    assert await closure_rows(closure_graph) == {
+        (cn.concept_2023_low["@id"], cn.concept_2023_top["@id"], 1),
+    }
+
+
+async def test_closure_relationships_delete_and_create(sqlite, cn, closure_graph, relationships):
+    await closure_graph.concept_create(Concept.from_json_ld(cn.concept_low))
+
+    await closure_graph.relationships_delete([relationships[3]])
+    assert await closure_graph.concept_descendants(concept_iri=cn.concept_top["@id"]) == []
+    rows = await closure_rows(closure_graph)
+    assert (cn.concept_low["@id"], cn.concept_mid["@id"], 1) in rows
+    assert (cn.concept_low["@id"], cn.concept_top["@id"], 2) not in rows
+
+    await closure_graph.relationships_create([relationships[3]])
+    assert (cn.concept_low["@id"], cn.concept_top["@id"], 2) in await closure_rows(closure_graph)
+
+
+async def test_closure_polyhierarchy_shortest_depth(sqlite, cn, closure_graph):
+    await closure_graph.concept_create(Concept.from_json_ld(cn.concept_low))
+    await closure_graph.relationships_create(
+        [
+            Relationship(
+                source=cn.concept_low["@id"],
+                target=cn.concept_top["@id"],
+                predicate=RelationshipVerbs.broader,
+            )
+        ]
+    )
+    rows = await closure_rows(closure_graph)
+    assert (cn.concept_low["@id"], cn.concept_top["@id"], 1) in rows
+    assert (cn.concept_low["@id"], cn.concept_top["@id"], 2) not in rows
+
+
+@pytest.mark.parametrize("closure", [True, False])
+async def test_concept_descendants_max_depth(sqlite, cn, graph, closure_graph, closure):
+    graph = closure_graph if closure else graph
+    await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+
+    result = await graph.concept_descendants(concept_iri=cn.concept_top["@id"], max_depth=1)
+    assert [obj.id_ for obj in result] == [cn.concept_mid["@id"]]
+
+
+@pytest.mark.parametrize("closure", [True, False])
+async def test_concept_tree(sqlite, cn, graph, closure_graph, closure):
+    graph = closure_graph if closure else graph
+    await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+    await graph.relationships_create(
+        [
+            Relationship(
+                source=cn.concept_low["@id"],
+                target=cn.concept_top["@id"],
+                predicate=RelationshipVerbs.narrower,
+            )
+        ]
+    )
+
+    result = await graph.concept_tree(concept_iri=cn.concept_top["@id"], language="en")
+    assert result == [
+        HierarchyNode(
+            id_=cn.concept_mid["@id"],
+            depth=1,
+            parent=cn.concept_top["@id"],
+            pref_label="CHAPTER 1 - LIVE ANIMALS",
+        ),
+        HierarchyNode(
+            id_=cn.concept_low["@id"],
+            depth=2,
+            parent=cn.concept_mid["@id"],
+            pref_label="0101 Live horses, asses, mules and hinnies",
+        ),
+    ]
+
+    result = await graph.concept_tree(concept_iri=cn.concept_top["@id"], max_depth=1)
+    assert result == [
+        HierarchyNode(id_=cn.concept_mid["@id"], depth=1, parent=cn.concept_top["@id"])
+    ]
+
+
+@pytest.mark.parametrize("closure", [True, False])
+async def test_concept_search_hierarchy(sqlite, cn, graph, closure_graph, closure):
+    graph = closure_graph if closure else graph
+    await graph.concept_create(Concept.from_json_ld(cn.concept_low))
+    top, mid, low = cn.concept_top["@id"], cn.concept_mid["@id"], cn.concept_low["@id"]
+
+    result = await graph.concept_search_hierarchy([low, mid, top])
+    assert result == {
+        low: SearchHierarchy(depth=2, top_concepts=[top]),
+        mid: SearchHierarchy(depth=1, top_concepts=[top]),
+        top: SearchHierarchy(depth=0, top_concepts=[top]),
+    }
+    assert await graph.concept_search_hierarchy([]) == {}
@@ -65,6 +65,23 @@ async def test_delete_concept(sqlite, graph, relationships):
     assert response == 0, "Wrong number of deleted concepts"
 
 
+async def test_delete_relationships_batched(sqlite, graph, relationships, monkeypatch):
+    monkeypatch.setattr("py_semantic_taxonomy.adapters.persistence.graph.IN_CLAUSE_BATCH_SIZE", 2)
+    wrong_predicate = Relationship(
+        source=relationships[3].source,
+        target=relationships[3].target,
+        predicate=RelationshipVerbs.narrower,
+    )
+    response = await graph.relationships_delete(relationships[:3] + [wrong_predicate])
+    assert response == 3
+
+    assert await graph.relationships_get(iri=relationships[3].source) == [relationships[3]]
+
+
+async def test_delete_relationships_empty(sqlite, graph):
+    assert await graph.relationships_delete([]) == 0
+
+
 async def test_relationship_source_target_share_known_concept_scheme_internal(
     sqlite, graph, cn, relationships
 ):
@@ -181,3 +198,46 @@ async def test_known_concept_schemes_for_concept_hierarchical_relationships(
 
     found = await graph.known_concept_schemes_for_concept_hierarchical_relationships(one)
     assert found == [a, b, e]
+
+
+@pytest.mark.parametrize("batch_size", [1, 5000])
+async def test_relationships_crossing_concept_schemes(
+    sqlite, graph, cn, relationships, monkeypatch, batch_size
+):
+    monkeypatch.setattr(
+        "py_semantic_taxonomy.adapters.persistence.graph.IN_CLAUSE_BATCH_SIZE", batch_size
+    )
+    new_scheme = cn.scheme
+    new_scheme["@id"] = "http://example.com/foo"
+    await graph.concept_scheme_create(ConceptScheme.from_json_ld(new_scheme))
+
+    new_concept = cn.concept_low
+    new_concept[f"{SKOS}inScheme"] = [{"@id": "http://example.com/foo"}]
+    new_concept["@id"] = "http://example.com/bar"
+    await graph.concept_create(Concept.from_json_ld(new_concept))
+
+    cross_cs = [
+        Relationship(
+            source=relationships[3].source,
+            target=new_concept["@id"],
+            predicate=RelationshipVerbs.broader,
+        ),
+        Relationship(
+            source=new_concept["@id"],
+            target=relationships[3].target,
+            predicate=RelationshipVerbs.narrower,
+        ),
+    ]
+    external = Relationship(
+        source=relationships[3].source,
+        target="http://example.com/baz",
+        predicate=RelationshipVerbs.broader,
+    )
+    result = await graph.relationships_crossing_concept_schemes(
+        [relationships[3], external] + cross_cs
+    )
+    assert result == cross_cs
+
+
+async def test_relationships_crossing_concept_schemes_empty(sqlite, graph):
+    assert await graph.relationships_crossing_concept_schemes([]) == []
@@ -0,0 +1,55 @@
+async def claim(graph, limit: int = 10, lease: float = 60, max_attempts: int = 3):
+    return await graph.search_outbox_claim(limit=limit, lease=lease, max_attempts=max_attempts)
+
+
+async def test_search_outbox_claim_complete(sqlite, graph):
+    await graph.search_outbox_add(["http://example.com/a", "http://example.com/b"])
+    await graph.search_outbox_add([])
+
+    items = await claim(graph, limit=1)
+    assert [(item.iri, item.attempts) for item in items] == [("http://example.com/a", 1)]
+    # Claimed items are hidden until their lease runs out
+    assert [item.iri for item in await claim(graph)] == ["http://example.com/b"]
+    assert await claim(graph) == []
+
+    await graph.search_outbox_complete([items[0].id_])
+    await graph.search_outbox_retry([items[0].id_], delay=-60)
+    assert await claim(graph) == []
+
+
+async def test_search_outbox_claim_lease_expired(sqlite, graph):
+    await graph.search_outbox_add(["http://example.com/a"])
+    await claim(graph, lease=-60)
+
+    (item,) = await claim(graph)
+    assert item.attempts == 2
+
+
+async def test_search_outbox_retry(sqlite, graph):
+    await graph.search_outbox_add(["http://example.com/a"])
+    items = await claim(graph)
+
+    await graph.search_outbox_retry([items[0].id_], delay=60)
+    assert await claim(graph) == []
+
+    await graph.search_outbox_retry([items[0].id_], delay=-60)
+    (item,) = await claim(graph)
+    assert item.attempts == 2
+
+
+async def test_search_outbox_max_attempts(sqlite, graph):
+    await graph.search_outbox_add(["http://example.com/a"])
+    await claim(graph, lease=-60, max_attempts=1)
+
+    assert await claim(graph, max_attempts=1) == []
+
+
+async def test_search_outbox_rolled_back(sqlite, graph):
+    try:
+        async with graph.unit_of_work():
+            await graph.search_outbox_add(["http://example.com/a"])
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert await claim(graph) == []
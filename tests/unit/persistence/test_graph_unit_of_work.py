@@ -0,0 +1,57 @@
+import pytest
+
+from py_semantic_taxonomy.domain.constants import RelationshipVerbs
+from py_semantic_taxonomy.domain.entities import (
+    Concept,
+    ConceptNotFoundError,
+    DuplicateRelationship,
+    Relationship,
+)
+
+
+async def test_unit_of_work_commit(sqlite, cn, graph):
+    expected = Concept.from_json_ld(cn.concept_low)
+    async with graph.unit_of_work():
+        await graph.concept_create(concept=expected)
+        assert await graph.concept_get(iri=expected.id_) == expected
+
+    assert await graph.concept_get(iri=expected.id_) == expected
+
+
+async def test_unit_of_work_rollback(sqlite, cn, graph):
+    expected = Concept.from_json_ld(cn.concept_low)
+    with pytest.raises(ValueError):
+        async with graph.unit_of_work():
+            await graph.concept_create(concept=expected)
+            raise ValueError
+
+    with pytest.raises(ConceptNotFoundError):
+        await graph.concept_get(iri=expected.id_)
+
+
+async def test_unit_of_work_nested(sqlite, cn, graph):
+    expected = Concept.from_json_ld(cn.concept_low)
+    with pytest.raises(ValueError):
+        async with graph.unit_of_work():
+            async with graph.unit_of_work():
+                await graph.concept_create(concept=expected)
+            raise ValueError
+
+    with pytest.raises(ConceptNotFoundError):
+        await graph.concept_get(iri=expected.id_)
+
+
+async def test_unit_of_work_duplicate_relationship_keeps_transaction(
+    sqlite, cn, graph, relationships
+):
+    expected = Concept.from_json_ld(cn.concept_low)
+    async with graph.unit_of_work():
+        await graph.concept_create(concept=expected)
+        with pytest.raises(DuplicateRelationship):
+            await graph.relationships_create([relationships[3]])
+        await graph.relationships_create(
+            [Relationship(source="a", target="b", predicate=RelationshipVerbs.exact_match)]
+        )
+
+    assert await graph.concept_get(iri=expected.id_) == expected
+    assert await graph.relationships_get(iri="a")
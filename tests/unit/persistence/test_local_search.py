@@ -0,0 +1,167 @@
+import inspect
+
+import pytest
+
+from py_semantic_taxonomy.adapters.persistence.local_search import (
+    InvertedIndex,
+    LocalSearchEngine,
+    PrefixTrie,
+    tokenize,
+)
+from py_semantic_taxonomy.domain.entities import SearchFilter, SearchHierarchy
+from py_semantic_taxonomy.domain.ports import SearchEngine
+
+EN = "pyst-concepts-en"
+
+
+@pytest.fixture
+async def engine(entities) -> LocalSearchEngine:
+    engine = LocalSearchEngine()
+    await engine.initialize([EN, "pyst-concepts-de"])
+    await engine.create_concepts([entities[0].to_search_dict("en")], EN)
+    await engine.create_concept(entities[1].to_search_dict("en"), EN)
+    return engine
+
+
+def test_all_protocol_methods_implemented():
+    methods = {
+        name
+        for name, _ in inspect.getmembers(SearchEngine, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    assert methods.issubset(dir(LocalSearchEngine))
+
+
+def test_tokenize():
+    assert tokenize("SECÇÃO I - Böden; 0101 21") == ["seccao", "i", "boden", "0101", "21"]
+
+
+def test_prefix_trie():
+    trie = PrefixTrie()
+    for term in ("animal", "animals", "anim", "live"):
+        trie.add(term)
+    assert sorted(trie.startswith("anim")) == ["anim", "animal", "animals"]
+    assert trie.startswith("x") == []
+
+    trie.remove("animal")
+    trie.remove("missing")
+    assert sorted(trie.startswith("anim")) == ["anim", "animals"]
+    trie.remove("animals")
+    assert trie.root["a"]["n"]["i"]["m"] == {"": True}
+
+
+async def test_search(engine, entities):
+    results = await engine.search("chapter animals", EN, True, False)
+    assert [result.id_ for result in results] == [entities[1].id_, entities[0].id_]
+    assert results[0].label == "CHAPTER 1 - LIVE ANIMALS"
+    assert results[0].highlight == "<mark>CHAPTER</mark> 1 - LIVE <mark>ANIMALS</mark>"
+
+    # Notations and labels in other languages are searched too
+    results = await engine.search("animais", EN, True, False)
+    assert {result.id_ for result in results} == {entities[0].id_, entities[1].id_}
+    assert results[0].highlight is None
+
+    assert await engine.search("anim", EN, False, False) == []
+    assert await engine.search("", EN, False, False) == []
+    assert await engine.search("chapter", "pyst-concepts-de", False, False) == []
+
+
+async def test_search_prefix(engine, entities):
+    results = await engine.search("live anim", EN, False, True)
+    assert {result.id_ for result in results} == {entities[0].id_, entities[1].id_}
+    assert results[0].highlight.count("<mark>") == 2
+
+    results = await engine.search("chap", EN, False, True)
+    assert [result.id_ for result in results] == [entities[1].id_]
+
+
+async def test_search_many(engine, entities):
+    results = await engine.search_many(
+        [
+            {"query": "section", "collection": EN, "semantic": True, "prefix": False},
+            {"query": "xyz", "collection": EN, "semantic": False, "prefix": True},
+        ]
+    )
+    assert [[result.id_ for result in lst] for lst in results] == [[entities[0].id_], []]
+
+
+async def test_search_filters(entities):
+    engine = LocalSearchEngine()
+    await engine.create_collection(EN)
+    top, mid = entities[0], entities[1]
+    await engine.create_concepts(
+        [
+            mid.to_search_dict("en", SearchHierarchy(depth=1, top_concepts=[top.id_])),
+            top.to_search_dict("en", SearchHierarchy(depth=0, top_concepts=[top.id_])),
+            # Indexed before hierarchy fields were added
+            entities[5].to_search_dict("en") | {"pref_label": "live animals"},
+        ],
+        EN,
+    )
+
+    filters = SearchFilter(top_concept_iri=top.id_, max_depth=0)
+    results = await engine.search("animals", EN, False, False, filters=filters)
+    assert [result.id_ for result in results] == [top.id_]
+
+    filters = SearchFilter(concept_scheme_iri=top.schemes[0]["@id"])
+    results = await engine.search("animals", EN, False, False, filters=filters)
+    assert {result.id_ for result in results} == {top.id_, mid.id_}
+    filters = SearchFilter(concept_scheme_iri="http://example.com/missing")
+    assert await engine.search("animals", EN, False, False, filters=filters) == []
+
+    first = await engine.search("animals", EN, False, False, per_page=2)
+    second = await engine.search("animals", EN, False, False, page=2, per_page=2)
+    assert len(first) == 2
+    assert len(second) == 1
+    assert second[0].id_ not in {result.id_ for result in first}
+
+
+def test_search_depth_breaks_ties():
+    index = InvertedIndex()
+    index.add({"id": "b", "pref_label": "animals", "depth": 2})
+    index.add({"id": "c", "pref_label": "animals", "depth": 0})
+    index.add({"id": "a", "pref_label": "animals"})
+    assert [document["id"] for document, _ in index.search("animals", False)] == ["c", "b", "a"]
+
+
+async def test_update_and_delete(engine, entities):
+    document = entities[1].to_search_dict("en")
+    await engine.update_concept({"id": document["id"], "pref_label": "CHAPTER 1 - TRUCKS"}, EN)
+
+    results = await engine.search("trucks", EN, False, False)
+    assert [(result.id_, result.label) for result in results] == [
+        (entities[1].id_, "CHAPTER 1 - TRUCKS")
+    ]
+    # Old label is still an alt label
+    assert await engine.search("live", EN, False, False)
+
+    await engine.delete_concepts([document["id"], "missing"], EN)
+    assert await engine.search("trucks", EN, False, False) == []
+    assert "truck" not in engine.collections[EN].postings
+    assert engine.collections[EN].trie.startswith("tru") == []
+
+    await engine.delete_concept(entities[0].to_search_dict("en")["id"], EN)
+    assert len(engine.collections[EN]) == 0
+    assert engine.collections[EN].total_length == 0
+
+
+async def test_swap_alias(engine, entities):
+    await engine.create_collection("pyst-concepts-en-1")
+    await engine.create_concept(entities[5].to_search_dict("de"), "pyst-concepts-en-1")
+
+    assert await engine.swap_alias(EN, "pyst-concepts-en-1") is None
+    assert EN not in engine.collections
+    results = await engine.search("tiere", EN, False, False)
+    assert [result.id_ for result in results] == [entities[5].id_]
+
+    await engine.create_collection("pyst-concepts-en-2")
+    assert await engine.swap_alias(EN, "pyst-concepts-en-2") == "pyst-concepts-en-1"
+    assert await engine.search("tiere", EN, False, False) == []
+
+    # Existing aliases aren't replaced with empty collections
+    await engine.initialize([EN])
+    assert engine.aliases == {EN: "pyst-concepts-en-2"}
+
+    await engine.reset()
+    with pytest.raises(ValueError):
+        await engine.search("tiere", EN, False, False)
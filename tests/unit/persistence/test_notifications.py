@@ -0,0 +1,81 @@
+import asyncio
+
+import orjson
+import pytest
+
+from py_semantic_taxonomy.adapters.persistence import notifications
+from py_semantic_taxonomy.adapters.persistence.graph import CHANGES_CHANNEL
+from py_semantic_taxonomy.domain.entities import ChangeEvent
+
+
+class FakeConnection:
+    def __init__(self):
+        self.listeners = {}
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        self.listeners[channel] = callback
+
+    async def execute(self, query):
+        raise OSError("Connection lost")
+
+    async def close(self, timeout=None):
+        self.closed = True
+
+
+async def test_listen_for_changes(monkeypatch):
+    connections = []
+
+    async def connect(**kwargs):
+        connections.append(FakeConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(notifications.asyncpg, "connect", connect)
+    monkeypatch.setattr(notifications, "HEALTH_CHECK_INTERVAL", 0)
+
+    events = []
+    task = asyncio.create_task(notifications.listen_for_changes(events.append, retry_interval=0))
+    while len(connections) < 2:
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    event = ChangeEvent(kind="concept", iri="http://example.com/foo", operation="update")
+    connections[0].listeners[CHANGES_CHANNEL](
+        connections[0], 1, CHANGES_CHANNEL, orjson.dumps(event.to_json()).decode()
+    )
+    assert events[0] is None
+    assert events[-1] == event
+    assert connections[0].closed
+
+
+class ClosedConnection(FakeConnection):
+    async def execute(self, query):
+        # Like `asyncpg.InterfaceError`, not an `OSError` or `asyncpg.PostgresError`
+        raise RuntimeError("connection is closed")
+
+
+async def test_listen_for_changes_any_error(monkeypatch):
+    connections = []
+
+    async def connect(**kwargs):
+        if len(connections) % 2:
+            connections.append(None)
+            raise RuntimeError("cannot connect")
+        connections.append(ClosedConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(notifications.asyncpg, "connect", connect)
+    monkeypatch.setattr(notifications, "HEALTH_CHECK_INTERVAL", 0)
+
+    events = []
+    task = asyncio.create_task(notifications.listen_for_changes(events.append, retry_interval=0))
+    while len(connections) < 4:
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert events == [None, None]
+    assert connections[0].closed
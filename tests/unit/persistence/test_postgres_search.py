@@ -0,0 +1,146 @@
+import inspect
+
+import pytest
+
+from py_semantic_taxonomy import dependencies
+from py_semantic_taxonomy.adapters.persistence.postgres_search import (
+    PostgresSearchEngine,
+    text_search_config,
+    to_row,
+    tsquery_text,
+)
+from py_semantic_taxonomy.domain.entities import SearchFilter, SearchHierarchy
+from py_semantic_taxonomy.domain.ports import SearchEngine
+
+EN = "pyst-concepts-en"
+
+
+def test_all_protocol_methods_implemented():
+    methods = {
+        name
+        for name, _ in inspect.getmembers(SearchEngine, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    assert methods.issubset(dir(PostgresSearchEngine))
+
+
+def test_shares_graph_engine(monkeypatch):
+    engine = object()
+    monkeypatch.setenv("PyST_search_backend", "postgres")
+    monkeypatch.setattr(dependencies, "get_engine", lambda: engine)
+    assert dependencies.get_search_engine().engine is engine
+    assert dependencies.get_kos_graph().engine is engine
+
+
+def test_text_search_config():
+    assert text_search_config("pyst-concepts-de") == "german"
+    assert text_search_config("foo-pyst-concepts-en-20250101120000") == "english"
+    assert text_search_config("pyst-concepts-xx") == "simple"
+    assert text_search_config("other") == "simple"
+
+
+def test_tsquery_text():
+    assert tsquery_text("live animals", False) == "'live' | 'animals'"
+    assert tsquery_text("live anim", True) == "'live' | 'anim':*"
+    assert tsquery_text("it's & !(x:*)", False) == "'it' | 's' | 'x'"
+    assert tsquery_text(" - ", True) == ""
+
+
+def test_to_row(entities):
+    row = to_row(entities[0].to_search_dict("en") | {"alt_labels": ["a", "b"]})
+    assert "id" not in row
+    assert row["alt_labels"] == "a\nb"
+    assert row["notation"] == "I"
+    assert row["concept_schemes"] == [entities[0].schemes[0]["@id"]]
+
+    row = to_row(entities[0].to_search_dict("en", SearchHierarchy(depth=0, top_concepts=["a"])))
+    assert row["top_concepts"] == ["a"]
+    assert row["depth"] == 0
+
+
+@pytest.fixture
+async def engine(postgres, entities):
+    engine = PostgresSearchEngine()
+    await engine.initialize([EN, "pyst-concepts-de"])
+    await engine.create_concepts([entities[0].to_search_dict("en")], EN)
+    await engine.create_concept(entities[1].to_search_dict("en"), EN)
+    yield engine
+    await engine.engine.dispose()
+
+
+@pytest.mark.postgres
+async def test_postgres_search(engine, entities):
+    results = await engine.search("animals", EN, True, False)
+    assert {result.id_ for result in results} == {entities[0].id_, entities[1].id_}
+    assert "<mark>ANIMALS</mark>" in results[0].highlight
+
+    # Stemming, typos, and prefixes
+    assert await engine.search("animal", EN, False, False)
+    assert [r.id_ for r in await engine.search("chaptre", EN, False, False)] == [entities[1].id_]
+    assert [r.id_ for r in await engine.search("chap", EN, False, True)] == [entities[1].id_]
+
+    assert await engine.search("", EN, False, False) == []
+    assert await engine.search("chapter", "pyst-concepts-de", False, False) == []
+    results = await engine.search_many(
+        [
+            {"query": "section", "collection": EN, "semantic": True, "prefix": False},
+            {"query": "xyz", "collection": EN, "semantic": False, "prefix": True},
+        ]
+    )
+    assert [[result.id_ for result in lst] for lst in results] == [[entities[0].id_], []]
+
+
+@pytest.mark.postgres
+async def test_postgres_search_filters(engine, entities):
+    top, mid = entities[0], entities[1]
+    await engine.create_concepts(
+        [
+            top.to_search_dict("en", SearchHierarchy(depth=0, top_concepts=[top.id_])),
+            mid.to_search_dict("en", SearchHierarchy(depth=1, top_concepts=[top.id_])),
+        ],
+        EN,
+    )
+
+    filters = SearchFilter(top_concept_iri=top.id_, max_depth=0)
+    results = await engine.search("animals", EN, False, False, filters=filters)
+    assert [result.id_ for result in results] == [top.id_]
+
+    filters = SearchFilter(concept_scheme_iri=top.schemes[0]["@id"])
+    assert len(await engine.search("animals", EN, False, False, filters=filters)) == 2
+    filters = SearchFilter(concept_scheme_iri="http://example.com/missing")
+    assert await engine.search("animals", EN, False, False, filters=filters) == []
+
+    first = await engine.search("animals", EN, False, False, per_page=1)
+    second = await engine.search("animals", EN, False, False, page=2, per_page=1)
+    assert {first[0].id_, second[0].id_} == {top.id_, mid.id_}
+
+
+@pytest.mark.postgres
+async def test_postgres_search_update_delete(engine, entities):
+    document = entities[1].to_search_dict("en")
+    await engine.update_concept({"id": document["id"], "pref_label": "CHAPTER 1 - TRUCKS"}, EN)
+    results = await engine.search("trucks", EN, False, False)
+    assert [(result.id_, result.label) for result in results] == [
+        (entities[1].id_, "CHAPTER 1 - TRUCKS")
+    ]
+
+    await engine.delete_concepts([document["id"], "missing"], EN)
+    assert await engine.search("trucks", EN, False, False) == []
+
+
+@pytest.mark.postgres
+async def test_postgres_search_swap_alias(engine, entities):
+    await engine.create_collection("pyst-concepts-en-1")
+    await engine.create_concept(entities[5].to_search_dict("de"), "pyst-concepts-en-1")
+
+    assert await engine.swap_alias(EN, "pyst-concepts-en-1") is None
+    results = await engine.search("tiere", EN, False, False)
+    assert [result.id_ for result in results] == [entities[5].id_]
+
+    await engine.create_collection("pyst-concepts-en-2")
+    assert await engine.swap_alias(EN, "pyst-concepts-en-2") == "pyst-concepts-en-1"
+    assert await engine.search("tiere", EN, False, False) == []
+
+    await engine.reset()
+    with pytest.raises(ValueError):
+        await engine.search("tiere", EN, False, False)
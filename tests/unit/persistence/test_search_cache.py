@@ -0,0 +1,121 @@
+import asyncio
+import inspect
+
+import pytest
+
+from py_semantic_taxonomy.adapters.persistence.cache import CachedSearchEngine
+from py_semantic_taxonomy.domain.entities import CacheStats, SearchFilter, SearchResult
+from py_semantic_taxonomy.domain.ports import SearchEngine
+
+RESULTS = [SearchResult(id_="http://example.com/foo", label="foo", highlight="bar")]
+
+
+@pytest.fixture
+def cached(mock_search_engine) -> CachedSearchEngine:
+    mock_search_engine.search.return_value = RESULTS
+    return CachedSearchEngine(mock_search_engine, maxsize=100, ttl=60)
+
+
+def test_all_protocol_methods_implemented():
+    methods = {
+        name
+        for name, _ in inspect.getmembers(SearchEngine, inspect.isfunction)
+        if not name.startswith("_")
+    }
+    assert methods.issubset(dir(CachedSearchEngine))
+
+
+async def test_search_cached(cached):
+    assert await cached.search("foo", "pyst-concepts-en", True, False) == RESULTS
+    assert await cached.search("foo", "pyst-concepts-en", True, False) == RESULTS
+    cached.engine.search.assert_called_once_with(
+        query="foo",
+        collection="pyst-concepts-en",
+        semantic=True,
+        prefix=False,
+        filters=None,
+        page=1,
+        per_page=50,
+    )
+
+    await cached.search("foo", "pyst-concepts-en", False, True)
+    await cached.search("foo", "pyst-concepts-de", True, False)
+    assert cached.engine.search.await_count == 3
+    assert cached.cache_stats() == CacheStats(hits=1, misses=3, size=3, maxsize=100)
+    assert cached.cache_stats().hit_ratio == 0.25
+
+    # Filters and pages are part of the key
+    filters = SearchFilter(concept_scheme_iri="http://example.com/scheme")
+    await cached.search("foo", "pyst-concepts-en", True, False, filters=filters)
+    await cached.search("foo", "pyst-concepts-en", True, False, filters=filters)
+    await cached.search("foo", "pyst-concepts-en", True, False, page=2)
+    assert cached.engine.search.await_count == 5
+
+
+async def test_search_cached_copies(cached):
+    await cached.search("foo", "pyst-concepts-en", True, False)
+    results = await cached.search("foo", "pyst-concepts-en", True, False)
+    results[0].label = "changed"
+    assert (await cached.search("foo", "pyst-concepts-en", True, False)) == RESULTS
+
+
+async def test_write_invalidates_collection(cached):
+    await cached.search("foo", "pyst-concepts-en", True, False)
+    await cached.search("foo", "pyst-concepts-de", True, False)
+
+    await cached.update_concept({"id": "1"}, "pyst-concepts-en")
+    await cached.search("foo", "pyst-concepts-en", True, False)
+    await cached.search("foo", "pyst-concepts-de", True, False)
+    assert cached.engine.search.await_count == 3
+
+
+async def test_failed_write_invalidates_collection(cached):
+    cached.engine.delete_concepts.side_effect = ValueError
+    await cached.search("foo", "pyst-concepts-en", True, False)
+
+    with pytest.raises(ValueError):
+        await cached.delete_concepts(["1"], "pyst-concepts-en")
+    await cached.search("foo", "pyst-concepts-en", True, False)
+    assert cached.engine.search.await_count == 2
+
+
+async def test_swap_alias_invalidates_all(cached):
+    await cached.search("foo", "pyst-concepts-en", True, False)
+
+    await cached.swap_alias("pyst-concepts-en", "pyst-concepts-en-new")
+    assert len(cached.cache) == 0
+    await cached.search("foo", "pyst-concepts-en", True, False)
+    assert cached.engine.search.await_count == 2
+
+
+async def test_search_during_write_not_stored(cached):
+    started = asyncio.Event()
+
+    async def slow_search(**kwargs):
+        started.set()
+        await asyncio.sleep(0.01)
+        return RESULTS
+
+    cached.engine.search.side_effect = slow_search
+    task = asyncio.create_task(cached.search("foo", "pyst-concepts-en", True, False))
+    await started.wait()
+    await cached.create_concept({"id": "1"}, "pyst-concepts-en")
+    await task
+
+    await cached.search("foo", "pyst-concepts-en", True, False)
+    assert cached.engine.search.await_count == 2
+
+
+async def test_search_many_cached(cached):
+    cached.engine.search_many.return_value = [RESULTS, []]
+    queries = [
+        {"query": q, "collection": "pyst-concepts-en", "semantic": True, "prefix": False}
+        for q in ("foo", "bar", "baz")
+    ]
+
+    await cached.search("foo", "pyst-concepts-en", True, False)
+    assert await cached.search_many(queries) == [RESULTS, RESULTS, []]
+    cached.engine.search_many.assert_called_once_with(queries[1:])
+
+    assert await cached.search("baz", "pyst-concepts-en", True, False) == []
+    assert cached.engine.search.await_count == 1
@@ -1,6 +1,51 @@
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+from py_semantic_taxonomy.adapters.persistence.search_engine import (
+    TypesenseSearchEngine,
+    filter_by,
+    to_document,
+)
 from py_semantic_taxonomy.dependencies import get_search_engine
+from py_semantic_taxonomy.domain.entities import SearchFilter, SearchHierarchy
+
+
+def test_filter_by():
+    assert filter_by(SearchFilter()) == ""
+    assert filter_by(SearchFilter(max_depth=0)) == "depth:<=0"
+    assert (
+        filter_by(SearchFilter(concept_scheme_iri="http://example.com/a&b", top_concept_iri="t"))
+        == "concept_schemes:=`http://example.com/a&b` && top_concepts:=`t`"
+    )
+    assert filter_by(SearchFilter(top_concept_iri="http://example.com/a`b")) == (
+        "top_concepts:=`http://example.com/a%60b`"
+    )
+
+
+def test_to_document():
+    document = {"id": "1", "concept_schemes": ["http://example.com/`s`"], "top_concepts": []}
+    assert to_document(document) == {
+        "id": "1",
+        "concept_schemes": ["http://example.com/%60s%60"],
+        "top_concepts": [],
+    }
+    assert to_document({"id": "1"}) == {"id": "1"}
+
+
+async def test_delete_concepts(monkeypatch):
+    monkeypatch.setattr(
+        "py_semantic_taxonomy.adapters.persistence.search_engine.DELETE_BATCH_SIZE", 2
+    )
+    engine = TypesenseSearchEngine("http://localhost:8108", "key", "model")
+    engine.client = MagicMock()
+    delete = engine.client.collections["pyst-concepts-en"].documents.delete = AsyncMock()
+
+    await engine.delete_concepts(["a-b", "c_d", "e"], "pyst-concepts-en")
+    assert [call.args[0] for call in delete.call_args_list] == [
+        {"filter_by": "id:[`a-b`,`c_d`]"},
+        {"filter_by": "id:[`e`]"},
+    ]
 
 
 @pytest.mark.typesense
@@ -58,3 +103,48 @@ async def test_search_engine_collection_prefix(typesense_with_prefix, entities):
     engine = get_search_engine()
     collections = await engine._collection_labels()
     assert collections == ["prefixtest-pyst-concepts-de", "prefixtest-pyst-concepts-en"]
+
+
+@pytest.mark.typesense
+async def test_search_engine_swap_alias(typesense, entities):
+    engine = get_search_engine()
+    await engine.create_collection("pyst-concepts-en-new")
+    await engine.create_concepts([entities[1].to_search_dict("en")], "pyst-concepts-en-new")
+
+    assert await engine.swap_alias("pyst-concepts-en", "pyst-concepts-en-new") is None
+    assert await engine._alias_labels() == ["pyst-concepts-en"]
+    assert await engine._collection_labels() == ["pyst-concepts-de", "pyst-concepts-en-new"]
+
+    results = await engine.search("anim", "pyst-concepts-en", False, True)
+    assert results[0].id_ == entities[1].id_
+
+    await engine.create_collection("pyst-concepts-en-newer")
+    previous = await engine.swap_alias("pyst-concepts-en", "pyst-concepts-en-newer")
+    assert previous == "pyst-concepts-en-new"
+    await engine.delete_collection(previous)
+    assert not await engine.search("anim", "pyst-concepts-en", False, True)
+
+    await engine.initialize(["pyst-concepts-de", "pyst-concepts-en"])
+    assert await engine._collection_labels() == ["pyst-concepts-de", "pyst-concepts-en-newer"]
+
+
+@pytest.mark.typesense
+async def test_search_engine_filters(typesense, entities):
+    engine = get_search_engine()
+    top = entities[0].to_search_dict("en", SearchHierarchy(depth=0, top_concepts=[entities[0].id_]))
+    mid = entities[1].to_search_dict("en", SearchHierarchy(depth=1, top_concepts=[entities[0].id_]))
+    await engine.create_concepts([top, mid], "pyst-concepts-en")
+
+    # Equal matches are ranked higher up the hierarchy first
+    results = await engine.search("animals", "pyst-concepts-en", False, False)
+    assert [result.id_ for result in results] == [entities[0].id_, entities[1].id_]
+
+    filters = SearchFilter(top_concept_iri=entities[0].id_, max_depth=0)
+    results = await engine.search("animals", "pyst-concepts-en", False, False, filters=filters)
+    assert [result.id_ for result in results] == [entities[0].id_]
+
+    filters = SearchFilter(concept_scheme_iri="http://example.com/missing")
+    assert not await engine.search("animals", "pyst-concepts-en", False, False, filters=filters)
+
+    results = await engine.search("animals", "pyst-concepts-en", False, False, page=2, per_page=1)
+    assert [result.id_ for result in results] == [entities[1].id_]
@@ -36,6 +36,8 @@ async def test_association_get_all_all_filters(cn, anonymous_client, monkeypatch
         source_concept_iri="http://example.com/b",
         target_concept_iri="http://example.com/c",
         kind=AssociationKind.conditional,
+        limit=None,
+        after=None,
     )
 
 
@@ -56,6 +58,8 @@ async def test_association_get_all_no_filters(cn, anonymous_client, monkeypatch)
         source_concept_iri=None,
         target_concept_iri=None,
         kind=None,
+        limit=None,
+        after=None,
     )
 
 
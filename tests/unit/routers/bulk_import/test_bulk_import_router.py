@@ -0,0 +1,96 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from py_semantic_taxonomy.adapters.routers.bulk_import import (
+    ImportValidationError,
+    load_objects,
+    parse_objects,
+)
+from py_semantic_taxonomy.application.graph_service import GraphService
+from py_semantic_taxonomy.domain.entities import DuplicateIRI, ImportResult
+from py_semantic_taxonomy.domain.url_utils import get_full_api_path
+
+
+def test_parse_objects_turtle(fixtures_dir, relationships):
+    concept_schemes, concepts, found = parse_objects(
+        load_objects((fixtures_dir / "cn.ttl").read_bytes(), "turtle")
+    )
+    assert len(concept_schemes) == 2
+    assert len(concepts) == 5
+    assert sorted(found, key=lambda x: (x.source, x.target)) == relationships
+
+
+def test_parse_objects_validation_errors(cn):
+    concept = cn.concept_low.copy()
+    del concept["http://www.w3.org/2004/02/skos/core#prefLabel"]
+    with pytest.raises(ImportValidationError) as exc:
+        parse_objects([cn.scheme, concept])
+    assert [error["@id"] for error in exc.value.errors] == [concept["@id"]]
+
+
+def test_load_objects_invalid():
+    with pytest.raises(ImportValidationError):
+        load_objects(b"not json")
+    with pytest.raises(ValueError):
+        load_objects(b"[]", format="xml")
+
+
+async def test_bulk_import(cn, client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService,
+        "bulk_import",
+        AsyncMock(return_value=ImportResult(concept_schemes=1, concepts=1, relationships=0)),
+    )
+
+    response = await client.post(
+        get_full_api_path("bulk_import"),
+        params={"batch_size": 10},
+        json=[cn.scheme, cn.concept_low, cn.correspondence],
+    )
+    assert response.status_code == 200
+    assert response.json() == {"concept_schemes": 1, "concepts": 1, "relationships": 0}
+
+    kwargs = GraphService.bulk_import.call_args[1]
+    assert [obj.id_ for obj in kwargs["concept_schemes"]] == [cn.scheme["@id"]]
+    assert [obj.id_ for obj in kwargs["concepts"]] == [cn.concept_low["@id"]]
+    assert kwargs["batch_size"] == 10
+
+
+async def test_bulk_import_turtle(fixtures_dir, client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService,
+        "bulk_import",
+        AsyncMock(return_value=ImportResult(concept_schemes=2, concepts=5, relationships=5)),
+    )
+
+    response = await client.post(
+        get_full_api_path("bulk_import"),
+        content=(fixtures_dir / "cn.ttl").read_bytes(),
+        headers={"Content-Type": "text/turtle"},
+    )
+    assert response.status_code == 200
+    assert len(GraphService.bulk_import.call_args[1]["concepts"]) == 5
+
+
+async def test_bulk_import_validation_error(cn, client, monkeypatch):
+    monkeypatch.setattr(GraphService, "bulk_import", AsyncMock())
+    concept = cn.concept_low.copy()
+    del concept["http://www.w3.org/2004/02/skos/core#prefLabel"]
+
+    response = await client.post(get_full_api_path("bulk_import"), json=[concept])
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["@id"] == concept["@id"]
+    GraphService.bulk_import.assert_not_called()
+
+
+async def test_bulk_import_duplicate(cn, client, monkeypatch):
+    monkeypatch.setattr(GraphService, "bulk_import", AsyncMock(side_effect=DuplicateIRI("foo")))
+
+    response = await client.post(get_full_api_path("bulk_import"), json=[cn.concept_low])
+    assert response.status_code == 409
+
+
+async def test_bulk_import_unauthorized(cn, anonymous_client):
+    response = await anonymous_client.post(get_full_api_path("bulk_import"), json=[cn.concept_low])
+    assert response.status_code == 400
@@ -0,0 +1,59 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+
+from py_semantic_taxonomy.application.graph_service import GraphService
+from py_semantic_taxonomy.domain.entities import Change
+from py_semantic_taxonomy.domain.url_utils import get_full_api_path
+
+CHANGES = [
+    Change(
+        sequence=sequence,
+        kind="concept",
+        iri="http://example.com/a",
+        operation=operation,
+        data={},
+        created=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+    for sequence, operation in ((4, "create"), (5, "update"))
+]
+
+
+async def test_changes_get(anonymous_client, monkeypatch):
+    monkeypatch.setattr(GraphService, "changes_get", AsyncMock(return_value=CHANGES))
+
+    response = await anonymous_client.get(
+        get_full_api_path("changes"), params={"since": 3, "limit": 2}
+    )
+    assert response.status_code == 200
+    assert [change["sequence"] for change in response.json()] == [4, 5]
+    assert response.json()[0]["created"] == "2025-01-01T00:00:00Z"
+    assert response.headers["link"] == (
+        '<http://test.ninja/api/v1/changes/?limit=2&since=5>; rel="next"'
+    )
+
+    GraphService.changes_get.assert_called_with(since=3, limit=2)
+
+
+async def test_changes_get_invalid_since(anonymous_client):
+    response = await anonymous_client.get(get_full_api_path("changes"), params={"since": -1})
+    assert response.status_code == 422
+
+
+async def test_changes_get_ndjson(anonymous_client, monkeypatch):
+    async def stream(**kwargs):
+        for change in CHANGES:
+            yield change
+
+    monkeypatch.setattr(GraphService, "changes_stream", Mock(side_effect=stream))
+
+    response = await anonymous_client.get(
+        get_full_api_path("changes"), headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [line["operation"] for line in lines] == ["create", "update"]
+
+    GraphService.changes_stream.assert_called_with(since=0, limit=None)
@@ -1,4 +1,7 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
+
+import orjson
+import pytest
 
 from py_semantic_taxonomy.application.graph_service import GraphService
 from py_semantic_taxonomy.application.search_service import SearchService
@@ -10,9 +13,13 @@ from py_semantic_taxonomy.domain.entities import (
     DuplicateIRI,
     DuplicateRelationship,
     HierarchyConflict,
+    HierarchyNode,
+    ReindexResult,
     Relationship,
     RelationshipsInCurrentConceptScheme,
+    SearchFilter,
     SearchNotConfigured,
+    SearchQuery,
     SearchResult,
     UnknownLanguage,
 )
@@ -60,7 +67,69 @@ async def test_concept_all_get(cn, anonymous_client, monkeypatch):
 
     GraphService.concept_get_all.assert_called_once()
     GraphService.concept_get_all.assert_called_with(
-        concept_scheme_iri=cn.scheme["@id"], top_concepts_only=True
+        concept_scheme_iri=cn.scheme["@id"],
+        top_concepts_only=True,
+        limit=None,
+        after=None,
+    )
+
+
+async def test_concept_all_get_paginated(cn, anonymous_client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService,
+        "concept_get_all",
+        AsyncMock(return_value=[Concept.from_json_ld(cn.concept_top)]),
+    )
+
+    response = await anonymous_client.get(
+        get_full_api_path("concept_all"), params={"limit": 1, "after": "http://example.com/a"}
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert response.headers["link"] == (
+        "<http://test.ninja/api/v1/concepts/?limit=1&after="
+        + 'http%3A%2F%2Fdata.europa.eu%2Fxsp%2Fcn2024%2F010011000090>; rel="next"'
+    )
+
+    GraphService.concept_get_all.assert_called_with(
+        concept_scheme_iri=None, top_concepts_only=False, limit=1, after="http://example.com/a"
+    )
+
+
+async def test_concept_all_get_last_page(cn, anonymous_client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService,
+        "concept_get_all",
+        AsyncMock(return_value=[Concept.from_json_ld(cn.concept_top)]),
+    )
+
+    response = await anonymous_client.get(get_full_api_path("concept_all"), params={"limit": 2})
+    assert response.status_code == 200
+    assert "link" not in response.headers
+
+
+async def test_concept_all_get_invalid_limit(anonymous_client):
+    response = await anonymous_client.get(get_full_api_path("concept_all"), params={"limit": 0})
+    assert response.status_code == 422
+
+
+async def test_concept_all_get_ndjson(cn, anonymous_client, monkeypatch):
+    async def stream(**kwargs):
+        for obj in (cn.concept_top, cn.concept_mid):
+            yield Concept.from_json_ld(obj)
+
+    monkeypatch.setattr(GraphService, "concept_stream_all", Mock(side_effect=stream))
+
+    response = await anonymous_client.get(
+        get_full_api_path("concept_all"), headers={"Accept": "application/x-ndjson"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [orjson.loads(line) for line in response.text.splitlines()]
+    assert [line["@id"] for line in lines] == [cn.concept_top["@id"], cn.concept_mid["@id"]]
+
+    GraphService.concept_stream_all.assert_called_with(
+        concept_scheme_iri=None, top_concepts_only=False, limit=None, after=None
     )
 
 
@@ -297,6 +366,62 @@ async def test_concept_search(anonymous_client, monkeypatch):
     assert result == [{"id_": "http://example.com/foo", "label": "foo", "highlight": "bar"}]
 
 
+async def test_concept_search_filters(anonymous_client, monkeypatch):
+    monkeypatch.setattr(SearchService, "search", AsyncMock(return_value=[]))
+
+    response = await anonymous_client.get(
+        get_full_api_path("search"), params={"query": "foo", "language": "en"}
+    )
+    assert response.status_code == 200
+    SearchService.search.assert_called_with(
+        query="foo", language="en", semantic=True, filters=None, page=1, per_page=50
+    )
+
+    response = await anonymous_client.get(
+        get_full_api_path("search"),
+        params={
+            "query": "foo",
+            "language": "en",
+            "concept_scheme_iri": "http://example.com/cs",
+            "max_depth": 0,
+            "page": 2,
+            "per_page": 10,
+        },
+    )
+    assert response.status_code == 200
+    SearchService.search.assert_called_with(
+        query="foo",
+        language="en",
+        semantic=True,
+        filters=SearchFilter(concept_scheme_iri="http://example.com/cs", max_depth=0),
+        page=2,
+        per_page=10,
+    )
+
+    for params in ({"page": 0}, {"per_page": 251}, {"max_depth": -1}):
+        response = await anonymous_client.get(
+            get_full_api_path("search"), params={"query": "foo", "language": "en"} | params
+        )
+        assert response.status_code == 422
+
+
+async def test_concept_suggest_filters(anonymous_client, monkeypatch):
+    monkeypatch.setattr(SearchService, "suggest", AsyncMock(return_value=[]))
+
+    response = await anonymous_client.get(
+        get_full_api_path("suggest"),
+        params={"query": "foo", "language": "en", "top_concept_iri": "http://example.com/top"},
+    )
+    assert response.status_code == 200
+    SearchService.suggest.assert_called_once_with(
+        query="foo",
+        language="en",
+        filters=SearchFilter(top_concept_iri="http://example.com/top"),
+        page=1,
+        per_page=50,
+    )
+
+
 async def test_concept_search_not_configured(anonymous_client, monkeypatch):
     monkeypatch.setattr(
         SearchService,
@@ -368,3 +493,154 @@ async def test_concept_suggest_unknown_language(anonymous_client, monkeypatch):
     )
     assert response.status_code == 422
     assert response.json() == {"detail": "Search engine not configured for given language"}
+
+
+async def test_concept_descendants(cn, anonymous_client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService,
+        "concept_descendants",
+        AsyncMock(return_value=[Concept.from_json_ld(cn.concept_mid)]),
+    )
+
+    response = await anonymous_client.get(
+        get_full_api_path("concept_descendants"),
+        params={"iri": cn.concept_top["@id"], "concept_scheme_iri": cn.scheme["@id"]},
+    )
+    assert response.status_code == 200
+    assert [obj["@id"] for obj in response.json()] == [cn.concept_mid["@id"]]
+    GraphService.concept_descendants.assert_called_once_with(
+        concept_iri=cn.concept_top["@id"], concept_scheme_iri=cn.scheme["@id"], max_depth=None
+    )
+
+
+async def test_concept_subtree(cn, relationships, anonymous_client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService, "relationships_subtree", AsyncMock(return_value=[relationships[3]])
+    )
+
+    response = await anonymous_client.get(
+        get_full_api_path("concept_subtree"), params={"iri": cn.concept_top["@id"]}
+    )
+    assert response.status_code == 200
+    assert response.json() == [relationships[3].to_json_ld()]
+    GraphService.relationships_subtree.assert_called_once_with(concept_iri=cn.concept_top["@id"])
+
+
+async def test_concept_tree(cn, anonymous_client, monkeypatch):
+    node = HierarchyNode(
+        id_=cn.concept_mid["@id"], depth=1, parent=cn.concept_top["@id"], pref_label="foo"
+    )
+    monkeypatch.setattr(GraphService, "concept_tree", AsyncMock(return_value=[node]))
+
+    response = await anonymous_client.get(
+        get_full_api_path("concept_tree"),
+        params={"iri": cn.concept_top["@id"], "max_depth": 2, "language": "en"},
+    )
+    assert response.status_code == 200
+    assert response.json() == [node.to_json()]
+    GraphService.concept_tree.assert_called_once_with(
+        concept_iri=cn.concept_top["@id"], concept_scheme_iri=None, max_depth=2, language="en"
+    )
+
+
+async def test_concept_tree_invalid_max_depth(cn, anonymous_client):
+    response = await anonymous_client.get(
+        get_full_api_path("concept_tree"), params={"iri": cn.concept_top["@id"], "max_depth": 0}
+    )
+    assert response.status_code == 422
+
+
+async def test_search_reindex(client, monkeypatch):
+    result = ReindexResult(concepts=3, seconds=1.5, collections=["pyst-concepts-en-1"])
+    monkeypatch.setattr(GraphService, "search_reindex", AsyncMock(return_value=result))
+
+    response = await client.post(get_full_api_path("search_reindex"), params={"concurrency": 2})
+    assert response.status_code == 200
+    assert response.json() == result.to_json()
+    GraphService.search_reindex.assert_called_once_with(batch_size=None, concurrency=2)
+
+
+async def test_search_reindex_unauthorized(anonymous_client):
+    response = await anonymous_client.post(get_full_api_path("search_reindex"))
+    assert response.status_code == 400
+
+
+async def test_search_reindex_not_configured(client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService, "search_reindex", AsyncMock(side_effect=SearchNotConfigured())
+    )
+
+    response = await client.post(get_full_api_path("search_reindex"))
+    assert response.status_code == 503
+
+
+async def test_concept_search_batch(anonymous_client, monkeypatch):
+    results = [
+        [SearchResult(id_="http://example.com/foo", label="foo", highlight="bar")],
+        [],
+    ]
+    monkeypatch.setattr(SearchService, "search_many", AsyncMock(return_value=results))
+
+    response = await anonymous_client.post(
+        get_full_api_path("search_batch"),
+        json=[
+            {"query": "foo", "language": "en"},
+            {"query": "ba", "language": "de", "semantic": False, "prefix": True},
+            {
+                "query": "bar",
+                "language": "en",
+                "filters": {"concept_scheme_iri": "http://example.com/cs", "max_depth": 1},
+                "page": 2,
+                "per_page": 10,
+            },
+        ],
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        [{"id_": "http://example.com/foo", "label": "foo", "highlight": "bar"}],
+        [],
+    ]
+    SearchService.search_many.assert_called_once_with(
+        [
+            SearchQuery(query="foo", language="en"),
+            SearchQuery(query="ba", language="de", semantic=False, prefix=True),
+            SearchQuery(
+                query="bar",
+                language="en",
+                filters=SearchFilter(concept_scheme_iri="http://example.com/cs", max_depth=1),
+                page=2,
+                per_page=10,
+            ),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        {"page": 0},
+        {"per_page": 251},
+        {"filters": {"max_depth": -1}},
+    ],
+)
+async def test_concept_search_batch_invalid_options(anonymous_client, query):
+    response = await anonymous_client.post(
+        get_full_api_path("search_batch"), json=[{"query": "foo", "language": "en"} | query]
+    )
+    assert response.status_code == 422
+
+
+async def test_concept_search_batch_too_many(anonymous_client):
+    response = await anonymous_client.post(
+        get_full_api_path("search_batch"), json=[{"query": "foo", "language": "en"}] * 1001
+    )
+    assert response.status_code == 422
+
+
+async def test_concept_search_batch_unknown_language(anonymous_client, monkeypatch):
+    monkeypatch.setattr(SearchService, "search_many", AsyncMock(side_effect=UnknownLanguage()))
+
+    response = await anonymous_client.post(
+        get_full_api_path("search_batch"), json=[{"query": "foo", "language": "xx"}]
+    )
+    assert response.status_code == 422
@@ -240,3 +240,27 @@ async def test_relationship_delete_unauthorized(anonymous_client):
         content=orjson.dumps([]),
     )
     assert response.status_code == 400
+
+
+async def test_relationship_delete_for_concept_scheme(cn, client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService, "relationships_delete_for_concept_scheme", AsyncMock(return_value=3)
+    )
+
+    response = await client.delete(
+        get_full_api_path("relationship_concept_scheme"),
+        params={"concept_scheme_iri": cn.scheme["@id"], "predicate": RelationshipVerbs.broader},
+    )
+    assert response.status_code == 200
+    assert response.json() == {"detail": "Relationships (possibly) deleted", "count": 3}
+    GraphService.relationships_delete_for_concept_scheme.assert_called_once_with(
+        concept_scheme_iri=cn.scheme["@id"], predicate=RelationshipVerbs.broader
+    )
+
+
+async def test_relationship_delete_for_concept_scheme_unauthorized(cn, anonymous_client):
+    response = await anonymous_client.delete(
+        get_full_api_path("relationship_concept_scheme"),
+        params={"concept_scheme_iri": cn.scheme["@id"]},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+from py_semantic_taxonomy import __version__ as version
+from py_semantic_taxonomy.application.graph_service import GraphService
+from py_semantic_taxonomy.application.search_service import SearchService
+from py_semantic_taxonomy.domain.entities import CacheStats
+from py_semantic_taxonomy.domain.url_utils import get_full_api_path
+
+
+async def test_status_without_cache(anonymous_client, monkeypatch):
+    monkeypatch.setattr(GraphService, "cache_stats", Mock(return_value=None))
+
+    response = await anonymous_client.get(get_full_api_path("status"))
+    assert response.status_code == 200
+    assert response.json()["version"] == version
+    assert "cache" not in response.json()
+
+
+async def test_status_with_cache(anonymous_client, monkeypatch):
+    stats = CacheStats(hits=3, misses=2, size=2, maxsize=100)
+    monkeypatch.setattr(GraphService, "cache_stats", Mock(return_value=stats))
+
+    response = await anonymous_client.get(get_full_api_path("status"))
+    assert response.status_code == 200
+    assert response.json()["cache"] == stats.to_json()
+
+
+async def test_status_with_search_cache(anonymous_client, monkeypatch):
+    stats = CacheStats(hits=3, misses=1, size=1, maxsize=100)
+    monkeypatch.setattr(GraphService, "cache_stats", Mock(return_value=None))
+    monkeypatch.setattr(SearchService, "cache_stats", Mock(return_value=stats))
+
+    response = await anonymous_client.get(get_full_api_path("status"))
+    assert response.status_code == 200
+    assert response.json()["search_cache"]["hit_ratio"] == 0.75
+    assert "cache" not in response.json()
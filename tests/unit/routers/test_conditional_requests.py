@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock
+
+from py_semantic_taxonomy.adapters.routers.conditional import etag_for, etag_matches
+from py_semantic_taxonomy.application.graph_service import GraphService
+from py_semantic_taxonomy.domain.entities import Concept, ConceptNotFoundError
+from py_semantic_taxonomy.domain.url_utils import get_full_api_path
+
+
+def test_etag_matches():
+    etag = etag_for(b"foo")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag_matches(etag, etag)
+    assert etag_matches(etag, f'"bar", W/{etag}')
+    assert etag_matches(etag, "*")
+    assert not etag_matches(etag, "")
+    assert not etag_matches(etag, etag_for(b"bar"))
+
+
+async def test_concept_get_etag(cn, anonymous_client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService, "concept_get", AsyncMock(return_value=Concept.from_json_ld(cn.concept_top))
+    )
+    url = get_full_api_path("concept", iri=cn.concept_top["@id"])
+
+    response = await anonymous_client.get(url)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag == etag_for(response.content)
+
+    response = await anonymous_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert not response.content
+
+    response = await anonymous_client.get(url, headers={"If-None-Match": '"outdated"'})
+    assert response.status_code == 200
+    assert response.json()
+
+
+async def test_concept_get_etag_changes_with_content(cn, anonymous_client, monkeypatch):
+    url = get_full_api_path("concept", iri=cn.concept_top["@id"])
+    monkeypatch.setattr(
+        GraphService, "concept_get", AsyncMock(return_value=Concept.from_json_ld(cn.concept_top))
+    )
+    first = (await anonymous_client.get(url)).headers["etag"]
+
+    changed = Concept.from_json_ld(cn.concept_top)
+    changed.pref_labels = [{"@value": "foo", "@language": "en"}]
+    monkeypatch.setattr(GraphService, "concept_get", AsyncMock(return_value=changed))
+    response = await anonymous_client.get(url, headers={"If-None-Match": first})
+    assert response.status_code == 200
+    assert response.headers["etag"] != first
+
+
+async def test_listing_etag(cn, anonymous_client, monkeypatch):
+    monkeypatch.setattr(
+        GraphService,
+        "concept_get_all",
+        AsyncMock(return_value=[Concept.from_json_ld(cn.concept_top)]),
+    )
+    url = get_full_api_path("concept_all")
+
+    etag = (await anonymous_client.get(url, params={"limit": 1})).headers["etag"]
+    response = await anonymous_client.get(url, params={"limit": 1}, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert 'rel="next"' in response.headers["link"]
+
+
+async def test_no_etag_for_errors(cn, anonymous_client, monkeypatch):
+    monkeypatch.setattr(GraphService, "concept_get", AsyncMock(side_effect=ConceptNotFoundError()))
+
+    response = await anonymous_client.get(get_full_api_path("concept", iri=cn.concept_top["@id"]))
+    assert response.status_code == 404
+    assert "etag" not in response.headers
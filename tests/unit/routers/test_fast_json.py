@@ -0,0 +1,92 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+import py_semantic_taxonomy.adapters.routers.response_dto as response
+from py_semantic_taxonomy.adapters.routers.fast_json import optional_fields, to_response_dict
+from py_semantic_taxonomy.application.graph_service import GraphService
+from py_semantic_taxonomy.domain.constants import SKOS
+from py_semantic_taxonomy.domain.entities import (
+    Association,
+    Concept,
+    ConceptScheme,
+    Correspondence,
+)
+from py_semantic_taxonomy.domain.url_utils import get_full_api_path
+
+
+def test_to_response_dict(cn):
+    for obj, model in (
+        (Concept.from_json_ld(cn.concept_mid), response.Concept),
+        (ConceptScheme.from_json_ld(cn.scheme), response.ConceptScheme),
+        (Correspondence.from_json_ld(cn.correspondence), response.Correspondence),
+        (Association.from_json_ld(cn.association_top), response.Association),
+    ):
+        expected = model(**obj.to_json_ld()).model_dump(
+            mode="json", by_alias=True, exclude_unset=False
+        )
+        assert to_response_dict(obj, model) == expected
+    assert f"{SKOS}definition" in optional_fields(response.Concept)
+
+
+@pytest.mark.parametrize(
+    "method,value,url",
+    [
+        ("concept_get", "concept_top", get_full_api_path("concept", iri="foo")),
+        ("concept_get_all", ["concept_top", "concept_mid"], get_full_api_path("concept_all")),
+        (
+            "concept_descendants",
+            ["concept_mid"],
+            get_full_api_path("concept_descendants") + "?iri=foo",
+        ),
+        ("concept_scheme_get_all", ["scheme"], get_full_api_path("concept_scheme_all")),
+        ("correspondence_get", "correspondence", get_full_api_path("correspondence", iri="foo")),
+        ("association_get_all", ["association_top"], get_full_api_path("association_all")),
+    ],
+)
+async def test_fast_json_same_response(cn, anonymous_client, monkeypatch, method, value, url):
+    classes = {
+        "concept": Concept,
+        "scheme": ConceptScheme,
+        "correspondence": Correspondence,
+        "association": Association,
+    }
+
+    def load(name: str):
+        cls = next(cls for prefix, cls in classes.items() if name.startswith(prefix))
+        return cls.from_json_ld(getattr(cn, name))
+
+    result = [load(name) for name in value] if isinstance(value, list) else load(value)
+    monkeypatch.setattr(GraphService, method, AsyncMock(return_value=result))
+
+    expected = await anonymous_client.get(url)
+    monkeypatch.setenv("PyST_fast_json", "true")
+    fast = await anonymous_client.get(url)
+    assert fast.status_code == expected.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == expected.json()
+
+
+async def test_fast_json_relationships(relationships, anonymous_client, monkeypatch):
+    monkeypatch.setattr(GraphService, "relationships_get", AsyncMock(return_value=relationships))
+    url = get_full_api_path("relationship", iri="foo")
+
+    expected = await anonymous_client.get(url)
+    monkeypatch.setenv("PyST_fast_json", "true")
+    fast = await anonymous_client.get(url)
+    assert fast.json() == expected.json()
+
+
+async def test_fast_json_pagination_headers(cn, anonymous_client, monkeypatch):
+    monkeypatch.setenv("PyST_fast_json", "true")
+    monkeypatch.setattr(
+        GraphService,
+        "concept_get_all",
+        AsyncMock(return_value=[Concept.from_json_ld(cn.concept_top)]),
+    )
+
+    response = await anonymous_client.get(get_full_api_path("concept_all"), params={"limit": 1})
+    assert response.status_code == 200
+    assert response.headers["link"].endswith('>; rel="next"')
+    assert response.headers["etag"]
+    assert len(response.json()) == 1